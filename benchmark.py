@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from main import get_ball_prototypes
+from src.benchmark.benchmark_report import BenchmarkReport
+from src.benchmark.benchmark_runner import BenchmarkRunner
+from src.benchmark.scenario import SCENARIOS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark physics and rendering, and compare against a baseline.")
+    parser.add_argument("--output", type=Path, default=None, help="write the report to this JSON file")
+    parser.add_argument("--baseline", type=Path, default=None, help="compare against this earlier report")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="slowdown that counts as a regression")
+    parser.add_argument("--repeats", type=int, default=3, help="measurements per metric; the best is kept")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=[scenario.name for scenario in SCENARIOS],
+        default=None,
+        metavar="NAME",
+        help="only run these scenarios",
+    )
+    args = parser.parse_args()
+
+    # Render through the real display code without opening a window
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    runner = BenchmarkRunner(get_ball_prototypes, repeats=args.repeats)
+    report = BenchmarkReport()
+    for scenario in SCENARIOS:
+        if args.scenarios and scenario.name not in args.scenarios:
+            continue
+        print(f"Running {scenario.name}...", flush=True)
+        try:
+            report.results.append(runner.run(scenario))
+        except FileNotFoundError as e:
+            print(f"Skipped {scenario.name}: {e}")
+
+    print(report.table())
+    if args.output:
+        report.save(args.output)
+
+    if args.baseline:
+        comparison, regressed = report.compare(BenchmarkReport.load(args.baseline), args.tolerance)
+        print(comparison)
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
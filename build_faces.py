@@ -0,0 +1,33 @@
+import argparse
+import dataclasses
+from pathlib import Path
+
+from main import get_ball_prototypes
+from src.configuration.configuration import Configuration
+from src.faces.face_bundle import FaceBundle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the processed face images into a bundle for fast start-up.")
+    parser.add_argument("--output", type=Path, default=FaceBundle.DEFAULT_PATH, help="bundle file to write")
+    parser.add_argument(
+        "--ball-radius",
+        type=int,
+        nargs="+",
+        default=[Configuration().ball_radius, Configuration.large_arena().ball_radius],
+        help="ball radii to prepare faces for",
+    )
+    args = parser.parse_args()
+
+    face_configurations = [
+        prototype.faces
+        for ball_radius in args.ball_radius
+        for prototype in get_ball_prototypes(dataclasses.replace(Configuration(), ball_radius=ball_radius))
+        if prototype.faces
+    ]
+    count = FaceBundle.build(face_configurations, args.output)
+    print(f"Wrote {count} face images to {args.output} ({args.output.stat().st_size / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,19 @@
+import argparse
+import asyncio
 from pathlib import Path
 
+from src.capture.capture_backpressure import CaptureBackpressure
+from src.capture.capture_format import CaptureFormat
+from src.capture.frame_capture import FrameCapture
 from src.configuration.configuration import Configuration
 from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
 from src.entity.ball.ball_prototype import BallPrototype
+from src.faces.face_bundle import FaceBundle
 from src.faces.face_configuration import FaceConfiguration
 from src.game.game import Game
+from src.replay.replay import Replay
+from src.spectate.spectator_client import SpectatorClient
+from src.spectate.spectator_server import SpectatorServer
 
 
 def _get_faces(name: str, configuration: Configuration) -> FaceConfiguration:
@@ -15,19 +24,100 @@ def _get_faces(name: str, configuration: Configuration) -> FaceConfiguration:
     )
 
 
+def get_ball_prototypes(configuration: Configuration) -> list[BallPrototype]:
+    return [
+        BallPrototype(name=name, faces=_get_faces(name, configuration))
+        for name in ["nil", "jin", "papa", "mama", "martina"]
+    ]
+
+
 def main():
-    configuration = Configuration()
+    parser = argparse.ArgumentParser(description="Boink")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the first round")
+    parser.add_argument("--record", type=Path, default=None, help="save the replay of each round to this file")
+    parser.add_argument("--replay", type=Path, default=None, help="watch a recorded replay; left/right arrows seek")
+    parser.add_argument("--face-report", action="store_true", help="print the memory used by each face image on exit")
+    parser.add_argument("--capture", type=Path, default=None, help="save every presented frame into this directory")
+    parser.add_argument(
+        "--capture-format",
+        choices=[f.value for f in CaptureFormat],
+        default=CaptureFormat.PNG.value,
+        help="numbered PNG images, or one raw rgb24 stream",
+    )
+    parser.add_argument(
+        "--capture-block",
+        action="store_true",
+        help="slow the game down rather than skip frames when encoding falls behind",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="step physics on its own thread, overlapping it with drawing",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="play headless and stream every step to spectators connecting on this port",
+    )
+    parser.add_argument(
+        "--spectate",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="watch the matches streamed by a server on this port",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to serve on or spectate from")
+    args = parser.parse_args()
+
+    configuration = Configuration(threaded_pipeline=args.threaded)
 
     factory = BallSpawnConfigFactory(
         configuration,
-        ball_prototypes=[
-            BallPrototype(name=name, faces=_get_faces(name, configuration))
-            for name in ["nil", "jin", "papa", "mama", "martina"]
-        ],
+        ball_prototypes=get_ball_prototypes(configuration),
     )
 
-    game = Game(configuration, factory.make_balls)
-    game.run()
+    if args.serve is not None:
+        server = SpectatorServer(configuration, factory.make_balls, args.host, args.serve, seed=args.seed)
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            print("Exiting...")
+        return
+
+    capture = None
+    if args.capture:
+        capture = FrameCapture(
+            args.capture,
+            (configuration.window_width, configuration.window_height),
+            configuration.fps,
+            CaptureFormat(args.capture_format),
+            CaptureBackpressure.BLOCK if args.capture_block else CaptureBackpressure.DROP,
+        )
+
+    game = Game(
+        configuration,
+        factory.make_balls,
+        seed=args.seed,
+        record_path=args.record,
+        replay=Replay.load(args.replay) if args.replay else None,
+        face_bundle=FaceBundle(FaceBundle.DEFAULT_PATH) if FaceBundle.DEFAULT_PATH.exists() else None,
+        capture=capture,
+    )
+    try:
+        if args.spectate is not None:
+            try:
+                asyncio.run(SpectatorClient(game, args.host, args.spectate).run())
+            except InterruptedError:
+                print("Exiting...")
+        else:
+            game.run()
+    finally:
+        if capture:
+            capture.close()
+    if args.face_report:
+        print(game.face_registry.report())
 
 
 if __name__ == "__main__":
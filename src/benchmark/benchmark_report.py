@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import platform
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pygame
+import pymunk
+
+from src.benchmark.benchmark_result import BenchmarkResult
+
+
+def _environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pygame": pygame.version.ver,
+        "pymunk": pymunk.version,
+    }
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run, saved as JSON so later runs can be compared against it."""
+
+    VERSION = 1
+
+    results: list[BenchmarkResult] = field(default_factory=list)
+    environment: dict[str, str] = field(default_factory=_environment)
+
+    def save(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(
+                {
+                    "version": self.VERSION,
+                    "environment": self.environment,
+                    "results": [dataclasses.asdict(result) for result in self.results],
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> BenchmarkReport:
+        data = json.loads(path.read_text())
+        if data["version"] != cls.VERSION:
+            raise ValueError(f"Unsupported benchmark report version {data['version']}")
+        return cls(
+            results=[BenchmarkResult(**result) for result in data["results"]],
+            environment=data["environment"],
+        )
+
+    def table(self) -> str:
+        lines = [f"{'scenario':<14}{'steps/s':>12}{'frames/s':>12}"]
+        for result in self.results:
+            lines.append(
+                f"{result.scenario:<14}{result.physics_steps_per_second:>12.1f}{result.frames_per_second:>12.1f}"
+            )
+        return "\n".join(lines)
+
+    def compare(self, baseline: BenchmarkReport, tolerance: float) -> tuple[str, bool]:
+        """
+        Lists each metric next to the baseline's, flagging those more than tolerance slower.
+
+        Returns the listing and whether anything regressed. Scenarios missing from the baseline
+        are shown but never count as regressions.
+        """
+        baseline_results = {result.scenario: result for result in baseline.results}
+        lines = [f"{'scenario':<14}{'metric':<10}{'baseline':>12}{'current':>12}{'change':>9}"]
+        regressed = False
+        for result in self.results:
+            previous = baseline_results.get(result.scenario)
+            for metric, current in (
+                ("steps/s", result.physics_steps_per_second),
+                ("frames/s", result.frames_per_second),
+            ):
+                if previous is None:
+                    lines.append(f"{result.scenario:<14}{metric:<10}{'-':>12}{current:>12.1f}{'new':>9}")
+                    continue
+                before = previous.physics_steps_per_second if metric == "steps/s" else previous.frames_per_second
+                change = current / before - 1 if before else 0.0
+                flag = ""
+                if change < -tolerance:
+                    regressed = True
+                    flag = "  REGRESSION"
+                lines.append(f"{result.scenario:<14}{metric:<10}{before:>12.1f}{current:>12.1f}{change:>+9.1%}{flag}")
+        if baseline.environment != self.environment:
+            lines.append("Note: the baseline was recorded in a different environment")
+        return "\n".join(lines), regressed
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    scenario: str
+    physics_steps_per_second: float
+    frames_per_second: float
@@ -0,0 +1,111 @@
+import dataclasses
+import random
+import time
+from collections.abc import Callable
+
+import pygame
+
+from src.benchmark.benchmark_result import BenchmarkResult
+from src.benchmark.scenario import Scenario
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_prototype import BallPrototype
+from src.entity.ball.ball_spawn_config import BallSpawnConfig
+from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
+from src.game.game import Game
+from src.game.match import Match
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+
+class BenchmarkRunner:
+    """
+    Measures scenarios headless and through the real Game and Display code paths.
+
+    Every run uses the same seed, and balls never die, so each scenario does the same work every
+    time. Frames advance the match by exactly one physics step with no frame cap; point SDL at its
+    dummy video driver to run without a window. Each measurement is repeated and the best kept,
+    which is the least disturbed by whatever else the machine is doing.
+    """
+
+    SEED = 1234
+    IMMORTAL_HEALTH = 10**9
+    CRIT_STORM_SPEEDUP = 4
+    WARMUP_FRACTION = 0.1
+
+    def __init__(
+            self,
+            face_prototypes: Callable[[Configuration], list[BallPrototype]],
+            repeats: int = 3,
+    ) -> None:
+        self.face_prototypes = face_prototypes
+        self.repeats = repeats
+
+    @staticmethod
+    def _color_prototypes() -> list[BallPrototype]:
+        return [BallPrototype(name=f"ball{i}", color=pygame.Color(200, 40 * i, 0)) for i in range(5)]
+
+    def _balls_factory(
+            self,
+            scenario: Scenario,
+            configuration: Configuration,
+    ) -> Callable[[random.Random], list[BallSpawnConfig]]:
+        prototypes = self.face_prototypes(configuration) if scenario.faces else self._color_prototypes()
+        factory = BallSpawnConfigFactory(configuration, prototypes)
+        speedup = self.CRIT_STORM_SPEEDUP if scenario.crit_storm else 1
+
+        def make_balls(rng: random.Random) -> list[BallSpawnConfig]:
+            return [
+                dataclasses.replace(ball, initial_health=self.IMMORTAL_HEALTH, velocity=ball.velocity * speedup)
+                for ball in factory.make_balls(rng)
+            ]
+
+        return make_balls
+
+    def _best_rate(self, measure: Callable[[], float]) -> float:
+        return max(measure() for _ in range(self.repeats))
+
+    def measure_physics(self, scenario: Scenario) -> float:
+        """Headless physics steps per second."""
+        configuration = scenario.configuration()
+        balls_factory = self._balls_factory(scenario, configuration)
+
+        def measure() -> float:
+            match = Match(
+                configuration,
+                balls_factory,
+                VisualEffectManager(configuration.max_visual_effects),
+                seed=self.SEED,
+            )
+            dt = configuration.physics_dt
+            for _ in range(int(scenario.physics_steps * self.WARMUP_FRACTION)):
+                match.step(dt)
+            start = time.perf_counter()
+            for _ in range(scenario.physics_steps):
+                match.step(dt)
+            return scenario.physics_steps / (time.perf_counter() - start)
+
+        return self._best_rate(measure)
+
+    def measure_rendering(self, scenario: Scenario) -> float:
+        """Frames per second, each frame being one physics step plus drawing and presenting."""
+        configuration = scenario.configuration()
+        game = Game(configuration, self._balls_factory(scenario, configuration), seed=self.SEED)
+
+        def measure() -> float:
+            game.seed = self.SEED
+            match = game.start_round()
+            dt = configuration.physics_dt
+            for _ in range(int(scenario.frames * self.WARMUP_FRACTION)):
+                game.render_frame(match, dt)
+            start = time.perf_counter()
+            for _ in range(scenario.frames):
+                game.render_frame(match, dt)
+            return scenario.frames / (time.perf_counter() - start)
+
+        return self._best_rate(measure)
+
+    def run(self, scenario: Scenario) -> BenchmarkResult:
+        return BenchmarkResult(
+            scenario=scenario.name,
+            physics_steps_per_second=self.measure_physics(scenario),
+            frames_per_second=self.measure_rendering(scenario),
+        )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from src.configuration.configuration import Configuration
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A scripted benchmark workload: how many balls of which kind, and how long to measure it."""
+
+    name: str
+    ball_count: int
+    physics_steps: int
+    frames: int
+    faces: bool = False
+    # Balls start several times faster, so most hits are crits and effects pile up
+    crit_storm: bool = False
+
+    def configuration(self) -> Configuration:
+        if self.ball_count <= 5:
+            return Configuration()
+        return Configuration.large_arena(self.ball_count)
+
+
+SCENARIOS = [
+    Scenario("5 balls", 5, physics_steps=6000, frames=600),
+    Scenario("5 faces", 5, physics_steps=6000, frames=600, faces=True),
+    Scenario("50 balls", 50, physics_steps=3000, frames=600),
+    Scenario("500 balls", 500, physics_steps=600, frames=200),
+    Scenario("5000 balls", 5000, physics_steps=60, frames=20),
+    Scenario("crit storm", 300, physics_steps=600, frames=300, crit_storm=True),
+]
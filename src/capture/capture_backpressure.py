@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CaptureBackpressure(Enum):
+    # Skip frames while every buffer is waiting to be encoded; the game never waits
+    DROP = "drop"
+    # Wait for a buffer to free up; every frame is kept, at the cost of the frame rate
+    BLOCK = "block"
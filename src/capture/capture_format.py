@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CaptureFormat(Enum):
+    # One numbered PNG per frame, encoded by several workers at once
+    PNG = "png"
+    # Headerless rgb24 frames back to back in one file, ready for ffmpeg's rawvideo input
+    RAW = "raw"
@@ -0,0 +1,185 @@
+import json
+import queue
+import struct
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+import pygame
+
+from src.capture.capture_backpressure import CaptureBackpressure
+from src.capture.capture_format import CaptureFormat
+
+
+class FrameCapture:
+    """
+    Copies presented frames into a fixed pool of buffers and encodes them to disk on worker threads.
+
+    Capturing a frame is one straight copy of the surface's raw rows into a free buffer; nothing is
+    allocated per frame, and the workers pick the RGB channels out of the pixels. When encoding
+    falls behind and no buffer is free, backpressure decides between skipping the frame and waiting.
+    PNG frames are named by frame number, so skipped frames leave gaps in the numbering. A raw
+    stream is written by a single worker to keep frames in order, and skipped frames are missing
+    from it. Either way, close() writes capture.json, which lists the size, frame rate and skipped
+    frames. Once writing a frame fails, no more frames are written, and capture() and close()
+    raise the error.
+
+    PNGs are written here rather than by pygame.image.save, which holds the GIL while it encodes
+    and so stalls the game loop; zlib releases it.
+    """
+
+    METADATA_NAME = "capture.json"
+    RAW_NAME = "frames.rgb"
+    # Frames are mostly flat colour, so the fastest level already shrinks them well
+    PNG_COMPRESSION_LEVEL = 1
+
+    def __init__(
+            self,
+            directory: Path,
+            size: tuple[int, int],
+            fps: int,
+            capture_format: CaptureFormat = CaptureFormat.PNG,
+            backpressure: CaptureBackpressure = CaptureBackpressure.DROP,
+            buffers: int = 8,
+            workers: int = 2,
+    ) -> None:
+        self.directory = directory
+        self.size = size
+        self.fps = fps
+        self.capture_format = capture_format
+        self.backpressure = backpressure
+        self.frames = 0
+        self.dropped: list[int] = []
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Raw surface rows, allocated on the first capture once the surface's layout is known
+        self._buffers: list[npt.NDArray[np.uint8]] = []
+        self._buffer_count = buffers
+        # Byte offsets of red, green and blue within a pixel, and the bytes per pixel
+        self._channels = (0, 1, 2)
+        self._pixel_bytes = 3
+        self._free: queue.Queue[int] = queue.Queue()
+        for index in range(buffers):
+            self._free.put(index)
+        # Frame number and buffer index, or None to tell a worker to stop
+        self._pending: queue.Queue[tuple[int, int] | None] = queue.Queue()
+        self._error: Exception | None = None
+
+        self._raw: BinaryIO | None = None
+        if capture_format == CaptureFormat.RAW:
+            self._raw = (directory / self.RAW_NAME).open("wb")
+            workers = 1
+        self._workers = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def capture(self, surface: pygame.Surface) -> None:
+        """Queues a copy of surface's pixels for encoding, or skips it if backpressure says so."""
+        if self._error is not None:
+            raise self._error
+        if not self._buffers:
+            self._allocate_buffers(surface)
+        frame = self.frames
+        self.frames += 1
+        if self.backpressure == CaptureBackpressure.BLOCK:
+            index = self._free.get()
+        else:
+            try:
+                index = self._free.get_nowait()
+            except queue.Empty:
+                self.dropped.append(frame)
+                return
+
+        # The surface's own bytes, row by row as in memory; it keeps the surface locked until released
+        raw = surface.get_buffer()
+        np.copyto(self._buffers[index], np.frombuffer(raw, dtype=np.uint8).reshape(self._buffers[index].shape))
+        del raw
+        self._pending.put((frame, index))
+
+    def _allocate_buffers(self, surface: pygame.Surface) -> None:
+        if surface.get_size() != self.size:
+            raise ValueError(f"Capturing {self.size} frames, but the surface is {surface.get_size()}")
+        self._pixel_bytes = surface.get_bytesize()
+        if self._pixel_bytes not in (3, 4):
+            raise ValueError(f"Can't capture {8 * self._pixel_bytes}-bit surfaces")
+        red, green, blue, _ = [shift // 8 for shift in surface.get_shifts()]
+        if sys.byteorder == "big":
+            red, green, blue = (self._pixel_bytes - 1 - offset for offset in (red, green, blue))
+        self._channels = (red, green, blue)
+        shape = (self.size[1], surface.get_pitch())
+        self._buffers = [np.empty(shape, dtype=np.uint8) for _ in range(self._buffer_count)]
+
+    def _work(self) -> None:
+        try:
+            self._encode_pending()
+        except Exception as e:
+            self._error = e
+            # Keep handing buffers back until told to stop, so a blocked capture() gets to see the error
+            while (item := self._pending.get()) is not None:
+                self._free.put(item[1])
+            raise
+
+    def _encode_pending(self) -> None:
+        width, height = self.size
+        # PNG rows, each led by its filter type byte; 0 means unfiltered
+        rows = np.zeros((height, 1 + 3 * width), dtype=np.uint8)
+        # The pixels of the frame being written; for PNGs, they are written straight into the rows
+        if self._raw is not None:
+            rgb = np.empty((height, width, 3), dtype=np.uint8)
+        else:
+            rgb = rows[:, 1:].reshape(height, width, 3)
+        while (item := self._pending.get()) is not None:
+            frame, index = item
+            try:
+                if self._error is not None:
+                    continue
+                pixels = self._buffers[index][:, :width * self._pixel_bytes].reshape(height, width, -1)
+                for channel, offset in enumerate(self._channels):
+                    rgb[:, :, channel] = pixels[:, :, offset]
+                if self._raw is not None:
+                    self._raw.write(memoryview(rgb))
+                else:
+                    (self.directory / f"frame_{frame:06d}.png").write_bytes(self._encode_png(rows))
+            finally:
+                self._free.put(index)
+
+    def _encode_png(self, rows: npt.NDArray[np.uint8]) -> bytes:
+        def chunk(kind: bytes, data: bytes) -> bytes:
+            return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+        width, height = self.size
+        # 8-bit RGB, default compression and filtering, not interlaced
+        header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+        return (
+            b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(rows, self.PNG_COMPRESSION_LEVEL))
+            + chunk(b"IEND", b"")
+        )
+
+    def close(self) -> None:
+        """Waits for queued frames to be encoded, then writes the metadata."""
+        for _ in self._workers:
+            self._pending.put(None)
+        for worker in self._workers:
+            worker.join()
+        if self._raw is not None:
+            self._raw.close()
+        if self._error is not None:
+            raise self._error
+
+        width, height = self.size
+        metadata = {
+            "format": self.capture_format.value,
+            "width": width,
+            "height": height,
+            "fps": self.fps,
+            "pixel_format": "rgb24",
+            "frames": self.frames,
+            "dropped": self.dropped,
+        }
+        (self.directory / self.METADATA_NAME).write_text(json.dumps(metadata, indent=2) + "\n")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import io
+import pickle
+
+import pygame
+import pymunk.batch
+
+from src.faces.loaded_face_configuration import LoadedFaceConfiguration
+from src.game.match import Match
+from src.profiling.frame_profiler import FrameProfiler
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """Pickles a match, leaving out what a checkpoint shares with it instead of copying."""
+
+    SHARED_TYPES = (pygame.Surface, LoadedFaceConfiguration, FrameProfiler)
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared: list[object] = []
+        self._shared_indices: dict[int, int] = {}
+
+    def persistent_id(self, obj: object) -> tuple[str, int] | None:
+        if isinstance(obj, pymunk.batch.Buffer):
+            # Scratch space for bulk reads and writes; a restored match gets empty ones
+            return ("buffer", 0)
+        if isinstance(obj, self.SHARED_TYPES):
+            index = self._shared_indices.setdefault(id(obj), len(self.shared))
+            if index == len(self.shared):
+                self.shared.append(obj)
+            return ("shared", index)
+        return None
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, shared: list[object]) -> None:
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, pid: tuple[str, int]) -> object:
+        kind, index = pid
+        return pymunk.batch.Buffer() if kind == "buffer" else self.shared[index]
+
+
+class MatchCheckpoint:
+    """
+    Everything about a match at one moment, to carry on from as many times as needed.
+
+    Unlike a replay keyframe, nothing is left out: the pymunk space with its contact cache, ball
+    health, damage and modifiers, the live visual effects and the state of both random streams.
+    Images, loaded faces and the profiler are shared with the match rather than copied, so a
+    checkpoint can only be restored in the process that took it.
+
+    pymunk doesn't rebuild a contact exactly as it was, so while balls touch, a restored match
+    moves apart from the original from its first step, as a copied pymunk space does, and goes
+    on to play out differently. Only MatchForker's forked branches are exact.
+    """
+
+    def __init__(self, data: bytes, shared: list[object]) -> None:
+        self.data = data
+        self.shared = shared
+
+    @classmethod
+    def capture(cls, match: Match) -> MatchCheckpoint:
+        """Call between steps; the match is unchanged afterwards."""
+        buffer = io.BytesIO()
+        pickler = _CheckpointPickler(buffer)
+        # Bodies link back to their balls, which hold the bodies' shapes; pickle can't rebuild that
+        # cycle, so the links are left out and Match.relink puts them back
+        for ball in match.balls:
+            ball.body.user_data = None
+        try:
+            pickler.dump(match)
+        finally:
+            for ball in match.balls:
+                ball.body.user_data = ball
+        return cls(buffer.getvalue(), pickler.shared)
+
+    def restore(self) -> Match:
+        """A new match in the checkpoint's state, independent of the original and of other restores."""
+        match: Match = _CheckpointUnpickler(io.BytesIO(self.data), self.shared).load()
+        match.relink()
+        return match
@@ -0,0 +1,96 @@
+import os
+import pickle
+import sys
+import traceback
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from src.checkpoint.match_checkpoint import MatchCheckpoint
+from src.game.match import Match
+
+
+class MatchForker:
+    """
+    Plays what-if continuations of a match from its current state, each in a process of its own.
+
+    Each branch is forked from this process, so it starts from the match as it is in memory,
+    shared copy-on-write, and nothing is serialized to branch even a 2000-ball arena. Only a
+    branch's result comes back, pickled through a pipe. At most workers branches run at once.
+    Where os.fork isn't available, each branch restores a MatchCheckpoint instead, one after
+    another, and isn't exact once balls touch (see MatchCheckpoint).
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+
+    def run[R](self, match: Match, branches: int, continuation: Callable[[Match, int], R]) -> list[R]:
+        """
+        Calls continuation(match, branch) on a copy of the match for every branch, and returns
+        what each returned, in branch order. The match itself is left alone. Results must pickle.
+        """
+        if not hasattr(os, "fork"):
+            checkpoint = MatchCheckpoint.capture(match)
+            return [continuation(checkpoint.restore(), branch) for branch in range(branches)]
+
+        results: list[R] = []
+        running: deque[tuple[int, int, int]] = deque()
+        next_branch = 0
+        try:
+            while len(results) < branches:
+                while next_branch < branches and len(running) < self.workers:
+                    running.append((next_branch, *self._fork(match, next_branch, continuation)))
+                    next_branch += 1
+                branch, pid, read_fd = running.popleft()
+                results.append(self._collect(branch, pid, read_fd))
+        finally:
+            for _, pid, read_fd in running:
+                os.close(read_fd)
+                os.waitpid(pid, 0)
+        return results
+
+    @staticmethod
+    def _fork[R](match: Match, branch: int, continuation: Callable[[Match, int], R]) -> tuple[int, int]:
+        """Starts a branch, and returns its process id and the pipe its result comes back through."""
+        read_fd, write_fd = os.pipe()
+        # Anything still buffered would otherwise be written again by the child
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # The threaded solver's workers don't survive a fork, and a child stepping without them waits
+        # for them forever; so the parent stops them, and both sides start their own afterwards
+        threads = match.space.threads if match.space.threaded else 1
+        if threads > 1:
+            match.space.threads = 1
+        pid = os.fork()
+        if threads > 1:
+            match.space.threads = threads
+        if pid != 0:
+            os.close(write_fd)
+            return pid, read_fd
+
+        os.close(read_fd)
+        outcome: tuple[bool, object] = (False, "Interrupted")
+        try:
+            outcome = (True, continuation(match, branch))
+        except Exception as e:
+            outcome = (False, "".join(traceback.format_exception(e)))
+            raise
+        finally:
+            try:
+                with os.fdopen(write_fd, "wb") as pipe:
+                    pickle.dump(outcome, pipe, protocol=pickle.HIGHEST_PROTOCOL)
+            finally:
+                # Leave without running any of the parent's cleanup, which isn't the child's to run
+                os._exit(0)
+
+    @staticmethod
+    def _collect(branch: int, pid: int, read_fd: int) -> Any:
+        with os.fdopen(read_fd, "rb") as pipe:
+            data = pipe.read()
+        os.waitpid(pid, 0)
+        if not data:
+            raise RuntimeError(f"Branch {branch} died without a result")
+        succeeded, result = pickle.loads(data)
+        if not succeeded:
+            raise RuntimeError(f"Branch {branch} failed:\n{result}")
+        return result
@@ -1,29 +1,35 @@
+from __future__ import annotations
+
 import random
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pymunk
 
+from src.collisions.contact_buffer import ContactBuffer
+from src.configuration.balance_parameters import BalanceParameters
 
-BASE_CRIT_CHANCE = 0.05  # 5% minimum
-CRIT_SCALE = 0.0001  # 0.1% per unit of impact speed (tune as needed)
-CRIT_MULTIPLIER = 2  # Double damage on crit
+if TYPE_CHECKING:
+    from src.entity.ball.ball import Ball
+    from src.entity.ball.ball_states import BallStates
 
 
-def _get_ball_damage(speed: float, crit: bool) -> int:
-    base_damage = int(speed / 20)
-    return base_damage * CRIT_MULTIPLIER if crit else base_damage
+def _get_ball_damage(speed: float, crit: bool, balance: BalanceParameters) -> int:
+    base_damage = int(speed / balance.damage_speed_divisor)
+    return base_damage * balance.crit_multiplier if crit else base_damage
 
 
-def _crit_roll(impact_speed: float) -> bool:
-    crit_chance = min(1.0, BASE_CRIT_CHANCE + impact_speed * CRIT_SCALE)
-    return random.random() < crit_chance
+def _crit_roll(impact_speed: float, rng: random.Random, balance: BalanceParameters) -> bool:
+    return rng.random() < balance.crit_chance(impact_speed)
 
 
 def handle_ball_to_ball_collision(
         arbiter: pymunk.Arbiter,
         _space: pymunk.Space,
-        _data: Any,
+        rng: random.Random,
+        balance: BalanceParameters,
 ) -> None:
+    """Begin handler; bind balance with functools.partial, since pymunk passes only rng as data."""
     shape_a, shape_b = arbiter.shapes
     assert shape_a.body is not None
     assert shape_b.body is not None
@@ -31,6 +37,9 @@ def handle_ball_to_ball_collision(
     ball_b = shape_b.body.user_data
 
     n = arbiter.contact_point_set.normal
+    # pymunk may hand the pair over either way round, so roll for the balls in index order
+    if ball_a.index > ball_b.index:
+        ball_a, ball_b, n = ball_b, ball_a, -n
 
     v_a = ball_a.body.velocity
     v_b = ball_b.body.velocity
@@ -40,11 +49,11 @@ def handle_ball_to_ball_collision(
     impact_a_to_b = max(0, v_a.dot(n))
 
     # Crit rolls
-    crit_a = _crit_roll(impact_b_to_a)
-    crit_b = _crit_roll(impact_a_to_b)
+    crit_a = _crit_roll(impact_b_to_a, rng, balance)
+    crit_b = _crit_roll(impact_a_to_b, rng, balance)
 
-    damage_to_a = _get_ball_damage(impact_b_to_a, crit_b)
-    damage_to_b = _get_ball_damage(impact_a_to_b, crit_a)
+    damage_to_a = _get_ball_damage(impact_b_to_a, crit_b, balance)
+    damage_to_b = _get_ball_damage(impact_a_to_b, crit_a, balance)
 
     # First-hitter advantage: whoever was going to do the most damage gets first hit
     a_health = ball_a.health - damage_to_a
@@ -63,14 +72,88 @@ def handle_ball_to_ball_collision(
     ball_b.receive_damage(damage_to_b, crit_a)
 
 
-def handle_post_ball_to_ball_collision(
+def record_ball_to_ball_collision(
         arbiter: pymunk.Arbiter,
         _space: pymunk.Space,
-        _data: Any,
+        contacts: ContactBuffer,
 ) -> None:
+    """Batched counterpart of handle_ball_to_ball_collision: only notes the contact for resolve_ball_to_ball_contacts."""
     shape_a, shape_b = arbiter.shapes
     assert shape_a.body is not None
     assert shape_b.body is not None
+    body_a, body_b, normal = shape_a.body, shape_b.body, arbiter.normal
+    # As in handle_ball_to_ball_collision, the pair is kept in index order
+    if body_a.user_data.index > body_b.user_data.index:
+        body_a, body_b, normal = body_b, body_a, -normal
+    contacts.append(body_a.user_data.index, body_b.user_data.index, normal, body_a.velocity, body_b.velocity)
+
+
+def resolve_ball_to_ball_contacts(
+        contacts: ContactBuffer,
+        states: BallStates,
+        balls: list[Ball],
+        rng: np.random.Generator,
+        balance: BalanceParameters,
+) -> None:
+    """
+    Applies the damage of every contact recorded during a step in one vectorized pass.
+
+    Follows handle_ball_to_ball_collision, except that all contacts in the step are judged on the
+    health balls had at its start, so a ball killed in a step still hits back within it. Contacts
+    are rolled for in ball index order, not in the order pymunk reported them.
+    """
+    count = len(contacts)
+    if count == 0:
+        return
+    order = np.lexsort((contacts.indices[:count, 1], contacts.indices[:count, 0]))
+    index_a, index_b = contacts.indices[order, 0], contacts.indices[order, 1]
+    values = contacts.values[order]
+    normals, v_a, v_b = values[:, 0:2], values[:, 2:4], values[:, 4:6]
+
+    impact_b_to_a = np.maximum(0.0, -np.einsum("ij,ij->i", v_b, normals))
+    impact_a_to_b = np.maximum(0.0, np.einsum("ij,ij->i", v_a, normals))
+
+    rolls = rng.random((count, 2))
+    crit_a = rolls[:, 0] < np.minimum(1.0, balance.base_crit_chance + impact_b_to_a * balance.crit_scale)
+    crit_b = rolls[:, 1] < np.minimum(1.0, balance.base_crit_chance + impact_a_to_b * balance.crit_scale)
+
+    divisor = balance.damage_speed_divisor
+    damage_to_a = (impact_b_to_a / divisor).astype(np.int64) * np.where(crit_b, balance.crit_multiplier, 1)
+    damage_to_b = (impact_a_to_b / divisor).astype(np.int64) * np.where(crit_a, balance.crit_multiplier, 1)
+
+    # First-hitter advantage: whoever was going to do the most damage gets first hit
+    a_health = states.health[index_a] - damage_to_a
+    b_health = states.health[index_b] - damage_to_b
+    both_dead = (a_health <= 0) & (b_health <= 0)
+    damage_to_a[both_dead & (a_health > b_health)] = 0
+    damage_to_b[both_dead & (b_health > a_health)] = 0
+
+    np.add.at(states.damage_dealt, index_a, damage_to_b)
+    np.add.at(states.damage_dealt, index_b, damage_to_a)
+
+    was_alive = states.alive.copy()
+    received = np.zeros(len(states), dtype=np.int64)
+    np.add.at(received, index_a, damage_to_a)
+    np.add.at(received, index_b, damage_to_b)
+    states.apply_damage(received)
+
+    for i in np.flatnonzero(damage_to_a):
+        balls[index_a[i]].show_damage(int(damage_to_a[i]), bool(crit_b[i]))
+    for i in np.flatnonzero(damage_to_b):
+        balls[index_b[i]].show_damage(int(damage_to_b[i]), bool(crit_a[i]))
+    for index in np.flatnonzero(was_alive & ~states.alive):
+        balls[index].show_death()
+        balls[index].remove_if_dead()
+
+
+def handle_post_ball_to_ball_collision(
+        arbiter: pymunk.Arbiter,
+        _space: pymunk.Space,
+        _data: Any,
+) -> None:
+    shape_a, shape_b = arbiter.shapes
+    if shape_a.body is None or shape_b.body is None:
+        return  # The space is being torn down and its shapes were already detached
     ball_a = shape_a.body.user_data
     ball_b = shape_b.body.user_data
     ball_a.remove_if_dead()
@@ -0,0 +1,42 @@
+import numpy as np
+import pymunk
+
+
+class ContactBuffer:
+    """
+    Ball-to-ball contacts recorded during a physics step, to be resolved together after it.
+
+    Rows hold the two ball indices, and the contact normal with both velocities at first touch.
+    Storage is reused between steps and doubles when a step has more contacts than fit.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.count = 0
+        self.indices = np.zeros((capacity, 2), dtype=np.intp)
+        # normal x, normal y, velocity a x, velocity a y, velocity b x, velocity b y
+        self.values = np.zeros((capacity, 6), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(
+            self,
+            index_a: int,
+            index_b: int,
+            normal: pymunk.Vec2d,
+            velocity_a: pymunk.Vec2d,
+            velocity_b: pymunk.Vec2d,
+    ) -> None:
+        if self.count == len(self.indices):
+            self._grow()
+        self.indices[self.count] = (index_a, index_b)
+        self.values[self.count] = (normal.x, normal.y, velocity_a.x, velocity_a.y, velocity_b.x, velocity_b.y)
+        self.count += 1
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.indices)
+        self.indices = np.resize(self.indices, (capacity, 2))
+        self.values = np.resize(self.values, (capacity, 6))
+
+    def clear(self) -> None:
+        self.count = 0
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BalanceParameters:
+    """The numbers that decide who wins: how hard hits land, how often they crit, how fast balls get."""
+
+    base_crit_chance: float = 0.05  # 5% minimum
+    crit_scale: float = 0.0001  # 0.01% per unit of impact speed
+    crit_multiplier: int = 2  # Double damage on crit
+    # A hit deals one point of damage per this much impact speed
+    damage_speed_divisor: float = 20.0
+    # Each step, a living ball has speedup_chance of getting speedup_rate faster, up to velocity_cap
+    speedup_rate: float = 0.005
+    speedup_chance: float = 0.1
+    velocity_cap: float = 2000.0
+
+    def crit_chance(self, impact_speed: float) -> float:
+        return min(1.0, self.base_crit_chance + impact_speed * self.crit_scale)
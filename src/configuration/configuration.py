@@ -1,9 +1,16 @@
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from typing import Self
+
+from src.configuration.balance_parameters import BalanceParameters
+from src.entity.ball.spawn_placement import SpawnPlacement
 
 
 @dataclass(frozen=True)
 class Configuration:
     fps: int = 60
+    physics_hz: int = 60
+    max_physics_steps_per_frame: int = 5
     sim_size: tuple[int, int] = (1280, 720)
     hud_side_padding: int = 10
     top_hud_height: int = 40
@@ -11,6 +18,52 @@ class Configuration:
     hud_color: tuple[int, int, int] = (245, 235, 220)
     ball_radius: int = 60
     title: str = "Boink"
+    stalemate_timeout_seconds: float = 300.0
+    keyframe_interval_steps: int = 120
+    # None spawns one ball per prototype; otherwise prototypes are repeated to reach this many
+    ball_count: int | None = None
+    spawn_placement: SpawnPlacement = SpawnPlacement.RANDOM
+    # The spatial hash beats pymunk's default tree with thousands of same-sized balls
+    spatial_hash: bool = False
+    # More than one uses pymunk's threaded solver, which isn't available on Windows and only uses up to 2
+    solver_threads: int = 1
+    # Record contacts during the physics step and resolve their damage together afterwards
+    batched_collisions: bool = False
+    # Most visual effects alive at once; past this, crits and deaths push out plain damage numbers
+    max_visual_effects: int = 256
+    # Step physics on a thread of its own and draw from snapshots of it, overlapping the two
+    threaded_pipeline: bool = False
+    balance: BalanceParameters = field(default_factory=BalanceParameters)
+
+    @classmethod
+    def large_arena(
+            cls,
+            ball_count: int = 2000,
+            sim_size: tuple[int, int] | None = None,
+            solver_threads: int = 2,
+    ) -> Self:
+        """
+        A big arena crowded with small balls, for stress tests and headless tournaments.
+
+        Without a sim_size the arena grows with the ball count, keeping 2000 balls to 3200x1800 so
+        the crowding, and with it the collisions per ball, stays the same.
+        """
+        if sim_size is None:
+            scale = math.sqrt(ball_count / 2000)
+            sim_size = (max(320, round(3200 * scale)), max(180, round(1800 * scale)))
+        return cls(
+            sim_size=sim_size,
+            ball_radius=12,
+            ball_count=ball_count,
+            spawn_placement=SpawnPlacement.POISSON_DISK,
+            spatial_hash=True,
+            solver_threads=solver_threads,
+            batched_collisions=True,
+        )
+
+    @property
+    def physics_dt(self) -> float:
+        return 1.0 / self.physics_hz
 
     @property
     def min_initial_speed(self) -> float:
@@ -1,9 +1,28 @@
+import numpy as np
+import numpy.typing as npt
 import pygame
 
 from src.configuration.configuration import Configuration
+from src.display.font_registry import FontRegistry
+from src.display.lru_cache import LRUCache
 
 
 class Display:
+    # Rotated sprites are cached per angle bucket; 2 degrees is indistinguishable while spinning
+    ROTATION_STEP_DEG = 2
+    ROTATION_CACHE_SIZE = 2048
+    TEXT_CACHE_SIZE = 512
+    CIRCLE_CACHE_SIZE = 512
+    ALPHA_CACHE_SIZE = 2048
+    # Transparencies a sprite is cached at; fades step through these rather than all 256
+    ALPHA_LEVELS = 16
+    # Past this many changed areas a single full-window update is cheaper than many small ones
+    MAX_DIRTY_RECTS = 256
+    # Layers of the render queue, drawn bottom to top; within a layer, in the order they were drawn
+    BALL_LAYER = 0
+    LABEL_LAYER = 1
+    EFFECT_LAYER = 2
+
     def __init__(
         self,
         configuration: Configuration,
@@ -16,7 +35,42 @@ class Display:
             vsync=1,
         )
         self.sim_surface = pygame.Surface((self.configuration.sim_width, self.configuration.sim_height))
-        self.font = pygame.font.SysFont('Arial', 20)
+        self.sim_offset = (self.configuration.sim_left, self.configuration.sim_top)
+        self.bottom_hud_offset = (0, self.configuration.sim_top + self.configuration.sim_height)
+        self.fonts = FontRegistry()
+        self.font = self.fonts.get(20)
+        self.overlay_font = FontRegistry("monospace").get(14)
+        self.rotation_cache: LRUCache[tuple[pygame.Surface, int], pygame.Surface] = LRUCache(
+            self.ROTATION_CACHE_SIZE
+        )
+        self.text_cache: LRUCache[tuple[str, pygame.font.Font, tuple[int, int, int]], pygame.Surface] = LRUCache(
+            self.TEXT_CACHE_SIZE
+        )
+        self.circle_cache: LRUCache[tuple[int, tuple[int, int, int], int], pygame.Surface] = LRUCache(
+            self.CIRCLE_CACHE_SIZE
+        )
+        self.alpha_cache: LRUCache[tuple[pygame.Surface, int], pygame.Surface] = LRUCache(self.ALPHA_CACHE_SIZE)
+
+        # Static layers, rendered once and composited into whichever screen areas change
+        self.background = self._render_background()
+        self.sim_background = pygame.Surface(self.sim_surface.get_size())
+        self.sim_background.fill("white")
+        self.bottom_hud_surface = pygame.Surface(
+            (self.configuration.window_width, self.configuration.bottom_hud_height)
+        )
+        self.end_screen: pygame.Surface | None = None
+        self.overlay: pygame.Surface | None = None
+
+        # Areas of the simulation drawn over this frame and the previous one, in sim coordinates
+        self._sim_dirty_rects: list[pygame.Rect] = []
+        # Blits drawn this frame but not yet made, by layer: the sprite and where it goes
+        self._render_queue: dict[int, list[tuple[pygame.Surface, pygame.Rect]]] = {}
+        self._sim_rect = self.sim_surface.get_rect()
+        self._previous_sim_dirty_rects: list[pygame.Rect] = []
+        self._screen_dirty_rects: list[pygame.Rect] = []
+        self._last_hud_names: list[str] | None = None
+        self._last_hud_health: npt.NDArray[np.int64] | None = None
+        self._full_redraw = True
 
     def draw_circle(
             self,
@@ -25,18 +79,22 @@ class Display:
             color: pygame.Color,
             alpha: int = 255,
             width: int = 0,
+            layer: int = BALL_LAYER,
     ) -> None:
         """Draw a circle with optional alpha transparency."""
-        diameter = int(radius * 2)
-        temp_surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        sprite = self._get_circle_sprite(int(radius), color, width)
+        self._queue(sprite, (center[0] - radius, center[1] - radius), layer, alpha)
 
-        # Draw the circle at the center of the temporary surface
-        circle_color = pygame.Color(color.r, color.g, color.b, alpha)
-        pygame.draw.circle(temp_surface, circle_color, (radius, radius), int(radius), width)
+    def _get_circle_sprite(self, radius: int, color: pygame.Color, width: int = 0) -> pygame.Surface:
+        """Returns an opaque circle sprite; transparency is applied per blit with set_alpha."""
+        rgb = (color.r, color.g, color.b)
 
-        # Calculate the top-left position to blit the temp surface
-        blit_pos = (center[0] - radius, center[1] - radius)
-        self.sim_surface.blit(temp_surface, blit_pos)
+        def render() -> pygame.Surface:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, rgb, (radius, radius), radius, width)
+            return sprite
+
+        return self.circle_cache.get_or_create((radius, rgb, width), render)
 
     def draw_line(
             self,
@@ -45,7 +103,20 @@ class Display:
             color: tuple[int, int, int],
             width: int = 1,
     ) -> None:
-        pygame.draw.line(self.sim_surface, color, start, end, width)
+        """Draws a line straight away, over everything drawn so far this frame."""
+        self._submit_render_queue()
+        self._sim_dirty_rects.append(pygame.draw.line(self.sim_surface, color, start, end, width))
+
+    def draw_static_line(
+            self,
+            start: tuple[float, float],
+            end: tuple[float, float],
+            color: tuple[int, int, int],
+            width: int = 1,
+    ) -> None:
+        """Draws a line onto the static simulation layer, which persists until reset_static_layer."""
+        pygame.draw.line(self.sim_background, color, start, end, width)
+        self._full_redraw = True
 
     def draw_image(
             self,
@@ -53,27 +124,27 @@ class Display:
             center: tuple[float, float],
             angle_deg: float = 0,
             alpha: int = 255,
+            layer: int = BALL_LAYER,
     ) -> None:
-        if angle_deg != 0:
-            image = pygame.transform.rotate(image, angle_deg)
-        image.set_alpha(alpha)
-        rect = image.get_rect(center=center)
-        self.sim_surface.blit(image, rect.topleft)
+        self.blit_sprite(self._get_rotated_sprite(image, angle_deg), center, layer, alpha)
+
+    def _get_rotated_sprite(self, image: pygame.Surface, angle_deg: float) -> pygame.Surface:
+        buckets = 360 // self.ROTATION_STEP_DEG
+        bucket = round(angle_deg / self.ROTATION_STEP_DEG) % buckets
+        return self.rotation_cache.get_or_create(
+            (image, bucket),
+            lambda: pygame.transform.rotate(image, bucket * self.ROTATION_STEP_DEG),
+        )
 
     def draw_halo(
             self,
             center: tuple[float, float],
             halo_radius: int,
             color: pygame.Color,
+            layer: int = BALL_LAYER,
     ) -> None:
-        halo_surf = pygame.Surface((halo_radius * 2, halo_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(
-            halo_surf,
-            color,
-            (halo_radius, halo_radius),
-            halo_radius
-        )
-        self.sim_surface.blit(halo_surf, (center[0] - halo_radius, center[1] - halo_radius))
+        halo_surf = self._get_circle_sprite(halo_radius, color)
+        self._queue(halo_surf, (center[0] - halo_radius, center[1] - halo_radius), layer, color.a)
 
     def draw_text(
             self,
@@ -82,88 +153,242 @@ class Display:
             font: pygame.font.Font,
             color: tuple[int, int, int],
             alpha: int = 255,
+            layer: int = BALL_LAYER,
     ) -> None:
-        text_surf = font.render(text, True, color).convert_alpha()
-        text_surf.set_alpha(alpha)
-        text_rect = text_surf.get_rect(center=center)
-        self.sim_surface.blit(text_surf, text_rect)
+        text_surf = self.render_text(text, font, color)
+        self.blit_sprite(text_surf, center, layer, alpha)
 
-    def clear(self) -> None:
-        self.screen.fill(self.configuration.hud_color)
-        # Top HUD
-        pygame.draw.rect(
-            self.screen,
-            self.configuration.hud_color,
-            (
-                    0,
-                    0,
-                    self.configuration.window_width,
-                    self.configuration.top_hud_height,
-            ),
-        )
-        # Bottom HUD
-        pygame.draw.rect(
-            self.screen,
-            self.configuration.hud_color,
-            (
-                0,
-                self.configuration.sim_height + self.configuration.top_hud_height,
-                self.configuration.window_width,
-                self.configuration.bottom_hud_height,
-            )
-        )
-        # Simulation area
-        self.sim_surface.fill("white")
+    def blit_sprite(
+            self,
+            sprite: pygame.Surface,
+            center: tuple[float, float],
+            layer: int = BALL_LAYER,
+            alpha: int | None = None,
+    ) -> None:
+        """
+        Blits a prepared surface centered at the given simulation position.
 
-    def blit_simulation(self) -> None:
-        self.screen.blit(self.sim_surface, (self.configuration.hud_side_padding, self.configuration.top_hud_height))
+        With an alpha, the sprite is blitted at that transparency; without one, at its own.
+        """
+        self._queue(sprite, sprite.get_rect(center=center).topleft, layer, alpha)
+
+    def _queue(self, sprite: pygame.Surface, topleft: tuple[float, float], layer: int, alpha: int | None) -> None:
+        """Records a blit for the end of the frame, unless it falls entirely outside the simulation."""
+        if alpha is not None and alpha < 255:
+            alpha = round(alpha * (self.ALPHA_LEVELS - 1) / 255) * 255 // (self.ALPHA_LEVELS - 1)
+            if alpha <= 0:
+                return
+            if alpha < 255:
+                sprite = self._get_alpha_sprite(sprite, alpha)
+        # Blitting truncates float positions the same way
+        rect = sprite.get_rect(topleft=(int(topleft[0]), int(topleft[1])))
+        if not rect.colliderect(self._sim_rect):
+            return
+        self._sim_dirty_rects.append(rect)
+        queue = self._render_queue.get(layer)
+        if queue is None:
+            queue = self._render_queue[layer] = []
+        queue.append((sprite, rect))
+
+    def _get_alpha_sprite(self, sprite: pygame.Surface, alpha: int) -> pygame.Surface:
+        """
+        A copy of the sprite that blits at the given transparency.
+
+        Alpha belongs to a surface rather than to a blit, so one fblits call can't draw a shared
+        sprite at several alphas. Giving each alpha its own copy lets a whole layer go in one call;
+        alphas are rounded to ALPHA_LEVELS first, so fading sprites don't crowd out the cache.
+        """
+
+        def render() -> pygame.Surface:
+            copy = sprite.copy()
+            copy.set_alpha(alpha)
+            return copy
 
-    def draw_top_hud(self) -> None:
-        text_surface = self.font.render(self.configuration.title, True, (0, 0, 0))
+        return self.alpha_cache.get_or_create((sprite, alpha), render)
+
+    def _submit_render_queue(self) -> None:
+        """Makes the queued blits, one fblits call per layer, bottom layer first."""
+        for layer in sorted(self._render_queue):
+            self.sim_surface.fblits(self._render_queue[layer])
+        self._render_queue.clear()
+
+    def get_font(self, size: int, bold: bool = False) -> pygame.font.Font:
+        return self.fonts.get(size, bold)
+
+    def render_text(
+            self,
+            text: str,
+            font: pygame.font.Font,
+            color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """
+        Returns the rendered text, reusing a cached surface when the same text was drawn recently.
+
+        The surface is shared with later calls, so it must not be changed; to draw it translucent,
+        pass an alpha to blit_sprite.
+        """
+        return self.text_cache.get_or_create(
+            (text, font, color),
+            lambda: font.render(text, True, color).convert_alpha(),
+        )
+
+    def _render_background(self) -> pygame.Surface:
+        background = pygame.Surface((self.configuration.window_width, self.configuration.window_height))
+        background.fill(self.configuration.hud_color)
+        text_surface = self.render_text(self.configuration.title, self.font, (0, 0, 0))
         text_rect = text_surface.get_rect(center=(self.configuration.window_width // 2, self.configuration.top_hud_height // 2))
-        self.screen.blit(text_surface, text_rect)
+        background.blit(text_surface, text_rect)
+        return background
 
-    def draw_bottom_hud(self, ball_info: list[dict[str, str | int]]) -> None:
+    def reset_static_layer(self) -> None:
+        """Clears the static simulation layer so a new round can draw its own static entities."""
+        self.sim_background.fill("white")
+        self._full_redraw = True
+
+    def clear(self) -> None:
+        """Restores the parts of the simulation drawn over last frame from the static layer."""
+        self._render_queue.clear()
+        if self._full_redraw:
+            self.sim_surface.blit(self.sim_background, (0, 0))
+        else:
+            for rect in self._sim_dirty_rects:
+                self.sim_surface.blit(self.sim_background, rect, rect)
+        self._previous_sim_dirty_rects = self._sim_dirty_rects
+        self._sim_dirty_rects = []
+        self._screen_dirty_rects = []
+
+    def blit_simulation(self) -> None:
+        """Makes the blits queued this frame and marks the simulation areas changed since last frame for compositing."""
+        self._submit_render_queue()
+        for rect in self._previous_sim_dirty_rects + self._sim_dirty_rects:
+            self._screen_dirty_rects.append(rect.move(self.sim_offset))
+
+    def draw_bottom_hud(self, names: list[str], health: npt.NDArray[np.int64]) -> None:
         """
-        Draws a HUD at the bottom with name and health for each item.
+        Draws a HUD at the bottom with the name and health of each ball.
 
-        Each item should be a dict with the following keys: name and health
+        The HUD is only re-rendered when a name or health value changes.
         """
+        if (
+            names == self._last_hud_names
+            and self._last_hud_health is not None
+            and np.array_equal(health, self._last_hud_health)
+        ):
+            return
+        self._last_hud_names = list(names)
+        self._last_hud_health = health.copy()
+
+        self.bottom_hud_surface.fill(self.configuration.hud_color)
         font = self.font
         line_spacing = font.get_height() + 5
         lines_per_column = max(1, self.configuration.bottom_hud_height // line_spacing)
-        num_items = len(ball_info)
-        num_columns = (num_items + lines_per_column - 1) // lines_per_column
+        num_items = len(names)
+        num_columns = max(1, (num_items + lines_per_column - 1) // lines_per_column)
         col_width = self.configuration.window_width // num_columns
 
-        for idx, item in enumerate(ball_info):
+        for idx, (name, ball_health) in enumerate(zip(names, health, strict=True)):
             col = idx // lines_per_column
             row = idx % lines_per_column
-            y = self.configuration.top_hud_height + self.configuration.sim_height + 10 + row * line_spacing
+            y = 10 + row * line_spacing
             x = 10 + col * col_width
 
-            name = str(item["name"])
-            health = int(item["health"])
+            text = f"{name}: {ball_health:.0f}"
+            text_surface = self.render_text(text, font, (0, 0, 0))
+            self.bottom_hud_surface.blit(text_surface, (x, y))
 
-            text = f"{name}: {health:.0f}"
-            text_surface = font.render(text, True, (0, 0, 0))
-            self.screen.blit(text_surface, (x, y))
+        self._screen_dirty_rects.append(self.bottom_hud_surface.get_rect(topleft=self.bottom_hud_offset))
 
-    def draw_hud(self, ball_info: list[dict[str, str | int]]) -> None:
-        self.draw_top_hud()
-        self.draw_bottom_hud(ball_info)
+    def draw_hud(self, names: list[str], health: npt.NDArray[np.int64]) -> None:
+        self.draw_bottom_hud(names, health)
+
+    def show_end_screen(
+            self,
+            message: str,
+            button_rect: pygame.Rect,
+    ) -> None:
+        """Dims the window and shows the winner message and Fight Again button until hide_end_screen."""
+        if self.end_screen is not None:
+            return
+        self.end_screen = pygame.Surface(
+            (self.configuration.window_width, self.configuration.window_height),
+            pygame.SRCALPHA,
+        )
+        self.end_screen.fill((0, 0, 0, 96))  # 96/255 alpha for subtle dimming
+
+        text_surf = self.render_text(message, self.get_font(48, bold=True), (255, 215, 0))
+        text_rect = text_surf.get_rect(
+            center=(self.configuration.window_width // 2, self.configuration.window_height // 2)
+        )
+        self.end_screen.blit(text_surf, text_rect)
+        self.draw_fight_again_button(button_rect, self.get_font(36, bold=True))
+        self._full_redraw = True
+
+    def hide_end_screen(self) -> None:
+        if self.end_screen is None:
+            return
+        self.end_screen = None
+        self._full_redraw = True
 
     def draw_fight_again_button(
             self,
             button_rect: pygame.Rect,
             font: pygame.Font
     ) -> None:
-        pygame.draw.rect(self.screen, (220, 180, 60), button_rect, border_radius=12)
-        pygame.draw.rect(self.screen, (120, 80, 0), button_rect, width=3, border_radius=12)
-        text_surf = font.render("Fight Again", True, (50, 30, 0))
+        assert self.end_screen is not None
+        pygame.draw.rect(self.end_screen, (220, 180, 60), button_rect, border_radius=12)
+        pygame.draw.rect(self.end_screen, (120, 80, 0), button_rect, width=3, border_radius=12)
+        text_surf = self.render_text("Fight Again", font, (50, 30, 0))
         text_rect = text_surf.get_rect(center=button_rect.center)
-        self.screen.blit(text_surf, text_rect)
+        self.end_screen.blit(text_surf, text_rect)
+
+    def show_overlay(self, lines: list[str]) -> None:
+        """Shows the lines in a translucent box at the top left of the window, over everything else."""
+        if self.overlay is not None:
+            self._screen_dirty_rects.append(self.overlay.get_rect())
+        # Rendered directly rather than through the text cache, since the numbers change every time
+        text_surfaces = [self.overlay_font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = self.overlay_font.get_linesize()
+        padding = 6
+        self.overlay = pygame.Surface(
+            (
+                max(surface.get_width() for surface in text_surfaces) + 2 * padding,
+                line_height * len(text_surfaces) + 2 * padding,
+            ),
+            pygame.SRCALPHA,
+        )
+        self.overlay.fill((0, 0, 0, 180))
+        for i, surface in enumerate(text_surfaces):
+            self.overlay.blit(surface, (padding, padding + i * line_height))
+        self._screen_dirty_rects.append(self.overlay.get_rect())
+
+    def hide_overlay(self) -> None:
+        if self.overlay is None:
+            return
+        self._screen_dirty_rects.append(self.overlay.get_rect())
+        self.overlay = None
+
+    def _blit_layer(self, layer: pygame.Surface, offset: tuple[int, int], rect: pygame.Rect) -> None:
+        area = rect.clip(layer.get_rect(topleft=offset))
+        if area:
+            self.screen.blit(layer, area, area.move(-offset[0], -offset[1]))
+
+    def _compose(self, rect: pygame.Rect) -> None:
+        self._blit_layer(self.background, (0, 0), rect)
+        self._blit_layer(self.sim_surface, self.sim_offset, rect)
+        self._blit_layer(self.bottom_hud_surface, self.bottom_hud_offset, rect)
+        if self.end_screen is not None:
+            self._blit_layer(self.end_screen, (0, 0), rect)
+        if self.overlay is not None:
+            self._blit_layer(self.overlay, (0, 0), rect)
+
+    def flip(self) -> None:
+        """Composites the changed areas of every layer onto the window and presents only those."""
+        if self._full_redraw or len(self._screen_dirty_rects) > self.MAX_DIRTY_RECTS:
+            self._compose(self.screen.get_rect())
+            pygame.display.flip()
+            self._full_redraw = False
+            return
 
-    @staticmethod
-    def flip() -> None:
-        pygame.display.flip()
\ No newline at end of file
+        for rect in self._screen_dirty_rects:
+            self._compose(rect)
+        pygame.display.update(self._screen_dirty_rects)
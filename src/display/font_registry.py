@@ -0,0 +1,17 @@
+import pygame
+
+
+class FontRegistry:
+    """Loads each system font size once and hands out the same Font object afterwards."""
+
+    def __init__(self, name: str = 'Arial') -> None:
+        self.name = name
+        self._fonts: dict[tuple[int, bool], pygame.font.Font] = {}
+
+    def get(self, size: int, bold: bool = False) -> pygame.font.Font:
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(self.name, size, bold=bold)
+            self._fonts[key] = font
+        return font
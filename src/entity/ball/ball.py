@@ -1,16 +1,14 @@
 import math
-import random
 from typing import override
 
 import pygame
 import pymunk
 
 from src.entity.ball.ball_spawn_config import BallSpawnConfig
-from src.entity.ball.modifiers.angry_modifier import AngryModifier
-from src.entity.ball.modifiers.ball_modifiers import BallModifiers
+from src.entity.ball.ball_states import BallStates
 from src.entity.ball.modifiers.pulse_modifier import PulseModifier
 from src.entity.entity import Entity
-from src.faces.loaded_face_configuration import LoadedFaceConfiguration
+from src.faces.face_registry import FaceRegistry
 from src.display.display import Display
 from src.visuals.damage_number_effect import DamageNumberEffect
 from src.visuals.face_implosion_effect import FaceImplosionEffect
@@ -21,9 +19,6 @@ from src.visuals.visual_effect_manager import VisualEffectManager
 
 class Ball(Entity):
     COLLISION_TYPE = 1
-    SPEEDUP_RATE = 0.005
-    SPEEDUP_CHANCE = 0.1
-    VELOCITY_CAP = 2000
 
     CRIT_SECONDS = 1
 
@@ -32,10 +27,15 @@ class Ball(Entity):
         spawn_config: BallSpawnConfig,
         space: pymunk.Space,
         visual_effect_manager: VisualEffectManager,
+        states: BallStates,
+        index: int,
+        face_registry: FaceRegistry | None = None,
     ) -> None:
         self.prototype = spawn_config.prototype
         self.radius = spawn_config.radius
         self.mass = spawn_config.mass
+        self.states = states
+        self.index = index
         self.health = spawn_config.initial_health
 
         self.hit_timer_seconds = 0.0
@@ -48,6 +48,17 @@ class Ball(Entity):
         self.body.velocity = spawn_config.velocity
         self.body.angular_velocity = spawn_config.angular_velocity
         self.body.user_data = self
+        self.states.body_ids[self.index] = self.body.id
+
+        # State before the latest physics step, and the blend between the two that gets drawn
+        self.previous_position = self.body.position
+        self.previous_angle = self.body.angle
+        self.render_position = self.body.position
+        self.render_angle = self.body.angle
+        # The rest of what gets drawn, so drawing never reads the simulation directly
+        self.render_health = spawn_config.initial_health
+        self.render_angry = False
+        self.render_pulse_alpha = PulseModifier.MAX_ALPHA
 
         self.shape = pymunk.Circle(self.body, self.radius)
         self.shape.elasticity = 1.0
@@ -57,100 +68,149 @@ class Ball(Entity):
         self.space = space
         self.space.add(self.body, self.shape)
 
-        self.faces = LoadedFaceConfiguration(self.prototype.faces) if self.prototype.faces else None
+        # Face images need a display to convert against, so headless matches have no registry and skip them
+        self.faces = (
+            face_registry.get(self.prototype.faces)
+            if self.prototype.faces and face_registry
+            else None
+        )
 
         self.visual_effect_manager = visual_effect_manager
-        self.modifiers = BallModifiers()
+        self.modifiers = states.modifiers
+
+    @property
+    def health(self) -> int:
+        return int(self.states.health[self.index])
+
+    @health.setter
+    def health(self, value: int) -> None:
+        self.states.set_health(self.index, value)
+
+    @property
+    def damage_dealt(self) -> int:
+        return int(self.states.damage_dealt[self.index])
+
+    @damage_dealt.setter
+    def damage_dealt(self, value: int) -> None:
+        self.states.damage_dealt[self.index] = value
 
     @override
     def update(self, dt: float) -> None:
-        if self.health <= 0:
-            return
-
-        self.modifiers.update(dt)
+        """Per-step ball logic runs for all balls at once, in BallStates."""
+
+    def save_previous_state(self) -> None:
+        self.previous_position = self.body.position
+        self.previous_angle = self.body.angle
+
+    def interpolate(self, alpha: float) -> None:
+        """Blends the previous and current physics state; alpha is how far render time is into the next step."""
+        self.set_render_state(
+            self.previous_position.interpolate_to(self.body.position, alpha),
+            self.previous_angle + (self.body.angle - self.previous_angle) * alpha,
+            self.health,
+            self.modifiers.is_angry(self.index),
+            self.modifiers.get_pulse_alpha(self.index),
+        )
 
-        if random.random() < self.SPEEDUP_CHANCE and self.body.velocity.length < self.VELOCITY_CAP:
-            self.body.velocity *= 1 + self.SPEEDUP_RATE
+    def set_render_state(
+            self,
+            position: pymunk.Vec2d,
+            angle: float,
+            health: int,
+            angry: bool,
+            pulse_alpha: int,
+    ) -> None:
+        self.render_position = position
+        self.render_angle = angle
+        self.render_health = health
+        self.render_angry = angry
+        self.render_pulse_alpha = pulse_alpha
 
     @override
     def draw(self, display: Display) -> None:
-        if self.health <= 0:
+        if self.render_health <= 0:
             return
 
-        pos = (self.body.position.x, self.body.position.y)
+        pos = (self.render_position.x, self.render_position.y)
 
-        alpha = self.modifiers.get_pulse_alpha()
+        alpha = self.render_pulse_alpha
         if self.faces:
-            angle_deg = -self.body.angle * 180 / math.pi
+            angle_deg = -self.render_angle * 180 / math.pi
             display.draw_image(self.get_current_face(), pos, angle_deg, alpha)
         elif self.prototype.color:
             display.draw_circle(pos, self.radius, self.prototype.color, alpha)
 
         # Health text below the ball
-        health_text = f"{int(self.health)}"
-        health_font = pygame.font.SysFont('Arial', 20, bold=True)
+        health_text = f"{int(self.render_health)}"
+        health_font = display.get_font(20, bold=True)
         text_center = (pos[0], pos[1] + self.radius + 12)
-        display.draw_text(health_text, text_center, health_font, (80, 80, 80))
+        display.draw_text(health_text, text_center, health_font, (80, 80, 80), layer=Display.LABEL_LAYER)
 
     def deal_damage(self, damage: int, is_crit: bool) -> None:
-        pass
+        self.damage_dealt += damage
 
     def receive_damage(self, damage: int, is_crit: bool) -> None:
         if damage > 0:
             self.health = max(0, self.health - damage)
+            self.show_damage(damage, is_crit)
+            if self.health == 0:
+                self.show_death()
+
+    def show_damage(self, damage: int, is_crit: bool) -> None:
+        """Starts the reactions to taking a hit; health has already been reduced."""
+        self.modifiers.on_hit(self.index, damage)
+        if self.states.damage_log is not None:
+            self.states.damage_log.append((self.index, damage, is_crit))
+
+        damage_number = self.visual_effect_manager.acquire(DamageNumberEffect)
+        damage_number.setup(
+            self,
+            damage,
+            is_crit,
+        )
+        self.visual_effect_manager.add(damage_number)
 
-            self.modifiers.add(AngryModifier(damage))
-            self.modifiers.add(PulseModifier())
-
-            self.visual_effect_manager.add(
-                DamageNumberEffect(
-                    self,
-                    damage,
-                    is_crit,
-                )
+        if is_crit:
+            halo = self.visual_effect_manager.acquire(HaloEffect)
+            halo.setup(
+                self,
+                duration=self.CRIT_SECONDS,
             )
+            self.visual_effect_manager.add(halo)
 
-            if is_crit:
-                self.visual_effect_manager.add(
-                    HaloEffect(
-                        self,
-                        duration=self.CRIT_SECONDS,
-                    )
-                )
-
-            if self.health == 0:
-                if self.faces:
-                    self.visual_effect_manager.add(
-                        FaceImplosionEffect(
-                            pos=(self.body.position.x, self.body.position.y),
-                            angle_deg=-self.body.angle * 180 / math.pi,
-                            face_surface=self.faces.angry_surface,
-                            initial_radius=self.radius + 10,
-                            duration=0.5
-                        )
-                    )
-                elif self.prototype.color:  # TODO: assert this Either in the type system correctly
-                    self.visual_effect_manager.add(
-                        ImplosionEffect(
-                            pos=(self.body.position.x, self.body.position.y),
-                            color=self.prototype.color,
-                            initial_radius=self.radius + 10,
-                            duration=0.5
-                        )
-                    )
+    def show_death(self) -> None:
+        if self.faces:
+            face_implosion = self.visual_effect_manager.acquire(FaceImplosionEffect)
+            face_implosion.setup(
+                pos=(self.body.position.x, self.body.position.y),
+                angle_deg=-self.body.angle * 180 / math.pi,
+                frames=self.faces.implosion_frames,
+                initial_radius=self.radius + 10,
+                duration=0.5
+            )
+            self.visual_effect_manager.add(face_implosion)
+        elif self.prototype.color:  # TODO: assert this Either in the type system correctly
+            implosion = self.visual_effect_manager.acquire(ImplosionEffect)
+            implosion.setup(
+                pos=(self.body.position.x, self.body.position.y),
+                color=self.prototype.color,
+                initial_radius=self.radius + 10,
+                duration=0.5
+            )
+            self.visual_effect_manager.add(implosion)
 
     def remove_if_dead(self) -> None:
-        if self.health <= 0 and self.body in self.space.bodies:
+        if self.health <= 0 and self.body.space is not None:
             self.space.remove(self.body, self.shape)
 
 
     def get_current_face(self) -> pygame.Surface:
         assert self.faces is not None
-        return self.faces.angry_surface if self.modifiers.is_angry() else self.faces.happy_surface
+        return self.faces.angry_surface if self.render_angry else self.faces.happy_surface
 
     @property
     def name(self) -> str:
-        return self.prototype.name
+        return self.states.names[self.index]
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.name}) at ({self.body.position.x}, {self.body.position.y})"
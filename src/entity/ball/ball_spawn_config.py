@@ -13,4 +13,6 @@ class BallSpawnConfig:
     angular_velocity: float
     radius: float = 40
     mass: float = 1
-    initial_health: int = 100
\ No newline at end of file
+    initial_health: int = 100
+    # Tells apart balls that share a prototype; otherwise the ball takes the prototype's name
+    name: str | None = None
\ No newline at end of file
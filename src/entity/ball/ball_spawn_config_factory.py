@@ -6,53 +6,98 @@ import pymunk
 from src.configuration.configuration import Configuration
 from src.entity.ball.ball_prototype import BallPrototype
 from src.entity.ball.ball_spawn_config import BallSpawnConfig
+from src.entity.ball.poisson_disk_sampler import PoissonDiskSampler
+from src.entity.ball.spawn_grid import SpawnGrid
+from src.entity.ball.spawn_placement import SpawnPlacement
 
 
 class BallSpawnConfigFactory:
     def __init__(
         self,
         configuration: Configuration,
-        ball_prototypes: list[BallPrototype]
+        ball_prototypes: list[BallPrototype],
     ):
         self.configuration = configuration
-        self.ball_prototypes = ball_prototypes
+        self.ball_prototypes, self.ball_names = self._repeat_prototypes(ball_prototypes, configuration.ball_count)
 
-    def random_position(self) -> pymunk.Vec2d:
-        x = random.uniform(
+    @staticmethod
+    def _repeat_prototypes(
+            ball_prototypes: list[BallPrototype],
+            count: int | None,
+    ) -> tuple[list[BallPrototype], list[str | None]]:
+        """Cycles through the prototypes until there are count of them, numbering the balls to keep their names unique."""
+        if count is None:
+            return ball_prototypes, [None] * len(ball_prototypes)
+        repeated = [ball_prototypes[i % len(ball_prototypes)] for i in range(count)]
+        names: list[str | None] = [
+            f"{prototype.name} {i // len(ball_prototypes) + 1}" for i, prototype in enumerate(repeated)
+        ]
+        return repeated, names
+
+    def random_position(self, rng: random.Random) -> pymunk.Vec2d:
+        x = rng.uniform(
             self.configuration.ball_radius,
             self.configuration.sim_width - self.configuration.ball_radius,
         )
-        y = random.uniform(
+        y = rng.uniform(
             self.configuration.ball_radius,
             self.configuration.sim_height - self.configuration.ball_radius,
         )
         return pymunk.Vec2d(x, y)
 
-    def random_velocity(self) -> pymunk.Vec2d:
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(self.configuration.min_initial_speed, self.configuration.max_initial_speed)
+    def random_velocity(self, rng: random.Random) -> pymunk.Vec2d:
+        angle = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(self.configuration.min_initial_speed, self.configuration.max_initial_speed)
         return pymunk.Vec2d(speed, 0).rotated(angle)
 
-    def is_overlapping(self, pos: pymunk.Vec2d, other_positions: list[pymunk.Vec2d]) -> bool:
-        for other in other_positions:
-            if (pos - other).length < 2 * self.configuration.ball_radius:
-                return True
-        return False
+    def _poisson_disk_sampler(self) -> PoissonDiskSampler:
+        radius = self.configuration.ball_radius
+        return PoissonDiskSampler(
+            (radius, radius, self.configuration.sim_width - radius, self.configuration.sim_height - radius),
+            min_distance=2 * radius,
+        )
 
-    def make_balls(self) -> list[BallSpawnConfig]:
-        positions: list[pymunk.Vec2d] = []
-        balls: list[BallSpawnConfig] = []
+    def capacity(self, rng: random.Random | None = None) -> int:
+        """How many balls a Poisson-disk fill fits in the arena; a little short of perfect packing."""
+        return len(self._poisson_disk_sampler().sample(rng or random.Random(0)))
+
+    def _place_randomly(self, rng: random.Random, grid: SpawnGrid, ball_prototype: BallPrototype) -> pymunk.Vec2d:
         max_tries = 1000
+        for _ in range(max_tries):
+            pos = self.random_position(rng)
+            if grid.fits(*pos):
+                grid.add(*pos)
+                return pos
+        raise RuntimeError(
+            f"Couldn't find non-overlapping position for ball {ball_prototype.name} after placing "
+            f"{len(grid.points)}; use SpawnPlacement.POISSON_DISK for crowded arenas"
+        )
+
+    def _poisson_disk_positions(self, rng: random.Random, count: int) -> list[pymunk.Vec2d]:
+        positions = self._poisson_disk_sampler().sample(rng)
+        if count > len(positions):
+            raise RuntimeError(
+                f"The arena only fits {len(positions)} balls of radius {self.configuration.ball_radius}, "
+                f"but {count} were requested"
+            )
+        # The fill grows outwards from one point, so pick at random to spread the balls evenly
+        return rng.sample(positions, count)
+
+    def make_balls(self, rng: random.Random) -> list[BallSpawnConfig]:
+        grid = SpawnGrid(self.configuration.sim_width, self.configuration.sim_height, 2 * self.configuration.ball_radius)
+        poisson_disk_positions = (
+            self._poisson_disk_positions(rng, len(self.ball_prototypes))
+            if self.configuration.spawn_placement == SpawnPlacement.POISSON_DISK
+            else None
+        )
+        balls: list[BallSpawnConfig] = []
         for i, ball_prototype in enumerate(self.ball_prototypes):
-            for _ in range(max_tries):
-                pos = self.random_position()
-                if not self.is_overlapping(pos, positions):
-                    positions.append(pos)
-                    break
+            if poisson_disk_positions is not None:
+                pos = poisson_disk_positions[i]
             else:
-                raise RuntimeError(f"Couldn't find non-overlapping position for ball {ball_prototype.name}!")
-            vel = self.random_velocity()
-            ang_vel = random.uniform(0.5, 2)
+                pos = self._place_randomly(rng, grid, ball_prototype)
+            vel = self.random_velocity(rng)
+            ang_vel = rng.uniform(0.5, 2)
             balls.append(
                 BallSpawnConfig(
                     ball_prototype,
@@ -60,6 +105,7 @@ class BallSpawnConfigFactory:
                     velocity=vel,
                     angular_velocity=ang_vel,
                     radius=self.configuration.ball_radius,
+                    name=self.ball_names[i],
                 )
             )
-        return balls
\ No newline at end of file
+        return balls
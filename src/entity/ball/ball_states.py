@@ -0,0 +1,121 @@
+import numpy as np
+import numpy.typing as npt
+import pymunk
+import pymunk.batch
+
+from src.entity.ball.modifiers.ball_modifiers import BallModifiers
+
+
+class BallStates:
+    """
+    Simulation state of every ball in a match, stored as arrays indexed by spawn order.
+
+    Balls read and write their own slot; per-step logic that touches every ball runs over the
+    arrays in one pass and reads and writes the pymunk bodies in bulk.
+    """
+
+    def __init__(self, names: list[str]) -> None:
+        count = len(names)
+        self.names = names
+        self.health = np.zeros(count, dtype=np.int64)
+        self.alive = np.zeros(count, dtype=np.bool_)
+        self.damage_dealt = np.zeros(count, dtype=np.int64)
+        self.modifiers = BallModifiers(count)
+        self.body_ids = np.zeros(count, dtype=np.uintp)
+        # Hits taken as (ball index, damage, crit); only kept when someone sets it to a list
+        self.damage_log: list[tuple[int, int, bool]] | None = None
+
+        # Poses as last read, kept for balls that have since left the space
+        self._positions = np.zeros((count, 2), dtype=np.float64)
+        self._angles = np.zeros(count, dtype=np.float64)
+        self._id_order = np.zeros(count, dtype=np.intp)
+        self._sorted_ids = np.zeros(count, dtype=np.uintp)
+        self._read_buffer = pymunk.batch.Buffer()
+        self._write_buffer = pymunk.batch.Buffer()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index_bodies(self) -> None:
+        """Call once every ball has registered its body id."""
+        self._id_order = np.argsort(self.body_ids)
+        self._sorted_ids = self.body_ids[self._id_order]
+
+    def set_health(self, index: int, health: int) -> None:
+        self.health[index] = health
+        self.alive[index] = health > 0
+
+    def load_health(self, health: npt.NDArray[np.int64]) -> None:
+        """Replaces every ball's health at once."""
+        np.copyto(self.health, health)
+        np.greater(self.health, 0, out=self.alive)
+
+    def apply_damage(self, damage: npt.NDArray[np.int64]) -> None:
+        """Takes damage[i] off ball i's health, stopping at 0."""
+        np.maximum(self.health - damage, 0, out=self.health)
+        np.greater(self.health, 0, out=self.alive)
+
+    def alive_indices(self) -> npt.NDArray[np.intp]:
+        return np.flatnonzero(self.alive)
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def _ball_indices(
+            self,
+            body_ids: npt.NDArray[np.uintp],
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.bool_]]:
+        """The ball index of each body, and whether it is a ball at all."""
+        # Space iteration order isn't spawn order, so map each body back to its ball. The space can
+        # also hold bodies that aren't balls, like the static body the walls hang off.
+        positions = np.minimum(np.searchsorted(self._sorted_ids, body_ids), len(self) - 1)
+        return self._id_order[positions], self._sorted_ids[positions] == body_ids
+
+    def read_poses(self, space: pymunk.Space) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Positions and angles of every ball, in bulk. Balls no longer in the space keep the pose they
+        were last read at, so effects that follow a dead ball stay where it died.
+        """
+        self._read_buffer.clear()
+        pymunk.batch.get_space_bodies(
+            space,
+            pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.POSITION | pymunk.batch.BodyFields.ANGLE,
+            self._read_buffer,
+        )
+        body_ids = np.frombuffer(self._read_buffer.int_buf(), dtype=np.uintp)
+        poses = np.frombuffer(self._read_buffer.float_buf(), dtype=np.float64).reshape(-1, 3)
+        indices, is_ball = self._ball_indices(body_ids)
+        self._positions[indices[is_ball]] = poses[is_ball, :2]
+        self._angles[indices[is_ball]] = poses[is_ball, 2]
+        return self._positions.copy(), self._angles.copy()
+
+    def apply_speedup(
+            self,
+            space: pymunk.Space,
+            rng: np.random.Generator,
+            chance: float,
+            rate: float,
+            velocity_cap: float,
+    ) -> None:
+        """Speeds up each living ball by rate with the given chance, as long as it is under the cap."""
+        rolls = rng.random(len(self)) < chance
+        if not rolls.any():
+            return
+
+        self._read_buffer.clear()
+        pymunk.batch.get_space_bodies(
+            space,
+            pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.VELOCITY,
+            self._read_buffer,
+        )
+        body_ids = np.frombuffer(self._read_buffer.int_buf(), dtype=np.uintp)
+        velocities = np.frombuffer(self._read_buffer.float_buf(), dtype=np.float64).reshape(-1, 2)
+
+        indices, is_ball = self._ball_indices(body_ids)
+        speeds = np.hypot(velocities[:, 0], velocities[:, 1])
+        boosted = is_ball & rolls[indices] & self.alive[indices] & (speeds < velocity_cap)
+
+        new_velocities = velocities.copy()
+        new_velocities[boosted] *= 1 + rate
+        self._write_buffer.set_float_buf(new_velocities.ravel())
+        pymunk.batch.set_space_bodies(space, pymunk.batch.BodyFields.VELOCITY, self._write_buffer)
@@ -4,5 +4,6 @@ from src.entity.ball.modifiers.ball_modifier import BallModifier
 class AngryModifier(BallModifier):
     SECONDS_PER_DAMAGE = 0.1
 
-    def __init__(self, damage: int) -> None:
-        super().__init__(damage * self.SECONDS_PER_DAMAGE)
+    def apply(self, index: int, damage: int) -> None:
+        """Keeps the ball angry for as long as its longest-lasting hit asks for."""
+        self.timers[index] = max(self.timers[index], damage * self.SECONDS_PER_DAMAGE)
@@ -1,21 +1,28 @@
-from __future__ import annotations
+import numpy as np
+import numpy.typing as npt
 
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from src.entity.ball.ball import Ball
+class BallModifier:
+    """
+    One kind of modifier, as a single timer slot per ball.
 
+    Timers for every ball live in one array, so they all count down in a single pass and a
+    check is one lookup. Applying a modifier again merges into the slot instead of stacking.
+    """
 
-class BallModifier:
-    def __init__(self, duration: float) -> None:
-        self.duration = duration
+    def __init__(self, count: int) -> None:
+        self.timers: npt.NDArray[np.float64] = np.zeros(count, dtype=np.float64)
 
     def update(self, dt: float) -> None:
-        self.duration = max(0.0, self.duration - dt)
+        np.subtract(self.timers, dt, out=self.timers)
+        np.maximum(self.timers, 0.0, out=self.timers)
+
+    def is_active(self, index: int) -> bool:
+        return bool(self.timers[index] > 0)
 
-    def is_active(self) -> bool:
-        return self.duration > 0
+    def active(self) -> npt.NDArray[np.bool_]:
+        """Whether each ball has this modifier."""
+        return self.timers > 0
 
-    def apply(self, ball: Ball) -> None:
-        """Override in subclasses to modify drawing or behavior."""
-        pass
+    def clear(self) -> None:
+        self.timers.fill(0.0)
@@ -1,25 +1,37 @@
+import numpy as np
+import numpy.typing as npt
+
 from src.entity.ball.modifiers.angry_modifier import AngryModifier
-from src.entity.ball.modifiers.ball_modifier import BallModifier
 from src.entity.ball.modifiers.pulse_modifier import PulseModifier
 
 
 class BallModifiers:
-    def __init__(self) -> None:
-        self.modifiers: list[BallModifier] = []
+    """The modifier slots of every ball in a match, addressed by the ball's index."""
+
+    def __init__(self, count: int) -> None:
+        self.angry = AngryModifier(count)
+        self.pulse = PulseModifier(count)
 
     def update(self, dt: float) -> None:
-        for modifier in self.modifiers:
-            modifier.update(dt)
-        self.modifiers = [modifier for modifier in self.modifiers if modifier.is_active()]
+        self.angry.update(dt)
+        self.pulse.update(dt)
+
+    def clear(self) -> None:
+        self.angry.clear()
+        self.pulse.clear()
+
+    def on_hit(self, index: int, damage: int) -> None:
+        self.angry.apply(index, damage)
+        self.pulse.apply(index)
+
+    def is_angry(self, index: int) -> bool:
+        return self.angry.is_active(index)
 
-    def add(self, modifier: BallModifier) -> None:
-        self.modifiers.append(modifier)
+    def get_pulse_alpha(self, index: int) -> int:
+        return self.pulse.get_alpha(index)
 
-    def is_angry(self) -> bool:
-        return any(isinstance(modifier, AngryModifier) for modifier in self.modifiers)
+    def angry_mask(self) -> npt.NDArray[np.bool_]:
+        return self.angry.active()
 
-    def get_pulse_alpha(self) -> int:
-        for modifier in self.modifiers:
-            if isinstance(modifier, PulseModifier):
-                return modifier.get_alpha()
-        return 255  # Default alpha (fully opaque)
\ No newline at end of file
+    def get_pulse_alphas(self) -> npt.NDArray[np.int64]:
+        return self.pulse.get_alphas()
@@ -1,40 +1,50 @@
 import math
+
+import numpy as np
+import numpy.typing as npt
+
 from src.entity.ball.modifiers.ball_modifier import BallModifier
 
+
 class PulseModifier(BallModifier):
     DURATION = 0.7
     NUM_PULSES = 3
+    MIN_ALPHA = 120
+    MAX_ALPHA = 255
+    MIN_SCALE = 0.92
+    MAX_SCALE = 1.08
 
-    def __init__(
-            self,
-            duration: float = DURATION,
-            min_alpha: int = 120,
-            max_alpha: int = 255,
-            min_scale: float = 0.92,
-            max_scale: float = 1.08,
-    ):
-        super().__init__(duration)
-        self.initial_duration = duration
-        self.min_alpha = min_alpha
-        self.max_alpha = max_alpha
-        self.min_scale = min_scale
-        self.max_scale = max_scale
-
-    def get_progress(self) -> float:
-        return 1.0 - (self.duration / self.initial_duration)
-
-    def get_alpha(self) -> int:
+    def apply(self, index: int) -> None:
+        """Restarts the pulse."""
+        self.timers[index] = self.DURATION
+
+    def get_progress(self, index: int) -> float:
+        return 1.0 - (float(self.timers[index]) / self.DURATION)
+
+    def get_alpha(self, index: int) -> int:
+        if not self.is_active(index):
+            return self.MAX_ALPHA  # Fully opaque
         # Ease in-out: alpha dips in the middle, returns to max at the end
-        progress = self.get_progress()
+        progress = self.get_progress(index)
         # Use a bell-curve shape: dips at the middle, max at start/end
         # alpha = min + (max - min) * |cos(pi * progress)|
         pulse = abs(math.cos(math.pi * progress * self.NUM_PULSES))
-        return int(self.min_alpha + (self.max_alpha - self.min_alpha) * pulse)
+        return int(self.MIN_ALPHA + (self.MAX_ALPHA - self.MIN_ALPHA) * pulse)
+
+    def get_alphas(self) -> npt.NDArray[np.int64]:
+        """get_alpha for every ball at once."""
+        progress = 1.0 - self.timers / self.DURATION
+        pulse = np.abs(np.cos(np.pi * progress * self.NUM_PULSES))
+        alphas = (self.MIN_ALPHA + (self.MAX_ALPHA - self.MIN_ALPHA) * pulse).astype(np.int64)
+        alphas[~self.active()] = self.MAX_ALPHA
+        return alphas
 
-    def get_scale(self) -> float:
+    def get_scale(self, index: int) -> float:
+        if not self.is_active(index):
+            return 1.0
         # Pop scale: starts big, shrinks, then returns to normal
-        progress = self.get_progress()
+        progress = self.get_progress(index)
         # Use a similar bell-curve shape, but inverted for scale
         # scale = min_scale + (max_scale - min_scale) * sin(pi * progress)
         pulse = math.sin(math.pi * progress)
-        return self.min_scale + (self.max_scale - self.min_scale) * pulse
\ No newline at end of file
+        return self.MIN_SCALE + (self.MAX_SCALE - self.MIN_SCALE) * pulse
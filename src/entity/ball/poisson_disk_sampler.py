@@ -0,0 +1,60 @@
+import math
+import random
+
+import pymunk
+
+from src.entity.ball.spawn_grid import SpawnGrid
+
+
+class PoissonDiskSampler:
+    """
+    Fills a rectangle with points at least min_distance apart, using Bridson's algorithm.
+
+    Sampling runs until no more points fit, so the result is a dense, evenly spread set whose
+    size is how many balls the area can actually hold. It takes time linear in that count.
+
+    Candidates around a point are tried just past min_distance at evenly spaced angles with a
+    random offset, rather than anywhere in the [d, 2d] annulus; that packs tighter and needs far
+    fewer attempts per point.
+    """
+
+    CANDIDATES_PER_POINT = 12
+    # Candidates sit this fraction past min_distance, so float error never makes them overlap
+    EPSILON = 1e-6
+
+    def __init__(
+            self,
+            bounds: tuple[float, float, float, float],
+            min_distance: float,
+    ) -> None:
+        self.bounds = bounds
+        self.min_distance = min_distance
+
+    def sample(self, rng: random.Random) -> list[pymunk.Vec2d]:
+        left, top, right, bottom = self.bounds
+        if right < left or bottom < top:
+            return []
+
+        grid = SpawnGrid(right, bottom, self.min_distance)
+        distance = self.min_distance * (1 + self.EPSILON)
+        angle_step = 2 * math.pi / self.CANDIDATES_PER_POINT
+        first = (rng.uniform(left, right), rng.uniform(top, bottom))
+        grid.add(*first)
+        active = [first]
+        while active:
+            index = rng.randrange(len(active))
+            center_x, center_y = active[index]
+            start_angle = rng.uniform(0, 2 * math.pi)
+            for i in range(self.CANDIDATES_PER_POINT):
+                angle = start_angle + i * angle_step
+                x = center_x + distance * math.cos(angle)
+                y = center_y + distance * math.sin(angle)
+                if left <= x <= right and top <= y <= bottom and grid.fits(x, y):
+                    grid.add(x, y)
+                    active.append((x, y))
+                    break
+            else:
+                # Nothing fits around this point any more; swap-remove it
+                active[index] = active[-1]
+                active.pop()
+        return grid.points
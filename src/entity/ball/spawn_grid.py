@@ -0,0 +1,43 @@
+import math
+
+import pymunk
+
+
+class SpawnGrid:
+    """
+    Background grid for placing points that must stay at least min_distance apart.
+
+    Cells are min_distance / sqrt(2) wide, so each holds at most one point and a fit check only
+    looks at the 5x5 block of cells around the candidate, however many points are placed.
+    """
+
+    def __init__(self, width: float, height: float, min_distance: float) -> None:
+        self.min_distance = min_distance
+        self.cell_size = min_distance / math.sqrt(2)
+        self.columns = max(1, math.ceil(width / self.cell_size))
+        self.rows = max(1, math.ceil(height / self.cell_size))
+        # Cell contents as plain coordinates; this is the hot loop of a fill
+        self.cells: list[tuple[float, float] | None] = [None] * (self.columns * self.rows)
+        self.points: list[pymunk.Vec2d] = []
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        column = min(max(int(x / self.cell_size), 0), self.columns - 1)
+        row = min(max(int(y / self.cell_size), 0), self.rows - 1)
+        return column, row
+
+    def fits(self, x: float, y: float) -> bool:
+        column, row = self._cell(x, y)
+        min_distance_sq = self.min_distance * self.min_distance
+        cells = self.cells
+        first_column, last_column = max(column - 2, 0), min(column + 3, self.columns)
+        for r in range(max(row - 2, 0), min(row + 3, self.rows)):
+            offset = r * self.columns
+            for other in cells[offset + first_column:offset + last_column]:
+                if other is not None and (x - other[0]) ** 2 + (y - other[1]) ** 2 < min_distance_sq:
+                    return False
+        return True
+
+    def add(self, x: float, y: float) -> None:
+        column, row = self._cell(x, y)
+        self.cells[row * self.columns + column] = (x, y)
+        self.points.append(pymunk.Vec2d(x, y))
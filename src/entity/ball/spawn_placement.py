@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class SpawnPlacement(Enum):
+    # Independent uniform positions, retried until they don't overlap. Fine for a handful of balls.
+    RANDOM = "random"
+    # A random subset of a Poisson-disk fill of the arena. Scales to thousands of balls.
+    POISSON_DISK = "poisson_disk"
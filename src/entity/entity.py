@@ -13,3 +13,6 @@ class Entity(ABC):
     def draw(self, display: Display) -> None:
         """Draw the entity on the given Pygame surface."""
         pass
+
+    def draw_static(self, display: Display) -> None:
+        """Draw the parts of the entity that never change onto the display's static layer, once per round."""
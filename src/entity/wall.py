@@ -31,4 +31,8 @@ class Wall(Entity):
 
     @override
     def draw(self, display: Display) -> None:
-        display.draw_line(self.start, self.end, self.color, self.thickness)
+        pass  # Drawn once onto the static layer
+
+    @override
+    def draw_static(self, display: Display) -> None:
+        display.draw_static_line(self.start, self.end, self.color, self.thickness)
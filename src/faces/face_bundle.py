@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+import pygame
+
+from src.faces.face_configuration import FaceConfiguration
+from src.faces.loaded_face_configuration import LoadedFaceConfiguration
+
+
+class FaceBundle:
+    """
+    Face images already decoded, scaled and masked, packed as raw RGBA pixels in one file.
+
+    The file is the magic bytes, a length-prefixed JSON index, then each image's pixels at an
+    aligned offset. Opening memory-maps it, and surfaces are made straight from the mapped pixels,
+    so a cold start decodes no PNGs. Images whose source file changed since the build are left
+    out, and the registry falls back to loading them.
+    """
+
+    MAGIC = b"BOINKFAC"
+    VERSION = 1
+    HEADER_LENGTH_STRUCT = struct.Struct("<I")
+    ALIGNMENT = 64
+    DEFAULT_PATH = Path("resources/faces.bundle")
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if not self._map[:len(self.MAGIC)] == self.MAGIC:
+            raise ValueError(f"{path} is not a face bundle")
+        offset = len(self.MAGIC)
+        (header_length,) = self.HEADER_LENGTH_STRUCT.unpack_from(self._map, offset)
+        offset += self.HEADER_LENGTH_STRUCT.size
+        header = json.loads(self._map[offset:offset + header_length])
+        if header["version"] != self.VERSION:
+            raise ValueError(f"Unsupported face bundle version {header['version']}")
+        self.entries: dict[tuple[str, int], dict[str, int]] = {
+            (entry["path"], entry["diameter"]): entry for entry in header["images"]
+        }
+
+    @staticmethod
+    def _source_mtime(path: Path) -> int | None:
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _surface(self, path: Path, diameter: int) -> pygame.Surface | None:
+        entry = self.entries.get((str(path), diameter))
+        if entry is None or self._source_mtime(path) != entry["mtime_ns"]:
+            return None
+        size = entry["width"] * entry["height"] * 4
+        pixels = memoryview(self._map)[entry["offset"]:entry["offset"] + size]
+        return pygame.image.frombuffer(pixels, (entry["width"], entry["height"]), "RGBA")
+
+    def get(self, face_configuration: FaceConfiguration) -> LoadedFaceConfiguration | None:
+        happy = self._surface(face_configuration.happy_path, face_configuration.diameter)
+        angry = self._surface(face_configuration.angry_path, face_configuration.diameter)
+        if happy is None or angry is None:
+            return None
+        # Converting for the display is a straight pixel copy, and frees the surfaces from the mapping
+        return LoadedFaceConfiguration(happy.convert_alpha(), angry.convert_alpha())
+
+    @classmethod
+    def build(cls, face_configurations: Iterable[FaceConfiguration], path: Path) -> int:
+        """Processes every face image and writes the bundle. Returns how many images went in."""
+        images: dict[tuple[Path, int], pygame.Surface] = {}
+        for face_configuration in face_configurations:
+            for image_path in (face_configuration.happy_path, face_configuration.angry_path):
+                key = (image_path, face_configuration.diameter)
+                if key not in images:
+                    images[key] = LoadedFaceConfiguration.load_circular_image(*key)
+
+        pixels = [pygame.image.tobytes(surface, "RGBA") for surface in images.values()]
+        # Offsets from the start of the pixel data, which begins right after the header
+        relative_offsets = []
+        offset = 0
+        for data in pixels:
+            relative_offsets.append(offset)
+            offset += cls._aligned(len(data))
+
+        # The header's length depends on the offsets inside it, so settle both together
+        pixels_start = 0
+        while True:
+            header = json.dumps(
+                {
+                    "version": cls.VERSION,
+                    "images": [
+                        {
+                            "path": str(image_path),
+                            "diameter": diameter,
+                            "mtime_ns": image_path.stat().st_mtime_ns,
+                            "width": surface.get_width(),
+                            "height": surface.get_height(),
+                            "offset": pixels_start + relative_offset,
+                        }
+                        for ((image_path, diameter), surface), relative_offset in zip(
+                            images.items(), relative_offsets, strict=True
+                        )
+                    ],
+                }
+            ).encode()
+            needed = cls._aligned(len(cls.MAGIC) + cls.HEADER_LENGTH_STRUCT.size + len(header))
+            if needed <= pixels_start:
+                break
+            pixels_start = needed
+
+        with path.open("wb") as file:
+            file.write(cls.MAGIC + cls.HEADER_LENGTH_STRUCT.pack(len(header)) + header)
+            for data in pixels:
+                file.seek(pixels_start)
+                file.write(data)
+                pixels_start += cls._aligned(len(data))
+        return len(images)
+
+    @classmethod
+    def _aligned(cls, size: int) -> int:
+        return -(-size // cls.ALIGNMENT) * cls.ALIGNMENT
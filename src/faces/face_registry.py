@@ -0,0 +1,52 @@
+import pygame
+
+from src.faces.face_bundle import FaceBundle
+from src.faces.face_configuration import FaceConfiguration
+from src.faces.loaded_face_configuration import LoadedFaceConfiguration
+
+
+class FaceRegistry:
+    """
+    Loads each face configuration once and shares the surfaces between all balls and rounds.
+
+    Faces come from the prebuilt bundle when it has them, and are loaded from their images otherwise.
+    Surfaces are converted for the display, so only use this once the window exists.
+    """
+
+    def __init__(self, bundle: FaceBundle | None = None) -> None:
+        self.bundle = bundle
+        self.faces: dict[FaceConfiguration, LoadedFaceConfiguration] = {}
+
+    def get(self, face_configuration: FaceConfiguration) -> LoadedFaceConfiguration:
+        faces = self.faces.get(face_configuration)
+        if faces is not None:
+            return faces
+        faces = self.bundle.get(face_configuration) if self.bundle else None
+        if faces is None:
+            faces = LoadedFaceConfiguration.load(face_configuration)
+        self.faces[face_configuration] = faces
+        return faces
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def report(self) -> str:
+        """Pixel memory held by each loaded face image, and in total."""
+        lines = [f"{'face':<32}{'size':>10}{'memory':>14}"]
+        total = 0
+        for face_configuration, faces in self.faces.items():
+            for path, surface in (
+                (face_configuration.happy_path, faces.happy_surface),
+                (face_configuration.angry_path, faces.angry_surface),
+            ):
+                size = self._surface_bytes(surface)
+                total += size
+                width, height = surface.get_size()
+                lines.append(f"{path!s:<32}{f'{width}x{height}':>10}{size / 1024:>10.1f} KiB")
+            size = sum(self._surface_bytes(frame) for frame in faces.implosion_frames)
+            total += size
+            frames = f"{len(faces.implosion_frames)} frames"
+            lines.append(f"{'  implosion':<32}{frames:>10}{size / 1024:>10.1f} KiB")
+        lines.append(f"{f'{len(self.faces)} face configurations':<42}{total / 1024:>10.1f} KiB")
+        return "\n".join(lines)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from pathlib import Path
 
 import pygame
@@ -6,17 +8,43 @@ from src.faces.face_configuration import FaceConfiguration
 
 
 class LoadedFaceConfiguration:
+    # Shrinking steps of the death animation; more than about one per 30 ms of it can't be seen
+    IMPLOSION_FRAMES = 16
+
     def __init__(
         self,
-        face_configuration: FaceConfiguration,
+        happy_surface: pygame.Surface,
+        angry_surface: pygame.Surface,
     ):
-        self.happy_surface = self.load_circular_image(face_configuration.happy_path, face_configuration.diameter)
-        self.angry_surface = self.load_circular_image(face_configuration.angry_path, face_configuration.diameter)
+        self.happy_surface = happy_surface
+        self.angry_surface = angry_surface
+        self.implosion_frames = self._scale_frames(angry_surface, self.IMPLOSION_FRAMES)
+
+    @staticmethod
+    def _scale_frames(surface: pygame.Surface, count: int) -> list[pygame.Surface]:
+        """The surface smoothly scaled from full size down to 1/count of it, in count even steps."""
+        width, height = surface.get_size()
+        return [
+            pygame.transform.smoothscale(
+                surface,
+                (max(1, round(width * (count - i) / count)), max(1, round(height * (count - i) / count))),
+            )
+            for i in range(count)
+        ]
+
+    @classmethod
+    def load(cls, face_configuration: FaceConfiguration) -> LoadedFaceConfiguration:
+        return cls(
+            cls.load_circular_image(face_configuration.happy_path, face_configuration.diameter).convert_alpha(),
+            cls.load_circular_image(face_configuration.angry_path, face_configuration.diameter).convert_alpha(),
+        )
 
     @staticmethod
     def load_circular_image(path: Path, diameter: int) -> pygame.Surface:
+        """Decodes, scales and masks a face image into a 32-bit RGBA surface; works without a display."""
         # Load and scale the image
-        img = pygame.image.load(str(path)).convert_alpha()
+        loaded = pygame.image.load(str(path))
+        img = pygame.image.frombytes(pygame.image.tobytes(loaded, "RGBA"), loaded.get_size(), "RGBA")
         img = pygame.transform.smoothscale(img, (diameter, diameter))
 
         # Create a circular mask
@@ -25,4 +53,4 @@ class LoadedFaceConfiguration:
 
         # Apply mask to image
         img.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        return img
\ No newline at end of file
+        return img
@@ -1,91 +1,73 @@
+import time
 from collections.abc import Callable
+from pathlib import Path
+from random import Random
 
 import pygame
-import pymunk
 
-from src.collisions.ball_to_ball_collisions import (
-    handle_ball_to_ball_collision,
-    handle_post_ball_to_ball_collision,
-)
+from src.capture.frame_capture import FrameCapture
 from src.configuration.configuration import Configuration
-from src.entity.ball.ball import Ball
 from src.entity.ball.ball_spawn_config import BallSpawnConfig
-from src.entity.wall import Wall
 from src.display.display import Display
+from src.faces.face_bundle import FaceBundle
+from src.faces.face_registry import FaceRegistry
+from src.game.match import Match
+from src.game.match_snapshot import MatchSnapshot
+from src.game.simulation_thread import SimulationThread
+from src.profiling.frame_profiler import FrameProfiler
+from src.replay.replay import Replay
+from src.replay.replay_recorder import ReplayRecorder
 from src.visuals.visual_effect_manager import VisualEffectManager
 
 
 class Game:
-    @staticmethod
-    def _create_walls(
-            space: pymunk.Space,
-            resolution: tuple[int, int],
-            thickness: int = 10,
-    ) -> list[Wall]:
-        width, height = resolution
-        return [
-            Wall(space, (0, 0), (width, 0), thickness),  # Bottom
-            Wall(space, (0, height), (width, height), thickness),  # Top
-            Wall(space, (0, 0), (0, height), thickness),  # Left
-            Wall(space, (width, 0), (width, height), thickness)  # Right
-        ]
-
-    @staticmethod
-    def _create_space() -> pymunk.Space:
-        space = pymunk.Space()
-        space.damping = 1.0
-        space.on_collision(
-            Ball.COLLISION_TYPE,
-            Ball.COLLISION_TYPE,
-            begin=handle_ball_to_ball_collision,
-            separate=handle_post_ball_to_ball_collision,
-        )
-        return space
+    REPLAY_SEEK_SECONDS = 5
+    # The timing overlay is redrawn this often, which keeps it readable and cheap
+    OVERLAY_REFRESH_FRAMES = 15
 
     def __init__(
             self,
             configuration: Configuration,
-            balls_factory: Callable[[], list[BallSpawnConfig]],
+            balls_factory: Callable[[Random], list[BallSpawnConfig]],
+            seed: int | None = None,
+            record_path: Path | None = None,
+            replay: Replay | None = None,
+            face_bundle: FaceBundle | None = None,
+            capture: FrameCapture | None = None,
     ):
+        """
+        The first round uses the given seed, or the replay's seed when watching a replay; later
+        rounds are random. With a record path, the replay of each round is saved there when the
+        round ends, overwriting the previous one. Faces found in the face bundle skip loading their
+        images. With a frame capture, every presented frame is handed to it.
+
+        With a threaded pipeline configured, physics runs on a SimulationThread and frames are
+        drawn from its latest snapshot; the match is only touched with the simulation paused.
+        """
         self.configuration = configuration
-        self.space = self._create_space()
         self.balls_factory = balls_factory
-        self.visual_effect_manager = VisualEffectManager()
+        self.seed = replay.seed if replay else seed
+        self.record_path = record_path
+        self.replay = replay
+        self.capture = capture
+        self.recorder: ReplayRecorder | None = None
+        self.visual_effect_manager = VisualEffectManager(configuration.max_visual_effects)
         
         pygame.init()
         pygame.font.init()
 
         self.display = Display(self.configuration)
+        # Outlives rounds, so each face is only loaded the first time it's needed
+        self.face_registry = FaceRegistry(face_bundle)
+        self.profiler = FrameProfiler()
+        # Times the simulation thread's steps, when there is one
+        self.simulation_profiler = FrameProfiler()
         self.clock = pygame.time.Clock()
+        self.physics_accumulator = 0.0
+        self.frames = 0
 
-    @staticmethod
-    def _get_ball_info(balls: list[Ball]) -> list[dict[str, str | int]]:
-        return [
-            {
-                "name": ball.name,
-                "health": ball.health,
-            }
-            for ball in balls
-        ]
-
-    def step_simulation(self, walls: list[Wall], balls: list[Ball], dt: float) -> None:
-        self.space.step(dt)
-        entities = walls + balls
-        for entity in entities:
-            entity.update(dt)
-            entity.draw(self.display)
-        self.visual_effect_manager.update(dt)
-        self.visual_effect_manager.draw(self.display)
-        self.display.draw_hud(self._get_ball_info(balls))
-        self.display.blit_simulation()
-
-    def run_main_loop(
-            self,
-            walls: list[Wall],
-            balls: list[Ball],
-    ) -> None:
         button_width, button_height = 220, 60
-        button_rect = pygame.Rect(
+        self.button_rect = pygame.Rect(
             (
                 self.configuration.window_width // 2 - button_width // 2,
                 self.configuration.window_height // 2 + 60,
@@ -94,67 +76,233 @@ class Game:
             )
         )
 
-        while True:
-            alive_balls = [ball for ball in balls if ball.health > 0]
-            finished = len(alive_balls) < 2
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    raise InterruptedError()
-                if finished:
-                    if (
-                            (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and button_rect.collidepoint(event.pos)) or
-                            (event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE))
-                    ):
-                        return
-
-            dt = min(
-                self.clock.tick(self.configuration.fps) / 1000.0,
-                1 / self.configuration.fps
-            )
-            self.display.clear()
+    def step_simulation(self, match: Match, frame_seconds: float) -> None:
+        """
+        Advances physics in fixed steps to cover the time since the last frame, then draws.
+
+        Leftover time smaller than a step carries over to the next frame and is used to interpolate
+        the drawn ball positions. If a frame needs more than max_physics_steps_per_frame steps, the
+        excess is dropped so a slow machine can't fall further and further behind.
+        """
+        physics_dt = self.configuration.physics_dt
+        self.physics_accumulator += frame_seconds
+        steps = 0
+        while self.physics_accumulator >= physics_dt and steps < self.configuration.max_physics_steps_per_frame:
+            match.step(physics_dt)
+            self._after_step(match)
+            self.physics_accumulator -= physics_dt
+            steps += 1
+        self.physics_accumulator = min(self.physics_accumulator, physics_dt)
+
+        self.draw(match, self.physics_accumulator / physics_dt)
 
-            self.step_simulation(walls, balls, dt)
+    def _after_step(self, match: Match) -> None:
+        if self.recorder:
+            self.recorder.record()
+        if self.replay:
+            self.replay.sync(match)
 
+    def draw(self, match: Match, alpha: float) -> None:
+        for ball in match.balls:
+            ball.interpolate(alpha)
+        for entity in match.entities:
+            entity.draw(self.display)
+        self.profiler.mark(FrameProfiler.DRAW)
+        self.visual_effect_manager.draw(self.display)
+        self.profiler.mark(FrameProfiler.EFFECTS_DRAW)
+        self.display.draw_hud(match.ball_states.names, match.ball_states.health)
+        self.profiler.mark(FrameProfiler.HUD)
+        self.display.blit_simulation()
+        self.profiler.mark(FrameProfiler.BLIT)
+
+    def draw_snapshot(self, match: Match, snapshot: MatchSnapshot) -> None:
+        """Draws the snapshot, blended towards it by how long ago it was published."""
+        alpha = min(1.0, (time.perf_counter() - snapshot.published_at) / self.configuration.physics_dt)
+        snapshot.apply_render_state(match.balls, alpha)
+        for entity in match.entities:
+            entity.draw(self.display)
+        self.profiler.mark(FrameProfiler.DRAW)
+        for effect in snapshot.effects:
+            effect.draw(self.display)
+        self.profiler.mark(FrameProfiler.EFFECTS_DRAW)
+        self.display.draw_hud(match.ball_states.names, snapshot.health)
+        self.profiler.mark(FrameProfiler.HUD)
+        self.display.blit_simulation()
+        self.profiler.mark(FrameProfiler.BLIT)
+
+    def _overlay_lines(self, alive: int, effects: int, contacts: int) -> list[str]:
+        lines = [f"{'ms':<15}{'p50':>7}{'p95':>7}{'max':>7}"]
+        threaded = self.configuration.threaded_pipeline
+        simulation_phases = FrameProfiler.PHASE_NAMES[:FrameProfiler.EFFECTS_UPDATE + 1]
+        for name, p50, p95, maximum in self.profiler.summary():
+            if not (threaded and name in simulation_phases):
+                lines.append(f"{name:<15}{p50:>7.2f}{p95:>7.2f}{maximum:>7.2f}")
+        if threaded:
+            for name, p50, p95, maximum in self.simulation_profiler.summary():
+                if name in simulation_phases or name == "total":
+                    name = "step" if name == "total" else name
+                    lines.append(f"{name:<15}{p50:>7.2f}{p95:>7.2f}{maximum:>7.2f}")
+        lines.append(f"balls {alive}  effects {effects}  contacts {contacts}")
+        return lines
+
+    def _handle_events(self, finished: bool, seek: Callable[[int], bool]) -> bool:
+        """
+        Handles the input since the last frame, and returns whether to move on to the next round.
+
+        seek moves a replay by a number of steps and returns whether the match is then finished.
+        """
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                raise InterruptedError()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.enabled = not self.profiler.enabled
+                self.simulation_profiler.enabled = self.profiler.enabled
+                if not self.profiler.enabled:
+                    self.display.hide_overlay()
+                continue
+            if self.replay and event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                direction = 1 if event.key == pygame.K_RIGHT else -1
+                finished = seek(direction * self.REPLAY_SEEK_SECONDS * self.configuration.physics_hz)
+                continue
             if finished:
-                overlay = pygame.Surface(
-                    (self.configuration.window_width, self.configuration.window_height),
-                    pygame.SRCALPHA,
-                )
-                overlay.fill((0, 0, 0, 96))  # 96/255 alpha for subtle dimming
-                self.display.screen.blit(overlay, (0, 0))
-
-                winner_name = alive_balls[0].name if len(alive_balls) == 1 else "No one"
-                winner_text = f"{winner_name} won!!"
-                font = pygame.font.SysFont('Arial', 48, bold=True)
-                text_surf = font.render(winner_text, True, (255, 215, 0))
-                text_rect = text_surf.get_rect(
-                    center=(self.configuration.window_width // 2, self.configuration.window_height // 2)
-                )
-                self.display.screen.blit(text_surf, text_rect)
-
-                button_font = pygame.font.SysFont('Arial', 36, bold=True)
-                self.display.draw_fight_again_button(button_rect, button_font)
-
-            self.display.flip()
+                if (
+                        (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.button_rect.collidepoint(event.pos)) or
+                        (event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE))
+                ):
+                    return True
+        return False
 
-    def run(self) -> None:
+    def _seek(self, match: Match, seek_steps: int) -> bool:
+        assert self.replay is not None
+        self.replay.seek(match, match.steps + seek_steps)
+        return match.is_finished()
+
+    def run_main_loop(self, match: Match) -> None:
+        if self.configuration.threaded_pipeline:
+            self.run_pipelined_loop(match)
+            return
+        self.physics_accumulator = 0.0
+        self.clock.tick()
+        while not self._handle_events(match.is_finished(), lambda seek_steps: self._seek(match, seek_steps)):
+            self.render_frame(match, self.clock.tick(self.configuration.fps) / 1000.0)
+
+    def run_pipelined_loop(self, match: Match) -> None:
+        simulation = SimulationThread(match, self.simulation_profiler, self._after_step)
+
+        def seek(seek_steps: int) -> bool:
+            with simulation.paused():
+                return self._seek(match, seek_steps)
+
+        simulation.start()
         try:
-            while True:
-                self.space = self._create_space()
+            while not self._handle_events(simulation.buffer.latest().finished, seek):
+                self.clock.tick(self.configuration.fps)
+                simulation.check()
+                self.render_snapshot_frame(match, simulation.buffer.latest())
+        finally:
+            simulation.stop()
+
+    def render_snapshot_frame(self, match: Match, snapshot: MatchSnapshot) -> None:
+        """Presents a frame drawn from the snapshot, leaving the match itself alone."""
+        self.profiler.begin_frame()
+        self.display.clear()
+        self.profiler.mark(FrameProfiler.PRESENT)
+        self.draw_snapshot(match, snapshot)
+        self._present(
+            snapshot.finished,
+            snapshot.winner,
+            lambda: self._overlay_lines(snapshot.alive_count, len(snapshot.effects), snapshot.contacts),
+        )
+
+    def render_frame(self, match: Match, frame_seconds: float) -> None:
+        """Advances the match by frame_seconds and presents the frame."""
+        finished = match.is_finished()
+        self.profiler.begin_frame()
+        self.display.clear()
+        self.profiler.mark(FrameProfiler.PRESENT)
+
+        self.step_simulation(match, frame_seconds)
+
+        winner = match.winner() if finished else None
+        self._present(
+            finished,
+            winner.name if winner else None,
+            lambda: self._overlay_lines(
+                match.ball_states.alive_count(),
+                len(self.visual_effect_manager),
+                match.count_contacts(),
+            ),
+        )
+
+    def render_streamed_frame(self, match: Match, alpha: float) -> None:
+        """
+        Presents a frame of a match that is moved from outside rather than stepped here, as a
+        spectator's is; alpha is how far to blend from the previous state to the current one.
+        """
+        finished = match.is_finished()
+        # Rounds move on when the stream does, so only quitting and the overlay matter here
+        self._handle_events(finished, lambda _seek_steps: finished)
+        self.profiler.begin_frame()
+        self.display.clear()
+        self.profiler.mark(FrameProfiler.PRESENT)
+        self.draw(match, alpha)
+        winner = match.winner() if finished else None
+        self._present(
+            finished,
+            winner.name if winner else None,
+            lambda: self._overlay_lines(match.ball_states.alive_count(), len(self.visual_effect_manager), 0),
+        )
+
+    def _present(self, finished: bool, winner_name: str | None, overlay_lines: Callable[[], list[str]]) -> None:
+        """Shows the end screen and overlay as needed, then presents and captures the frame."""
+        if finished:
+            self.display.show_end_screen(f"{winner_name or 'No one'} won!!", self.button_rect)
+        else:
+            self.display.hide_end_screen()
+
+        self.frames += 1
+        if self.profiler.enabled and self.frames % self.OVERLAY_REFRESH_FRAMES == 0:
+            self.display.show_overlay(overlay_lines())
 
-                walls = self._create_walls(self.space, self.configuration.sim_size)
+        self.display.flip()
+        self.profiler.mark(FrameProfiler.PRESENT)
+        if self.capture:
+            self.capture.capture(self.display.screen)
+            self.profiler.mark(FrameProfiler.CAPTURE)
+        self.profiler.end_frame()
 
-                ball_spawn_configs = self.balls_factory()
-                balls = [
-                    Ball(
-                        spawn_config,
-                        self.space,
-                        self.visual_effect_manager,
-                    )
-                    for spawn_config in ball_spawn_configs
-                ]
+    def start_round(self) -> Match:
+        """Creates the next round's match and sets up recording and the static layer for it."""
+        match = Match(
+            self.configuration,
+            self.balls_factory,
+            self.visual_effect_manager,
+            seed=self.seed,
+            face_registry=self.face_registry,
+            profiler=self.simulation_profiler if self.configuration.threaded_pipeline else self.profiler,
+        )
+        if self.replay:
+            self.replay.check_compatible(match)
+        self.recorder = ReplayRecorder(match) if self.record_path and not self.replay else None
+        self.physics_accumulator = 0.0
+
+        self.display.hide_end_screen()
+        self.display.reset_static_layer()
+        for entity in match.entities:
+            entity.draw_static(self.display)
+        return match
 
-                self.run_main_loop(walls, balls)
+    def run(self) -> None:
+        try:
+            while True:
+                match = self.start_round()
+                try:
+                    self.run_main_loop(match)
+                finally:
+                    if self.recorder and self.record_path:
+                        self.recorder.replay().save(self.record_path)
+                # Only the first round replays or uses the requested seed
+                self.seed = None
+                self.replay = None
         except InterruptedError:
             print("Exiting...")
@@ -0,0 +1,44 @@
+from collections.abc import Callable
+from random import Random
+
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_spawn_config import BallSpawnConfig
+from src.game.match import Match
+from src.game.match_result import MatchResult
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+
+class HeadlessGame:
+    """
+    Plays matches without a window, stepping the simulation as fast as the CPU allows.
+
+    Time advances in the same fixed physics steps the windowed game uses, so a match plays out
+    the same way it would on screen. Matches still running after the configured stalemate timeout are
+    stopped and reported as timed out with no winner.
+    """
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            balls_factory: Callable[[Random], list[BallSpawnConfig]],
+    ):
+        self.configuration = configuration
+        self.balls_factory = balls_factory
+
+    def run(self, seed: int | None = None) -> MatchResult:
+        match = Match(
+            self.configuration,
+            self.balls_factory,
+            VisualEffectManager(self.configuration.max_visual_effects),
+            seed=seed,
+        )
+        return self.finish(match)
+
+    def finish(self, match: Match) -> MatchResult:
+        """Plays an already started match to its end."""
+        dt = self.configuration.physics_dt
+        while not match.is_finished():
+            if match.elapsed_seconds >= self.configuration.stalemate_timeout_seconds:
+                return match.result(timed_out=True)
+            match.step(dt)
+        return match.result()
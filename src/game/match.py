@@ -0,0 +1,234 @@
+import functools
+import random
+import sys
+from collections.abc import Callable
+
+import numpy as np
+import pymunk
+
+from src.collisions.ball_to_ball_collisions import (
+    handle_ball_to_ball_collision,
+    handle_post_ball_to_ball_collision,
+    record_ball_to_ball_collision,
+    resolve_ball_to_ball_contacts,
+)
+from src.collisions.contact_buffer import ContactBuffer
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball import Ball
+from src.entity.ball.ball_spawn_config import BallSpawnConfig
+from src.entity.ball.ball_states import BallStates
+from src.entity.entity import Entity
+from src.entity.wall import Wall
+from src.faces.face_registry import FaceRegistry
+from src.game.match_result import MatchResult
+from src.profiling.frame_profiler import FrameProfiler
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+
+class Match:
+    """A single round: the physics space with its walls and balls."""
+
+    @staticmethod
+    def _create_walls(
+            space: pymunk.Space,
+            resolution: tuple[int, int],
+            thickness: int = 10,
+    ) -> list[Wall]:
+        width, height = resolution
+        return [
+            Wall(space, (0, 0), (width, 0), thickness),  # Bottom
+            Wall(space, (0, height), (width, height), thickness),  # Top
+            Wall(space, (0, 0), (0, height), thickness),  # Left
+            Wall(space, (width, 0), (width, height), thickness)  # Right
+        ]
+
+    @staticmethod
+    def _index_space(space: pymunk.Space, configuration: Configuration, ball_count: int) -> None:
+        if configuration.spatial_hash:
+            # Cells the size of a ball, and about ten per ball as pymunk suggests
+            space.use_spatial_hash(2 * configuration.ball_radius, 10 * ball_count)
+
+    @staticmethod
+    def _create_space(
+            configuration: Configuration,
+            ball_count: int,
+            rng: random.Random,
+            contacts: ContactBuffer | None,
+    ) -> pymunk.Space:
+        threaded = configuration.solver_threads > 1 and sys.platform != "win32"
+        space = pymunk.Space(threaded=threaded)
+        if threaded:
+            space.threads = configuration.solver_threads
+        Match._index_space(space, configuration, ball_count)
+        space.damping = 1.0
+        Match._handle_collisions(space, configuration, rng, contacts)
+        return space
+
+    @staticmethod
+    def _handle_collisions(
+            space: pymunk.Space,
+            configuration: Configuration,
+            rng: random.Random,
+            contacts: ContactBuffer | None,
+    ) -> None:
+        if contacts is not None:
+            # Dead balls are removed when their contacts are resolved, so there's no separate handler
+            space.on_collision(
+                Ball.COLLISION_TYPE,
+                Ball.COLLISION_TYPE,
+                begin=record_ball_to_ball_collision,
+                data=contacts,
+            )
+        else:
+            space.on_collision(
+                Ball.COLLISION_TYPE,
+                Ball.COLLISION_TYPE,
+                begin=functools.partial(handle_ball_to_ball_collision, balance=configuration.balance),
+                separate=handle_post_ball_to_ball_collision,
+                data=rng,
+            )
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            balls_factory: Callable[[random.Random], list[BallSpawnConfig]],
+            visual_effect_manager: VisualEffectManager,
+            seed: int | None = None,
+            face_registry: FaceRegistry | None = None,
+            profiler: FrameProfiler | None = None,
+    ):
+        self.configuration = configuration
+        self.profiler = profiler or FrameProfiler()
+        self.visual_effect_manager = visual_effect_manager
+        # Every random choice in the match draws from this stream, so the seed reproduces it
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        spawn_configs = balls_factory(self.rng)
+        self.contacts = ContactBuffer() if self.configuration.batched_collisions else None
+        self.space = self._create_space(self.configuration, len(spawn_configs), self.rng, self.contacts)
+        self.walls = self._create_walls(self.space, self.configuration.sim_size)
+        self.ball_states = BallStates(
+            [spawn_config.name or spawn_config.prototype.name for spawn_config in spawn_configs]
+        )
+        self.balls = [
+            Ball(
+                spawn_config,
+                self.space,
+                self.visual_effect_manager,
+                self.ball_states,
+                index,
+                face_registry=face_registry,
+            )
+            for index, spawn_config in enumerate(spawn_configs)
+        ]
+        self.ball_states.index_bodies()
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.steps = 0
+        self.elapsed_seconds = 0.0
+        # Set by diverge, and mixed into the random streams from then on
+        self.branch: int | None = None
+
+    def _restart_random_streams(self) -> None:
+        key = f"{self.seed}:{self.steps}" if self.branch is None else f"{self.seed}:{self.steps}:{self.branch}"
+        self.rng.seed(key)
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+
+    def diverge(self, branch: int) -> None:
+        """
+        Gives the match random streams of its own from this step on, so what-if continuations of
+        one state, each with a different branch, play out differently.
+        """
+        self.branch = branch
+        self._restart_random_streams()
+
+    def relink(self) -> None:
+        """
+        Call after unpickling a match. Restores what pickling doesn't keep: each body's link to its
+        ball, which would make a cycle pickle can't rebuild, the balls' body ids, which pymunk
+        assigns anew, the spatial hash, which pymunk swaps back for its default index, and the
+        collision handlers' data, which older pymunk versions drop.
+        """
+        for ball in self.balls:
+            ball.body.user_data = ball
+            self.ball_states.body_ids[ball.index] = ball.body.id
+        self.ball_states.index_bodies()
+        self._index_space(self.space, self.configuration, len(self.balls))
+        self._handle_collisions(self.space, self.configuration, self.rng, self.contacts)
+
+    @property
+    def entities(self) -> list[Entity]:
+        return [*self.walls, *self.balls]
+
+    def step(self, dt: float) -> None:
+        if self.steps % self.configuration.keyframe_interval_steps == 0:
+            # Restart the random stream at every keyframe, so replaying from a keyframe only needs the seed
+            self._restart_random_streams()
+        for ball in self.balls:
+            ball.save_previous_state()
+        if self.contacts is not None:
+            self.contacts.clear()
+        self.space.step(dt)
+        if self.contacts is not None:
+            resolve_ball_to_ball_contacts(
+                self.contacts,
+                self.ball_states,
+                self.balls,
+                self.np_rng,
+                self.configuration.balance,
+            )
+        balance = self.configuration.balance
+        self.ball_states.apply_speedup(
+            self.space,
+            self.np_rng,
+            balance.speedup_chance,
+            balance.speedup_rate,
+            balance.velocity_cap,
+        )
+        self.profiler.mark(FrameProfiler.PHYSICS)
+        self.ball_states.modifiers.update(dt)
+        for entity in self.entities:
+            entity.update(dt)
+        self.profiler.mark(FrameProfiler.UPDATE)
+        self.visual_effect_manager.update(dt)
+        self.profiler.mark(FrameProfiler.EFFECTS_UPDATE)
+        self.steps += 1
+        self.elapsed_seconds += dt
+
+    def count_contacts(self) -> int:
+        """Ball-to-ball contacts that began in the last step."""
+        if self.contacts is not None:
+            return len(self.contacts)
+        count = 0
+
+        def count_new_ball_contact(arbiter: pymunk.Arbiter) -> None:
+            nonlocal count
+            shape_a, shape_b = arbiter.shapes
+            if arbiter.is_first_contact and shape_a.collision_type == shape_b.collision_type:
+                count += 1
+
+        for ball in self.alive_balls():
+            ball.body.each_arbiter(count_new_ball_contact)
+        # Every contact was seen from both of its balls
+        return count // 2
+
+    def alive_balls(self) -> list[Ball]:
+        return [self.balls[index] for index in self.ball_states.alive_indices()]
+
+    def is_finished(self) -> bool:
+        return self.ball_states.alive_count() < 2
+
+    def winner(self) -> Ball | None:
+        alive_balls = self.alive_balls()
+        return alive_balls[0] if len(alive_balls) == 1 else None
+
+    def result(self, timed_out: bool = False) -> MatchResult:
+        winner = None if timed_out else self.winner()
+        return MatchResult(
+            seed=self.seed,
+            winner=winner.name if winner else None,
+            duration_seconds=self.elapsed_seconds,
+            final_health={ball.name: ball.health for ball in self.balls},
+            damage_dealt={ball.name: ball.damage_dealt for ball in self.balls},
+            prototypes={ball.name: ball.prototype.name for ball in self.balls},
+            timed_out=timed_out,
+        )
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    seed: int
+    winner: str | None
+    duration_seconds: float
+    final_health: dict[str, int]
+    damage_dealt: dict[str, int]
+    timed_out: bool = False
+    # The prototype of each ball, by ball name, for arenas where balls share prototypes
+    prototypes: dict[str, str] = field(default_factory=dict)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pymunk
+
+from src.entity.ball.ball import Ball
+from src.game.match import Match
+from src.visuals.visual_effect import VisualEffect
+
+
+@dataclass(frozen=True)
+class MatchSnapshot:
+    """
+    Everything needed to draw a match as of one physics step, safe to read while the match moves on.
+
+    Arrays are indexed like the match's balls and are read-only. Previous positions and angles are
+    the snapshot before's, so a frame can blend between the two steps. Effects are copies owned by
+    the snapshot.
+    """
+
+    steps: int
+    published_at: float
+    previous_positions: npt.NDArray[np.float64]
+    positions: npt.NDArray[np.float64]
+    previous_angles: npt.NDArray[np.float64]
+    angles: npt.NDArray[np.float64]
+    health: npt.NDArray[np.int64]
+    angry: npt.NDArray[np.bool_]
+    pulse_alphas: npt.NDArray[np.int64]
+    effects: tuple[VisualEffect, ...]
+    finished: bool
+    winner: str | None
+    alive_count: int
+    contacts: int
+
+    @classmethod
+    def capture(cls, match: Match, previous: MatchSnapshot | None, published_at: float) -> MatchSnapshot:
+        """Call between steps. Without a previous snapshot, the frame doesn't blend from anywhere."""
+        states = match.ball_states
+        positions, angles = states.read_poses(match.space)
+        winner = match.winner()
+        snapshot = cls(
+            steps=match.steps,
+            published_at=published_at,
+            previous_positions=previous.positions if previous else positions,
+            positions=positions,
+            previous_angles=previous.angles if previous else angles,
+            angles=angles,
+            health=states.health.copy(),
+            angry=states.modifiers.angry_mask(),
+            pulse_alphas=states.modifiers.get_pulse_alphas(),
+            effects=match.visual_effect_manager.snapshot(),
+            finished=match.is_finished(),
+            winner=winner.name if winner else None,
+            alive_count=states.alive_count(),
+            # Only the profiler's overlay shows it, and counting walks every ball's arbiters
+            contacts=match.count_contacts() if match.profiler.enabled else 0,
+        )
+        for array in (snapshot.positions, snapshot.angles, snapshot.health, snapshot.angry, snapshot.pulse_alphas):
+            array.flags.writeable = False
+        return snapshot
+
+    def apply_render_state(self, balls: list[Ball], alpha: float) -> None:
+        """Sets each ball's render state to the blend of the previous and this step; alpha is how far to blend."""
+        positions = self.previous_positions + (self.positions - self.previous_positions) * alpha
+        angles = self.previous_angles + (self.angles - self.previous_angles) * alpha
+        for index, ball in enumerate(balls):
+            ball.set_render_state(
+                pymunk.Vec2d(float(positions[index, 0]), float(positions[index, 1])),
+                float(angles[index]),
+                int(self.health[index]),
+                bool(self.angry[index]),
+                int(self.pulse_alphas[index]),
+            )
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from src.game.match import Match
+from src.game.match_snapshot import MatchSnapshot
+from src.game.snapshot_buffer import SnapshotBuffer
+from src.profiling.frame_profiler import FrameProfiler
+
+
+class SimulationThread:
+    """
+    Steps a match in real time on its own thread, publishing a snapshot after every step.
+
+    Steps are paced by the wall clock at the physics rate. If the thread falls more than
+    max_physics_steps_per_frame steps behind, the excess is dropped, as the single-threaded loop
+    does. after_step runs on this thread after each step, before the snapshot is taken. The
+    profiler times each step as one of its frames.
+    """
+
+    def __init__(
+            self,
+            match: Match,
+            profiler: FrameProfiler,
+            after_step: Callable[[Match], None],
+    ) -> None:
+        self.match = match
+        self.profiler = profiler
+        self.after_step = after_step
+        self.buffer = SnapshotBuffer()
+        self.lock = threading.Lock()
+        self.error: Exception | None = None
+        self._previous: MatchSnapshot | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+
+    def start(self) -> None:
+        self._publish()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def check(self) -> None:
+        """Raises whatever stopped the thread, on the calling thread."""
+        if self.error is not None:
+            raise self.error
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Holds the simulation between steps so the match can be changed, then republishes it."""
+        with self.lock:
+            yield
+            # Whatever changed, there's no sense blending from before it
+            self._previous = None
+            self._publish()
+
+    def _publish(self) -> None:
+        self._previous = MatchSnapshot.capture(self.match, self._previous, time.perf_counter())
+        self.buffer.publish(self._previous)
+
+    def _run(self) -> None:
+        configuration = self.match.configuration
+        dt = configuration.physics_dt
+        max_lag = configuration.max_physics_steps_per_frame * dt
+        next_step = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                now = time.perf_counter()
+                if now < next_step:
+                    self._stop.wait(next_step - now)
+                    continue
+                next_step = max(next_step, now - max_lag) + dt
+                with self.lock:
+                    self.profiler.begin_frame()
+                    self.match.step(dt)
+                    self.after_step(self.match)
+                    self._publish()
+                    self.profiler.end_frame()
+        except Exception as e:
+            self.error = e
+            raise
@@ -0,0 +1,25 @@
+import threading
+
+from src.game.match_snapshot import MatchSnapshot
+
+
+class SnapshotBuffer:
+    """
+    Hands match snapshots from the simulation to the renderer.
+
+    Publishing atomically replaces the latest snapshot with a new one. Snapshots are immutable
+    once built, so the renderer can keep drawing the one it took while newer ones are published.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._front: MatchSnapshot | None = None
+
+    def publish(self, snapshot: MatchSnapshot) -> None:
+        with self._lock:
+            self._front = snapshot
+
+    def latest(self) -> MatchSnapshot:
+        with self._lock:
+            assert self._front is not None, "Nothing has been published yet"
+            return self._front
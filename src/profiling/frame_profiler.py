@@ -0,0 +1,75 @@
+import time
+
+import numpy as np
+import numpy.typing as npt
+
+
+class FrameProfiler:
+    """
+    Times the phases of each frame into a ring buffer of recent frames.
+
+    Code marks the end of each phase as it goes; the time since the previous mark is added to that
+    phase, so physics phases add up over however many steps a frame runs. While disabled, every
+    call returns straight away. Enabling takes effect from the next frame.
+    """
+
+    PHYSICS, UPDATE, EFFECTS_UPDATE, DRAW, EFFECTS_DRAW, HUD, BLIT, PRESENT, CAPTURE = range(9)
+    PHASE_NAMES = (
+        "physics",
+        "update",
+        "effects update",
+        "draw",
+        "effects draw",
+        "hud",
+        "blit",
+        "present",
+        "capture",
+    )
+
+    def __init__(self, frames: int = 240) -> None:
+        self.enabled = False
+        self.times: npt.NDArray[np.int64] = np.zeros((frames, len(self.PHASE_NAMES)), dtype=np.int64)
+        self.filled = 0
+        self._frame = 0
+        self._recording = False
+        self._row = [0] * len(self.PHASE_NAMES)
+        self._last = 0
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            self._recording = False
+            return
+        if not self._recording:
+            # Starting afresh, so old frames from before it was last disabled don't count
+            self.filled = 0
+            self._frame = 0
+            self._recording = True
+        self._row = [0] * len(self.PHASE_NAMES)
+        self._last = time.perf_counter_ns()
+
+    def mark(self, phase: int) -> None:
+        if not self._recording:
+            return
+        now = time.perf_counter_ns()
+        self._row[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        if not self._recording:
+            return
+        self.times[self._frame] = self._row
+        self._frame = (self._frame + 1) % len(self.times)
+        self.filled = min(self.filled + 1, len(self.times))
+
+    def summary(self) -> list[tuple[str, float, float, float]]:
+        """p50, p95 and max milliseconds of each phase, and of whole frames, over the recorded frames."""
+        if self.filled == 0:
+            return []
+        times = self.times[:self.filled] if self.filled < len(self.times) else self.times
+        rows = np.column_stack([times, times.sum(axis=1)]) / 1e6
+        p50, p95 = np.percentile(rows, [50, 95], axis=0)
+        maximum = rows.max(axis=0)
+        return [
+            (name, float(p50[i]), float(p95[i]), float(maximum[i]))
+            for i, name in enumerate((*self.PHASE_NAMES, "total"))
+        ]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pymunk
+
+if TYPE_CHECKING:
+    from src.game.match import Match
+
+
+@dataclass(frozen=True)
+class BallKeyframe:
+    position: tuple[float, float]
+    velocity: tuple[float, float]
+    angle: float
+    angular_velocity: float
+    health: int
+    damage_dealt: int
+
+    STRUCT = struct.Struct("<6d2i")
+
+    def pack(self) -> bytes:
+        return self.STRUCT.pack(
+            *self.position,
+            *self.velocity,
+            self.angle,
+            self.angular_velocity,
+            self.health,
+            self.damage_dealt,
+        )
+
+    @classmethod
+    def unpack_from(cls, buffer: bytes, offset: int) -> BallKeyframe:
+        x, y, vx, vy, angle, angular_velocity, health, damage_dealt = cls.STRUCT.unpack_from(buffer, offset)
+        return cls((x, y), (vx, vy), angle, angular_velocity, health, damage_dealt)
+
+
+@dataclass(frozen=True)
+class Keyframe:
+    """The state of every ball at the start of a physics step, enough to resume the match from there."""
+
+    step: int
+    balls: tuple[BallKeyframe, ...]
+
+    STEP_STRUCT = struct.Struct("<I")
+
+    @classmethod
+    def capture(cls, match: Match) -> Keyframe:
+        return cls(
+            step=match.steps,
+            balls=tuple(
+                BallKeyframe(
+                    position=(ball.body.position.x, ball.body.position.y),
+                    velocity=(ball.body.velocity.x, ball.body.velocity.y),
+                    angle=ball.body.angle,
+                    angular_velocity=ball.body.angular_velocity,
+                    health=ball.health,
+                    damage_dealt=ball.damage_dealt,
+                )
+                for ball in match.balls
+            ),
+        )
+
+    def restore(self, match: Match) -> None:
+        """
+        Puts the match back in this state.
+
+        Pymunk's contact cache isn't part of a keyframe, so the physics after a restore can drift
+        very slightly from the original run; see Replay.sync.
+        """
+        # Re-add every living ball in spawn order, so the solver visits bodies in the same order
+        # as in the original run
+        for ball in match.balls:
+            if ball.body in match.space.bodies:
+                match.space.remove(ball.body, ball.shape)
+
+        for ball, state in zip(match.balls, self.balls, strict=True):
+            ball.health = state.health
+            ball.damage_dealt = state.damage_dealt
+            ball.body.position = pymunk.Vec2d(*state.position)
+            ball.body.velocity = pymunk.Vec2d(*state.velocity)
+            ball.body.angle = state.angle
+            ball.body.angular_velocity = state.angular_velocity
+            ball.save_previous_state()
+            if ball.health > 0:
+                match.space.add(ball.body, ball.shape)
+
+        match.steps = self.step
+        match.elapsed_seconds = self.step * match.configuration.physics_dt
+
+    def pack(self) -> bytes:
+        return self.STEP_STRUCT.pack(self.step) + b"".join(ball.pack() for ball in self.balls)
+
+    @classmethod
+    def unpack_from(cls, buffer: bytes, offset: int, ball_count: int) -> Keyframe:
+        (step,) = cls.STEP_STRUCT.unpack_from(buffer, offset)
+        offset += cls.STEP_STRUCT.size
+        balls = tuple(
+            BallKeyframe.unpack_from(buffer, offset + i * BallKeyframe.STRUCT.size)
+            for i in range(ball_count)
+        )
+        return cls(step, balls)
+
+    @classmethod
+    def packed_size(cls, ball_count: int) -> int:
+        return cls.STEP_STRUCT.size + ball_count * BallKeyframe.STRUCT.size
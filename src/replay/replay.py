@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.replay.keyframe import Keyframe
+
+if TYPE_CHECKING:
+    from src.game.match import Match
+
+
+@dataclass(frozen=True)
+class Replay:
+    """
+    A recorded match: its seed plus keyframes taken every keyframe_interval_steps physics steps.
+
+    Re-running the match from the seed reproduces it exactly; the keyframes make seeking cheap,
+    since only the steps after the nearest keyframe have to be simulated again.
+    """
+
+    seed: int
+    ball_names: tuple[str, ...]
+    physics_hz: int
+    keyframe_interval_steps: int
+    total_steps: int
+    keyframes: tuple[Keyframe, ...]
+
+    MAGIC = b"BOINKRPL"
+    VERSION = 2
+    HEADER_LENGTH_STRUCT = struct.Struct("<I")
+
+    def check_compatible(self, match: Match) -> None:
+        names = tuple(ball.name for ball in match.balls)
+        if match.seed != self.seed or names != self.ball_names:
+            raise ValueError(f"Replay of {self.ball_names} with seed {self.seed} doesn't match this match")
+        if (
+            match.configuration.physics_hz != self.physics_hz
+            or match.configuration.keyframe_interval_steps != self.keyframe_interval_steps
+        ):
+            raise ValueError("Replay was recorded with a different physics rate or keyframe interval")
+
+    def keyframe_at_or_before(self, step: int) -> Keyframe:
+        index = min(step // self.keyframe_interval_steps, len(self.keyframes) - 1)
+        return self.keyframes[max(0, index)]
+
+    def seek(self, match: Match, step: int) -> None:
+        """Jumps the match to the given step by restoring the nearest keyframe and simulating the rest."""
+        step = max(0, min(step, self.total_steps))
+        self.keyframe_at_or_before(step).restore(match)
+        match.visual_effect_manager.clear()
+        match.ball_states.modifiers.clear()
+        while match.steps < step:
+            match.step(match.configuration.physics_dt)
+
+    def sync(self, match: Match) -> None:
+        """
+        Call after every step while playing back. Snaps the match to the recorded keyframe when it
+        reaches one and has drifted, which can only happen after a seek, so drift never outlasts
+        one keyframe interval.
+        """
+        if match.steps % self.keyframe_interval_steps != 0 or match.steps > self.total_steps:
+            return
+        keyframe = self.keyframe_at_or_before(match.steps)
+        if keyframe.step == match.steps and Keyframe.capture(match) != keyframe:
+            keyframe.restore(match)
+
+    def save(self, path: Path) -> None:
+        header = json.dumps(
+            {
+                "version": self.VERSION,
+                "seed": self.seed,
+                "ball_names": self.ball_names,
+                "physics_hz": self.physics_hz,
+                "keyframe_interval_steps": self.keyframe_interval_steps,
+                "total_steps": self.total_steps,
+                "keyframe_count": len(self.keyframes),
+            }
+        ).encode()
+        payload = b"".join(
+            [
+                self.HEADER_LENGTH_STRUCT.pack(len(header)),
+                header,
+                *(keyframe.pack() for keyframe in self.keyframes),
+            ]
+        )
+        path.write_bytes(self.MAGIC + zlib.compress(payload, level=9))
+
+    @classmethod
+    def load(cls, path: Path) -> Replay:
+        data = path.read_bytes()
+        if not data.startswith(cls.MAGIC):
+            raise ValueError(f"{path} is not a replay file")
+        payload = zlib.decompress(data[len(cls.MAGIC):])
+
+        (header_length,) = cls.HEADER_LENGTH_STRUCT.unpack_from(payload, 0)
+        offset = cls.HEADER_LENGTH_STRUCT.size
+        header = json.loads(payload[offset:offset + header_length])
+        if header["version"] != cls.VERSION:
+            raise ValueError(f"Unsupported replay version {header['version']}")
+        offset += header_length
+
+        ball_count = len(header["ball_names"])
+        keyframe_size = Keyframe.packed_size(ball_count)
+        keyframes = tuple(
+            Keyframe.unpack_from(payload, offset + i * keyframe_size, ball_count)
+            for i in range(header["keyframe_count"])
+        )
+        return cls(
+            seed=header["seed"],
+            ball_names=tuple(header["ball_names"]),
+            physics_hz=header["physics_hz"],
+            keyframe_interval_steps=header["keyframe_interval_steps"],
+            total_steps=header["total_steps"],
+            keyframes=keyframes,
+        )
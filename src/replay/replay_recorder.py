@@ -0,0 +1,26 @@
+from src.game.match import Match
+from src.replay.keyframe import Keyframe
+from src.replay.replay import Replay
+
+
+class ReplayRecorder:
+    """Captures a keyframe every time the match reaches a keyframe boundary."""
+
+    def __init__(self, match: Match) -> None:
+        self.match = match
+        self.keyframes: list[Keyframe] = [Keyframe.capture(match)]
+
+    def record(self) -> None:
+        """Call after every physics step."""
+        if self.match.steps % self.match.configuration.keyframe_interval_steps == 0:
+            self.keyframes.append(Keyframe.capture(self.match))
+
+    def replay(self) -> Replay:
+        return Replay(
+            seed=self.match.seed,
+            ball_names=tuple(ball.name for ball in self.match.balls),
+            physics_hz=self.match.configuration.physics_hz,
+            keyframe_interval_steps=self.match.configuration.keyframe_interval_steps,
+            total_steps=self.match.steps,
+            keyframes=tuple(self.keyframes),
+        )
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import numpy as np
+import pymunk
+
+from src.game.game import Game
+from src.game.match import Match
+from src.spectate.state_decoder import StateDecoder
+from src.spectate.state_encoder import StateEncoder
+from src.spectate.stream_header import StreamHeader
+from src.spectate.streamed_step import StreamedStep
+
+
+class SpectatorClient:
+    """
+    Watches the matches of a SpectatorServer through a game's display.
+
+    Each round's balls are rebuilt from the streamed seed with the game's own ball factory, so
+    both ends need the same ball prototypes and configuration. The match is never stepped here:
+    every streamed step sets the balls' poses and health, and replays the step's hits and deaths
+    so the same effects play. Frames blend between the last two steps, as the game does.
+    """
+
+    def __init__(self, game: Game, host: str, port: int) -> None:
+        self.game = game
+        self.host = host
+        self.port = port
+        self.match: Match | None = None
+        self._pending: list[StreamHeader | StreamedStep] = []
+        self._stepped_at = time.perf_counter()
+
+    async def run(self) -> None:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        receiving = asyncio.create_task(self._receive(reader))
+        frame_seconds = 1.0 / self.game.configuration.fps
+        next_frame = time.perf_counter()
+        try:
+            while not receiving.done():
+                self._apply_pending()
+                if self.match is not None:
+                    alpha = (time.perf_counter() - self._stepped_at) / self.game.configuration.physics_dt
+                    self.game.render_streamed_frame(self.match, min(1.0, alpha))
+                next_frame = max(next_frame + frame_seconds, time.perf_counter())
+                await asyncio.sleep(next_frame - time.perf_counter())
+            # Raises whatever ended the stream, if it wasn't the server hanging up
+            receiving.result()
+            print("The server closed the stream")
+        finally:
+            receiving.cancel()
+            writer.close()
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        decoder: StateDecoder | None = None
+        while True:
+            try:
+                frame = await reader.readexactly(StateEncoder.FRAME_STRUCT.size)
+            except asyncio.IncompleteReadError:
+                return
+            length, kind = StateEncoder.FRAME_STRUCT.unpack(frame)
+            kind, body = StateDecoder.unframe(kind, await reader.readexactly(length))
+            if kind == StateEncoder.HEADER:
+                header = StreamHeader.unpack(body)
+                decoder = StateDecoder(len(header.ball_names))
+                self._pending.append(header)
+            elif decoder is not None:
+                step = decoder.decode(kind, body)
+                if step is not None:
+                    self._pending.append(step)
+
+    def _apply_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        for item in pending:
+            if isinstance(item, StreamHeader):
+                self._start_round(item)
+            elif self.match is not None:
+                self._apply_step(self.match, item)
+                self._stepped_at = time.perf_counter()
+
+    def _start_round(self, header: StreamHeader) -> None:
+        self.game.seed = header.seed
+        self.game.visual_effect_manager.clear()
+        self.match = self.game.start_round()
+        header.check_compatible(self.match)
+
+    def _apply_step(self, match: Match, step: StreamedStep) -> None:
+        # Joining, or catching up after falling behind; there's nothing sensible to blend from
+        resynced = step.step != match.steps + 1
+        states = match.ball_states
+        for index, ball in enumerate(match.balls):
+            ball.save_previous_state()
+            ball.body.position = pymunk.Vec2d(float(step.positions[index, 0]), float(step.positions[index, 1]))
+            ball.body.angle = float(step.angles[index])
+            if resynced:
+                ball.save_previous_state()
+
+        was_alive = states.alive.copy()
+        states.load_health(step.health)
+        for index, damage, crit in step.damage_events:
+            match.balls[index].show_damage(damage, crit)
+        if not resynced:
+            for dead in np.flatnonzero(was_alive & ~states.alive):
+                match.balls[dead].show_death()
+
+        dt = match.configuration.physics_dt
+        states.modifiers.update(dt)
+        match.visual_effect_manager.update(dt)
+        match.steps = step.step
+        match.elapsed_seconds = step.step * dt
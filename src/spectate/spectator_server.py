@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections.abc import Callable
+from random import Random
+
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_spawn_config import BallSpawnConfig
+from src.game.match import Match
+from src.spectate.state_encoder import StateEncoder
+from src.spectate.stream_header import StreamHeader
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+
+class SpectatorServer:
+    """
+    Plays matches headless in real time and streams every step to any number of spectators.
+
+    Each step is encoded once and the same bytes are written to every spectator, so adding one
+    costs a write per step and nothing more. A spectator that joins mid-round gets the round's
+    header, the latest keyframe and the steps since, and plays on from there. A spectator whose
+    unsent data passes MAX_BUFFERED_BYTES stops being sent steps until it has drained and the
+    next keyframe comes, so a slow one never holds the others up or makes the server buffer
+    without end.
+
+    After a match ends, it keeps streaming for ROUND_END_SECONDS, so spectators see the last
+    effects and the winner, then starts a new round with a new seed.
+    """
+
+    ROUND_END_SECONDS = 5.0
+    MAX_BUFFERED_BYTES = 1 << 20
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            balls_factory: Callable[[Random], list[BallSpawnConfig]],
+            host: str,
+            port: int,
+            seed: int | None = None,
+    ) -> None:
+        self.configuration = configuration
+        self.balls_factory = balls_factory
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self.visual_effect_manager = VisualEffectManager(configuration.max_visual_effects)
+        self.spectators: dict[asyncio.StreamWriter, bool] = {}
+        # The round's header, its latest keyframe and every step since, for spectators joining now
+        self._catch_up: list[bytes] = []
+
+    async def serve_forever(self) -> None:
+        server = await asyncio.start_server(self._add_spectator, self.host, self.port)
+        print(f"Serving spectators on {self.host}:{self.port}")
+        async with server:
+            while True:
+                await self._play_round()
+                self.seed = None
+
+    async def _add_spectator(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.writelines(self._catch_up)
+        self.spectators[writer] = True
+        try:
+            # Spectators never send anything, so this only returns once they hang up
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            del self.spectators[writer]
+            writer.close()
+
+    def _broadcast(self, message: bytes, keyframe: bool) -> None:
+        for writer in self.spectators:
+            if writer.transport.get_write_buffer_size() > self.MAX_BUFFERED_BYTES:
+                self.spectators[writer] = False
+            elif keyframe:
+                self.spectators[writer] = True
+            if self.spectators[writer]:
+                writer.write(message)
+
+    def _publish(self, match: Match, encoder: StateEncoder) -> int:
+        """Sends the match's current step, and returns the size of the message."""
+        states = match.ball_states
+        positions, angles = states.read_poses(match.space)
+        assert states.damage_log is not None
+        message, keyframe = encoder.encode(match.steps, positions, angles, states.health, states.damage_log)
+        states.damage_log.clear()
+        if keyframe:
+            self._catch_up[1:] = [message]
+        else:
+            self._catch_up.append(message)
+        self._broadcast(message, keyframe)
+        return len(message)
+
+    async def _play_round(self) -> None:
+        self.visual_effect_manager.clear()
+        match = Match(self.configuration, self.balls_factory, self.visual_effect_manager, seed=self.seed)
+        match.ball_states.damage_log = []
+        encoder = StateEncoder(len(match.balls), self.configuration.keyframe_interval_steps)
+
+        header = StateEncoder.frame(StateEncoder.HEADER, StreamHeader.from_match(match).pack())
+        self._catch_up = [header]
+        # Even spectators that are behind need the header, or they'd decode the round as the last one
+        for writer in self.spectators:
+            writer.write(header)
+            self.spectators[writer] = False
+        sent_bytes = self._publish(match, encoder)
+
+        dt = self.configuration.physics_dt
+        max_lag = self.configuration.max_physics_steps_per_frame * dt
+        end_step: int | None = None
+        encode_seconds = 0.0
+        next_step = time.perf_counter()
+        while end_step is None or match.steps < end_step:
+            now = time.perf_counter()
+            if now < next_step:
+                await asyncio.sleep(next_step - now)
+                continue
+            next_step = max(next_step, now - max_lag) + dt
+
+            match.step(dt)
+            started = time.perf_counter()
+            sent_bytes += self._publish(match, encoder)
+            encode_seconds += time.perf_counter() - started
+            if end_step is None and (
+                match.is_finished() or match.elapsed_seconds >= self.configuration.stalemate_timeout_seconds
+            ):
+                end_step = match.steps + round(self.ROUND_END_SECONDS * self.configuration.physics_hz)
+            if time.perf_counter() >= next_step:
+                # Catching up wouldn't wait for anything, so let spectators join and writes drain
+                await asyncio.sleep(0)
+
+        winner = match.winner()
+        seconds = match.steps * dt
+        print(
+            f"Round {match.seed}: {winner.name if winner else 'no one'} won; streamed {seconds:.1f}s to "
+            f"{len(self.spectators)} spectators at {sent_bytes / seconds / 1024:.1f} KiB/s each, "
+            f"{1000 * encode_seconds / match.steps:.3f} ms per step to encode and send"
+        )
@@ -0,0 +1,79 @@
+import math
+import zlib
+
+import numpy as np
+
+from src.spectate.state_encoder import StateEncoder
+from src.spectate.streamed_step import StreamedStep
+
+
+class StateDecoder:
+    """
+    Rebuilds the steps of one round of a spectator stream; the counterpart of StateEncoder.
+
+    Deltas only make sense after the keyframe they follow, so decoding starts at the first
+    keyframe and any deltas before it are skipped.
+    """
+
+    def __init__(self, ball_count: int) -> None:
+        self.ball_count = ball_count
+        self._current = np.zeros((ball_count, 3), dtype=np.int64)
+        self._previous = np.zeros((ball_count, 3), dtype=np.int64)
+        self._health = np.zeros(ball_count, dtype=np.int64)
+        self._synced = False
+
+    @staticmethod
+    def unframe(kind: int, body: bytes) -> tuple[int, bytes]:
+        """The kind and body of a message, with the body decompressed."""
+        if kind & StateEncoder.COMPRESSED:
+            return kind & ~StateEncoder.COMPRESSED, zlib.decompress(body)
+        return kind, body
+
+    def decode(self, kind: int, body: bytes) -> StreamedStep | None:
+        """The step in a keyframe or delta body, or None when it can't be decoded yet."""
+        count = self.ball_count
+        if kind == StateEncoder.KEYFRAME:
+            step, event_count = StateEncoder.KEYFRAME_STRUCT.unpack_from(body, 0)
+            offset = StateEncoder.KEYFRAME_STRUCT.size
+            quantized = np.empty_like(self._current)
+            quantized[:, :2] = np.frombuffer(body, dtype="<i4", count=2 * count, offset=offset).reshape(count, 2)
+            offset += 8 * count
+            angle_units = np.frombuffer(body, dtype="<u2", count=count, offset=offset).astype(np.int64)
+            offset += 2 * count
+            # Angles only arrive modulo a turn; take the equivalent nearest the last one, so balls
+            # don't spin a whole turn when blending across the keyframe
+            turn = StateEncoder.ANGLE_UNITS
+            quantized[:, 2] = self._current[:, 2] + (angle_units - self._current[:, 2] + turn // 2) % turn - turn // 2
+            self._health = np.frombuffer(body, dtype="<i4", count=count, offset=offset).astype(np.int64)
+            offset += 4 * count
+            self._previous = quantized
+            self._synced = True
+        elif kind == StateEncoder.DELTA:
+            step, changed_count, event_count = StateEncoder.DELTA_STRUCT.unpack_from(body, 0)
+            if not self._synced:
+                return None
+            offset = StateEncoder.DELTA_STRUCT.size
+            residuals = np.frombuffer(body, dtype="<i2", count=3 * count, offset=offset).reshape(count, 3)
+            offset += 6 * count
+            quantized = 2 * self._current - self._previous + residuals
+            changed = np.frombuffer(body, dtype="<u4", count=changed_count, offset=offset)
+            offset += 4 * changed_count
+            self._health = self._health.copy()
+            self._health[changed] = np.frombuffer(body, dtype="<i4", count=changed_count, offset=offset)
+            offset += 4 * changed_count
+            self._previous = self._current
+        else:
+            raise ValueError(f"Unknown spectator stream message kind {kind}")
+        self._current = quantized
+
+        events = np.frombuffer(body, dtype=StateEncoder.DAMAGE_EVENT_DTYPE, count=event_count, offset=offset)
+        return StreamedStep(
+            step=step,
+            keyframe=kind == StateEncoder.KEYFRAME,
+            positions=quantized[:, :2] / StateEncoder.POSITION_SCALE,
+            angles=quantized[:, 2].astype(np.float64) * (2 * math.pi / StateEncoder.ANGLE_UNITS),
+            health=self._health,
+            damage_events=tuple(
+                (int(index), int(damage), bool(crit)) for index, damage, crit in events.tolist()
+            ),
+        )
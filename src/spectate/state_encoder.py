@@ -0,0 +1,115 @@
+import math
+import struct
+import zlib
+
+import numpy as np
+import numpy.typing as npt
+
+
+class StateEncoder:
+    """
+    Turns each physics step of a match into one message of a spectator stream.
+
+    Positions are quantized to 1/POSITION_SCALE of a pixel and angles to 1/ANGLE_UNITS of a turn.
+    A keyframe carries all of them; the steps in between only carry each value's difference from
+    a straight-line guess based on the two steps before, which is near zero for a ball in flight
+    and compresses to almost nothing. Both ends guess from the quantized values, so errors never
+    add up. A keyframe is sent every keyframe_interval_steps steps, so a spectator can join or
+    catch up from there, and whenever a difference is too big to fit.
+
+    Messages are framed as their body length, then a kind byte, then the body. Encoding happens
+    once per step however many spectators there are.
+    """
+
+    HEADER = 0
+    KEYFRAME = 1
+    DELTA = 2
+    # Set on the kind byte when the body is zlib-compressed
+    COMPRESSED = 0x80
+
+    POSITION_SCALE = 16
+    ANGLE_UNITS = 1 << 16
+    RESIDUAL_LIMIT = (1 << 15) - 1
+    COMPRESSION_LEVEL = 1
+
+    FRAME_STRUCT = struct.Struct("<IB")
+    KEYFRAME_STRUCT = struct.Struct("<II")
+    DELTA_STRUCT = struct.Struct("<III")
+    DAMAGE_EVENT_DTYPE = np.dtype([("index", "<u4"), ("damage", "<i4"), ("crit", "u1")])
+
+    def __init__(self, ball_count: int, keyframe_interval_steps: int) -> None:
+        self.keyframe_interval_steps = keyframe_interval_steps
+        # Quantized x, y and angle of every ball at the last two encoded steps
+        self._current = np.zeros((ball_count, 3), dtype=np.int64)
+        self._previous = np.zeros((ball_count, 3), dtype=np.int64)
+        self._health = np.zeros(ball_count, dtype=np.int64)
+        self._steps_since_keyframe: int | None = None
+
+    @classmethod
+    def frame(cls, kind: int, body: bytes) -> bytes:
+        compressed = zlib.compress(body, cls.COMPRESSION_LEVEL)
+        if len(compressed) < len(body):
+            kind, body = kind | cls.COMPRESSED, compressed
+        return cls.FRAME_STRUCT.pack(len(body), kind) + body
+
+    def _quantize(
+            self,
+            positions: npt.NDArray[np.float64],
+            angles: npt.NDArray[np.float64],
+            alive: npt.NDArray[np.bool_],
+    ) -> npt.NDArray[np.int64]:
+        quantized = np.empty_like(self._current)
+        np.rint(positions * self.POSITION_SCALE, out=quantized[:, :2], casting="unsafe")
+        np.rint(angles * (self.ANGLE_UNITS / (2 * math.pi)), out=quantized[:, 2], casting="unsafe")
+        if self._steps_since_keyframe is not None:
+            # Dead balls have left the space; holding them still keeps their differences at zero
+            quantized[~alive] = self._current[~alive]
+        return quantized
+
+    def encode(
+            self,
+            step: int,
+            positions: npt.NDArray[np.float64],
+            angles: npt.NDArray[np.float64],
+            health: npt.NDArray[np.int64],
+            damage_events: list[tuple[int, int, bool]],
+    ) -> tuple[bytes, bool]:
+        """The framed message for a step, and whether it's a keyframe."""
+        quantized = self._quantize(positions, angles, health > 0)
+        residuals = quantized - (2 * self._current - self._previous)
+        events = np.array(damage_events, dtype=self.DAMAGE_EVENT_DTYPE).tobytes()
+
+        keyframe = (
+            self._steps_since_keyframe is None
+            or self._steps_since_keyframe + 1 >= self.keyframe_interval_steps
+            or int(np.abs(residuals).max(initial=0)) > self.RESIDUAL_LIMIT
+        )
+        if keyframe:
+            body = b"".join(
+                [
+                    self.KEYFRAME_STRUCT.pack(step, len(damage_events)),
+                    quantized[:, :2].astype("<i4").tobytes(),
+                    (quantized[:, 2] % self.ANGLE_UNITS).astype("<u2").tobytes(),
+                    health.astype("<i4").tobytes(),
+                    events,
+                ]
+            )
+            self._previous = quantized
+            self._steps_since_keyframe = 0
+        else:
+            changed = np.flatnonzero(health != self._health)
+            body = b"".join(
+                [
+                    self.DELTA_STRUCT.pack(step, len(changed), len(damage_events)),
+                    residuals.astype("<i2").tobytes(),
+                    changed.astype("<u4").tobytes(),
+                    health[changed].astype("<i4").tobytes(),
+                    events,
+                ]
+            )
+            self._previous = self._current
+            assert self._steps_since_keyframe is not None
+            self._steps_since_keyframe += 1
+        self._current = quantized
+        self._health = health.copy()
+        return self.frame(self.KEYFRAME if keyframe else self.DELTA, body), keyframe
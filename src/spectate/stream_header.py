@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.game.match import Match
+
+
+@dataclass(frozen=True)
+class StreamHeader:
+    """
+    Opens each round of a spectator stream.
+
+    Spectators rebuild the round's balls from the seed with their own ball factory, the way a
+    replay does, so the stream only has to carry what changes from step to step.
+    """
+
+    seed: int
+    ball_names: tuple[str, ...]
+    physics_hz: int
+    sim_size: tuple[int, int]
+
+    VERSION = 1
+
+    @classmethod
+    def from_match(cls, match: Match) -> StreamHeader:
+        return cls(
+            seed=match.seed,
+            ball_names=tuple(ball.name for ball in match.balls),
+            physics_hz=match.configuration.physics_hz,
+            sim_size=match.configuration.sim_size,
+        )
+
+    def check_compatible(self, match: Match) -> None:
+        names = tuple(ball.name for ball in match.balls)
+        if match.seed != self.seed or names != self.ball_names:
+            raise ValueError(f"Stream of {self.ball_names} with seed {self.seed} doesn't match this match")
+        if match.configuration.physics_hz != self.physics_hz or match.configuration.sim_size != self.sim_size:
+            raise ValueError("Stream was sent with a different physics rate or arena size")
+
+    def pack(self) -> bytes:
+        return json.dumps(
+            {
+                "version": self.VERSION,
+                "seed": self.seed,
+                "ball_names": self.ball_names,
+                "physics_hz": self.physics_hz,
+                "sim_size": self.sim_size,
+            }
+        ).encode()
+
+    @classmethod
+    def unpack(cls, data: bytes) -> StreamHeader:
+        header = json.loads(data)
+        if header["version"] != cls.VERSION:
+            raise ValueError(f"Unsupported stream version {header['version']}")
+        return cls(
+            seed=header["seed"],
+            ball_names=tuple(header["ball_names"]),
+            physics_hz=header["physics_hz"],
+            sim_size=(header["sim_size"][0], header["sim_size"][1]),
+        )
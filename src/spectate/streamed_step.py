@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True)
+class StreamedStep:
+    """
+    One physics step as a spectator receives it.
+
+    Positions and angles are quantized, so they're within StateEncoder's resolution of the
+    server's. Damage events are the hits taken during the step as (ball index, damage, crit).
+    """
+
+    step: int
+    keyframe: bool
+    positions: npt.NDArray[np.float64]
+    angles: npt.NDArray[np.float64]
+    health: npt.NDArray[np.int64]
+    damage_events: tuple[tuple[int, int, bool], ...]
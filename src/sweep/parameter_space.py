@@ -0,0 +1,47 @@
+import dataclasses
+import itertools
+import random
+from typing import Any
+
+from src.configuration.balance_parameters import BalanceParameters
+
+
+class ParameterSpace:
+    """Picks the balance parameter points a sweep visits; parameters not named keep their base value."""
+
+    def __init__(self, base: BalanceParameters | None = None) -> None:
+        self.base = base or BalanceParameters()
+
+    @staticmethod
+    def _check_names(names: list[str]) -> None:
+        known = {f.name for f in dataclasses.fields(BalanceParameters)}
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown balance parameters {unknown}; choose from {sorted(known)}")
+
+    def _point(self, values: dict[str, float]) -> BalanceParameters:
+        # Keep integer parameters integers
+        converted: dict[str, Any] = {
+            name: round(value) if isinstance(getattr(self.base, name), int) else float(value)
+            for name, value in values.items()
+        }
+        return dataclasses.replace(self.base, **converted)
+
+    def grid(self, axes: dict[str, list[float]]) -> list[BalanceParameters]:
+        """Every combination of the given values."""
+        self._check_names(list(axes))
+        names = list(axes)
+        return [self._point(dict(zip(names, values, strict=True))) for values in itertools.product(*axes.values())]
+
+    def sample(
+            self,
+            ranges: dict[str, tuple[float, float]],
+            samples: int,
+            rng: random.Random,
+    ) -> list[BalanceParameters]:
+        """Points drawn uniformly from the given ranges, inclusive."""
+        self._check_names(list(ranges))
+        return [
+            self._point({name: rng.uniform(low, high) for name, (low, high) in ranges.items()})
+            for _ in range(samples)
+        ]
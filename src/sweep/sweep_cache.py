@@ -0,0 +1,60 @@
+import dataclasses
+import hashlib
+import json
+from pathlib import Path
+
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_prototype import BallPrototype
+from src.game.match_result import MatchResult
+
+
+class SweepCache:
+    """
+    Match results on disk, one small JSON file each, keyed by everything that decides the result.
+
+    The key hashes the full configuration (balance parameters included), the line-up, the seed and
+    the code version, so a cached result is only reused while replaying it would give the same
+    match. The code version hashes the game's source, so any code change starts a fresh cache.
+    """
+
+    def __init__(self, directory: Path, code_version: str | None = None) -> None:
+        self.directory = directory
+        self.code_version = code_version or self.source_version()
+
+    @staticmethod
+    def source_version() -> str:
+        source_root = Path(__file__).resolve().parents[1]
+        digest = hashlib.sha256()
+        for path in sorted(source_root.rglob("*.py")):
+            digest.update(str(path.relative_to(source_root)).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def key(self, configuration: Configuration, ball_prototypes: list[BallPrototype], seed: int) -> str:
+        description = json.dumps(
+            {
+                "configuration": repr(configuration),
+                "ball_prototypes": repr(ball_prototypes),
+                "seed": seed,
+                "code_version": self.code_version,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> MatchResult | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        return MatchResult(**json.loads(path.read_text()))
+
+    def put(self, key: str, result: MatchResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted sweep never leaves a half-written entry behind
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(dataclasses.asdict(result)))
+        temporary.replace(path)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from src.configuration.balance_parameters import BalanceParameters
+from src.tournament.tournament_stats import TournamentStats
+
+
+@dataclass
+class SweepPointResult:
+    parameters: BalanceParameters
+    stats: TournamentStats
+    # Whether every win rate's confidence interval narrowed enough before max_matches
+    converged: bool
+    # Matches read from the cache instead of played
+    cached_matches: int = 0
@@ -0,0 +1,155 @@
+import dataclasses
+import os
+import signal
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from src.configuration.balance_parameters import BalanceParameters
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_prototype import BallPrototype
+from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
+from src.game.headless_game import HeadlessGame
+from src.game.match_result import MatchResult
+from src.sweep.sweep_cache import SweepCache
+from src.sweep.sweep_point_result import SweepPointResult
+from src.tournament.tournament_stats import TournamentStats
+
+# Set up once per worker process by _init_worker and reused for every match it plays
+_worker_configuration: Configuration | None = None
+_worker_factory: BallSpawnConfigFactory | None = None
+
+
+def _init_worker(configuration: Configuration, ball_prototypes: list[BallPrototype]) -> None:
+    global _worker_configuration, _worker_factory
+    # Ctrl+C is handled by the parent, which cancels outstanding matches
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_configuration = configuration
+    _worker_factory = BallSpawnConfigFactory(configuration, ball_prototypes)
+
+
+def _play_match(balance: BalanceParameters, seed: int) -> MatchResult:
+    assert _worker_configuration is not None and _worker_factory is not None
+    configuration = dataclasses.replace(_worker_configuration, balance=balance)
+    return HeadlessGame(configuration, _worker_factory.make_balls).run(seed)
+
+
+class _PointProgress:
+    """Results of one point so far. Only the unbroken run of matches from the first one counts."""
+
+    def __init__(self, parameters: BalanceParameters) -> None:
+        self.parameters = parameters
+        self.results: dict[int, MatchResult] = {}
+        self.stats = TournamentStats()
+        self.next_match = 0
+        self.cached_matches = 0
+        self.finished = False
+        self.converged = False
+
+
+class SweepRunner:
+    """
+    Plays matches at many balance parameter points across a pool of worker processes.
+
+    Match i of every point uses seed + i, so points are compared on the same spawns. Each point
+    plays at least min_matches and at most max_matches. It stops early once every prototype's win
+    rate is known to within max_half_width, by its Wilson score interval. Results come from and go
+    to the cache, so running a sweep again only plays matches it hasn't played before.
+
+    Stopping is judged on the matches in order, however the workers finish them, so the same
+    sweep always stops at the same match count and reports the same stats.
+    """
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            ball_prototypes: list[BallPrototype],
+            cache: SweepCache | None = None,
+            workers: int | None = None,
+            min_matches: int = 50,
+            max_matches: int = 1000,
+            max_half_width: float = 0.05,
+            z: float = 1.96,
+    ):
+        self.configuration = configuration
+        self.ball_prototypes = ball_prototypes
+        self.cache = cache
+        self.workers = workers or os.cpu_count() or 1
+        self.min_matches = min_matches
+        self.max_matches = max_matches
+        self.max_half_width = max_half_width
+        self.z = z
+
+    def _cache_key(self, parameters: BalanceParameters, seed: int) -> str:
+        assert self.cache is not None
+        configuration = dataclasses.replace(self.configuration, balance=parameters)
+        return self.cache.key(configuration, self.ball_prototypes, seed)
+
+    def _is_converged(self, stats: TournamentStats) -> bool:
+        for prototype in stats.prototypes.values():
+            low, high = prototype.win_rate_interval(self.z)
+            if (high - low) / 2 > self.max_half_width:
+                return False
+        return True
+
+    def _add(self, progress: _PointProgress, match: int, result: MatchResult) -> None:
+        progress.results[match] = result
+        while not progress.finished and progress.stats.matches in progress.results:
+            progress.stats.add(progress.results.pop(progress.stats.matches))
+            if progress.stats.matches >= self.min_matches and self._is_converged(progress.stats):
+                progress.finished = progress.converged = True
+            elif progress.stats.matches >= self.max_matches:
+                progress.finished = True
+
+    def run(self, points: list[BalanceParameters], seed: int = 0) -> Iterator[SweepPointResult]:
+        """Yields each point's result as soon as it's settled, in whatever order that happens."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.configuration, self.ball_prototypes),
+        )
+        # Only keep a few matches queued per worker so stopping early discards little work
+        max_in_flight = 4 * self.workers
+        in_flight: dict[Future[MatchResult], tuple[_PointProgress, int]] = {}
+        pending = [_PointProgress(parameters) for parameters in points]
+        try:
+            while pending:
+                # Hand out matches one point at a time, so every point makes progress together
+                handed_out = True
+                while handed_out and len(in_flight) < max_in_flight:
+                    handed_out = False
+                    for progress in pending:
+                        if progress.finished or progress.next_match >= self.max_matches:
+                            continue
+                        match = progress.next_match
+                        progress.next_match += 1
+                        handed_out = True
+                        cached = self.cache.get(self._cache_key(progress.parameters, seed + match)) if self.cache else None
+                        if cached is not None:
+                            progress.cached_matches += 1
+                            self._add(progress, match, cached)
+                        else:
+                            future = executor.submit(_play_match, progress.parameters, seed + match)
+                            in_flight[future] = (progress, match)
+                            if len(in_flight) >= max_in_flight:
+                                break
+
+                for progress in [progress for progress in pending if progress.finished]:
+                    pending.remove(progress)
+                    yield SweepPointResult(
+                        progress.parameters,
+                        progress.stats,
+                        progress.converged,
+                        progress.cached_matches,
+                    )
+                if not in_flight:
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    progress, match = in_flight.pop(future)
+                    result = future.result()
+                    if self.cache:
+                        self.cache.put(self._cache_key(progress.parameters, seed + match), result)
+                    self._add(progress, match, result)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,68 @@
+import os
+import signal
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_prototype import BallPrototype
+from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
+from src.game.headless_game import HeadlessGame
+from src.game.match_result import MatchResult
+
+# Set up once per worker process by _init_worker and reused for every match it plays
+_worker_game: HeadlessGame | None = None
+
+
+def _init_worker(configuration: Configuration, ball_prototypes: list[BallPrototype]) -> None:
+    global _worker_game
+    # Ctrl+C is handled by the parent, which cancels outstanding matches
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    factory = BallSpawnConfigFactory(configuration, ball_prototypes)
+    _worker_game = HeadlessGame(configuration, factory.make_balls)
+
+
+def _play_match(seed: int | None) -> MatchResult:
+    assert _worker_game is not None
+    return _worker_game.run(seed)
+
+
+class Tournament:
+    """
+    Plays many headless matches of the same line-up across a pool of worker processes.
+
+    Results are yielded as soon as each match finishes, so callers can report progress and
+    keep everything completed so far if the run is interrupted.
+    """
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            ball_prototypes: list[BallPrototype],
+            workers: int | None = None,
+    ):
+        self.configuration = configuration
+        self.ball_prototypes = ball_prototypes
+        self.workers = workers or os.cpu_count() or 1
+
+    def play(self, matches: int, seed: int | None = None) -> Iterator[MatchResult]:
+        """Plays the given number of matches; with a seed, match i uses seed + i so the run is reproducible."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.configuration, self.ball_prototypes),
+        )
+        # Only keep a few matches queued per worker so stopping early discards little work
+        max_in_flight = 4 * self.workers
+        in_flight: set[Future[MatchResult]] = set()
+        submitted = 0
+        try:
+            while submitted < matches or in_flight:
+                while submitted < matches and len(in_flight) < max_in_flight:
+                    match_seed = seed + submitted if seed is not None else None
+                    in_flight.add(executor.submit(_play_match, match_seed))
+                    submitted += 1
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,89 @@
+import math
+from dataclasses import dataclass, field
+
+from src.game.match_result import MatchResult
+
+
+@dataclass
+class PrototypeStats:
+    matches: int = 0
+    # Balls of the prototype across those matches; more than matches when a match has several
+    balls: int = 0
+    wins: int = 0
+    total_duration_seconds: float = 0.0
+    total_damage_dealt: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.matches if self.matches else 0.0
+
+    @property
+    def mean_match_seconds(self) -> float:
+        return self.total_duration_seconds / self.matches if self.matches else 0.0
+
+    def win_rate_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Wilson score interval of the win rate; z = 1.96 gives 95% confidence."""
+        if not self.matches:
+            return 0.0, 1.0
+        n = self.matches
+        p = self.win_rate
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return center - half_width, center + half_width
+
+    @property
+    def mean_damage_dealt(self) -> float:
+        """Per ball, so prototypes stay comparable however many balls each has."""
+        return self.total_damage_dealt / self.balls if self.balls else 0.0
+
+
+@dataclass
+class TournamentStats:
+    matches: int = 0
+    timeouts: int = 0
+    draws: int = 0
+    total_duration_seconds: float = 0.0
+    prototypes: dict[str, PrototypeStats] = field(default_factory=dict)
+
+    def add(self, result: MatchResult) -> None:
+        self.matches += 1
+        self.total_duration_seconds += result.duration_seconds
+        if result.timed_out:
+            self.timeouts += 1
+        elif result.winner is None:
+            self.draws += 1
+
+        # Balls are counted under their prototype, as large arenas field many balls of each
+        played: set[str] = set()
+        for name, damage_dealt in result.damage_dealt.items():
+            prototype = result.prototypes.get(name, name)
+            stats = self.prototypes.setdefault(prototype, PrototypeStats())
+            stats.balls += 1
+            stats.total_damage_dealt += damage_dealt
+            if prototype not in played:
+                played.add(prototype)
+                stats.matches += 1
+                stats.total_duration_seconds += result.duration_seconds
+            if name == result.winner:
+                stats.wins += 1
+
+    @property
+    def mean_match_seconds(self) -> float:
+        return self.total_duration_seconds / self.matches if self.matches else 0.0
+
+    def report(self) -> str:
+        summary = (
+            f"{self.matches} matches, mean length {self.mean_match_seconds:.1f}s, "
+            f"{self.draws} draws, {self.timeouts} timeouts"
+        )
+        lines = [
+            summary,
+            f"{'prototype':<12}{'win rate':>10}{'mean length':>14}{'mean damage':>14}",
+        ]
+        ranked = sorted(self.prototypes.items(), key=lambda item: item[1].win_rate, reverse=True)
+        for name, stats in ranked:
+            lines.append(
+                f"{name:<12}{stats.win_rate:>10.1%}{stats.mean_match_seconds:>13.1f}s"
+                f"{stats.mean_damage_dealt:>14.1f}"
+            )
+        return "\n".join(lines)
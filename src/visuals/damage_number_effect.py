@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, override
 
-import pygame
-
 from src.display.display import Display
 
 if TYPE_CHECKING:
@@ -12,7 +10,12 @@ from src.visuals.visual_effect import VisualEffect
 
 
 class DamageNumberEffect(VisualEffect):
-    def __init__(
+    __slots__ = ("amount", "ball", "is_crit", "max_size", "min_size")
+
+    PRIORITY = 0
+    CRIT_PRIORITY = 1
+
+    def setup(
             self,
             ball: Ball,
             amount: int,
@@ -20,7 +23,7 @@ class DamageNumberEffect(VisualEffect):
             min_size: int = 20,
             max_size: int = 80,
     ) -> None:
-        super().__init__(self._get_duration(is_crit))
+        self._start(self._get_duration(is_crit), self.CRIT_PRIORITY if is_crit else self.PRIORITY)
         self.ball = ball
         self.amount = amount
         self.is_crit = is_crit
@@ -42,9 +45,9 @@ class DamageNumberEffect(VisualEffect):
     @override
     def draw(self, display: Display) -> None:
         color = (255, 0, 0) if not self.is_crit else (255, 180, 0)
-        font = pygame.font.SysFont('Arial', self._get_font_size(damage=self.amount), bold=True)
+        font = display.get_font(self._get_font_size(damage=self.amount), bold=True)
         alpha = int(255 * self.timer_seconds / self._get_duration(self.is_crit))
         text = f"-{self.amount}"
-        pos_x = self.ball.body.position.x
-        pos_y = self.ball.body.position.y - self.ball.radius - 18 - self._get_y_drift()
-        display.draw_text(text, (pos_x, pos_y), font, color, alpha=alpha)
+        pos_x = self.ball.render_position.x
+        pos_y = self.ball.render_position.y - self.ball.radius - 18 - self._get_y_drift()
+        display.draw_text(text, (pos_x, pos_y), font, color, alpha=alpha, layer=Display.EFFECT_LAYER)
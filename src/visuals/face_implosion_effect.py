@@ -7,37 +7,42 @@ from src.visuals.visual_effect import VisualEffect
 
 
 class FaceImplosionEffect(VisualEffect):
-    def __init__(
+    """
+    A dead ball's face spinning down to nothing as it fades.
+
+    The shrinking face comes from frames scaled once per face, shared by every implosion of it, so
+    a draw at most rotates one small frame rather than scaling the full face. The angle never
+    changes, so each rotated frame is kept for the draws that show it.
+    """
+
+    __slots__ = ("angle_deg", "frame_index", "frames", "initial_radius", "pos", "rotated_frame")
+
+    PRIORITY = 2
+
+    def setup(
             self,
             pos: tuple[float, float],
             initial_radius: float,
             angle_deg: float,
-            face_surface: pygame.Surface,
+            frames: list[pygame.Surface],
             duration: float = 1
-    ):
-        super().__init__(duration)
+    ) -> None:
+        """frames run from the full-size face to the smallest, evenly spaced in scale."""
+        self._start(duration)
         self.pos = pos
         self.initial_radius = initial_radius
         self.angle_deg = angle_deg
-        self.face_surface = face_surface
-        self.initial_duration = duration
+        self.frames = frames
+        self.frame_index = -1
+        self.rotated_frame: pygame.Surface | None = None
 
     @override
     def draw(self, display: Display) -> None:
-        progress = 1.0 - (self.timer_seconds / self.initial_duration)
-        scale = max(0.01, 1.0 - progress)  # Avoid scale=0 for blit
-        alpha = int(255 * (1 - progress))
-
-        # Rotate the face image
-        rotated_face = pygame.transform.rotate(self.face_surface, self.angle_deg)
-
-        # Scale the face image down
-        orig_size = rotated_face.get_size()
-        new_size = (max(1, int(orig_size[0] * scale)), max(1, int(orig_size[1] * scale)))
-        scaled_face = pygame.transform.smoothscale(rotated_face, new_size).convert_alpha()
-        scaled_face.set_alpha(alpha)
-
-        # Center the scaled image at the position
-        x, y = self.pos
-        rect = scaled_face.get_rect(center=(x, y))
-        display.sim_surface.blit(scaled_face, rect)
+        progress = 1.0 - (self.timer_seconds / self.duration)
+        frame_index = min(len(self.frames) - 1, int(progress * len(self.frames)))
+        if frame_index != self.frame_index or self.rotated_frame is None:
+            # Rotation makes a new surface, so its alpha can be set without touching the shared frame
+            self.rotated_frame = pygame.transform.rotate(self.frames[frame_index], self.angle_deg)
+            self.frame_index = frame_index
+        self.rotated_frame.set_alpha(int(255 * (1 - progress)))
+        display.blit_sprite(self.rotated_frame, self.pos, layer=Display.EFFECT_LAYER)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import pygame
 
@@ -12,25 +12,34 @@ from src.visuals.visual_effect import VisualEffect
 
 
 class HaloEffect(VisualEffect):
-    def __init__(
+    __slots__ = ("ball", "color", "radius")
+
+    PRIORITY = 1
+
+    def setup(
             self,
             ball: Ball,
             duration: float = 1.0,
             color: pygame.Color = pygame.Color(255, 120, 40),
-    ):
-        super().__init__(duration)
+    ) -> None:
+        self._start(duration)
         self.ball = ball
         self.radius = ball.radius
-        self.duration = duration
         self.color = color
 
+    @override
     def draw(self, display: Display) -> None:
-        if self.ball.health <= 0:
+        if self.ball.render_health <= 0:
             return
-        pos = (self.ball.body.position.x, self.ball.body.position.y)
+        pos = (self.ball.render_position.x, self.ball.render_position.y)
         progress = self.timer_seconds / self.duration
         max_halo_radius = self.radius + 20
         min_halo_radius = self.radius + 8
         halo_radius = int(min_halo_radius + (max_halo_radius - min_halo_radius) * progress)
         alpha = int(180 * progress)
-        display.draw_halo(pos, halo_radius, pygame.Color(self.color.r, self.color.g, self.color.b, alpha))
+        display.draw_halo(
+            pos,
+            halo_radius,
+            pygame.Color(self.color.r, self.color.g, self.color.b, alpha),
+            layer=Display.EFFECT_LAYER,
+        )
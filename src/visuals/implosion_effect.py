@@ -7,18 +7,21 @@ from src.visuals.visual_effect import VisualEffect
 
 
 class ImplosionEffect(VisualEffect):
-    def __init__(
+    __slots__ = ("color", "initial_radius", "pos")
+
+    PRIORITY = 2
+
+    def setup(
             self,
             pos: tuple[float, float],
             initial_radius: float,
             color: pygame.Color = pygame.Color(100, 200, 255),
             duration: float = 1,
-    ):
-        super().__init__(duration)
+    ) -> None:
+        self._start(duration)
         self.pos = pos
         self.initial_radius = initial_radius
         self.color = color
-        self.duration = duration
 
     @override
     def draw(self, display: Display) -> None:
@@ -28,4 +31,4 @@ class ImplosionEffect(VisualEffect):
             return
         alpha = int(255 * (1 - progress))
         # Draw a shrinking, fading circle
-        display.draw_circle(self.pos, radius, self.color, alpha=alpha)
+        display.draw_circle(self.pos, radius, self.color, alpha=alpha, layer=Display.EFFECT_LAYER)
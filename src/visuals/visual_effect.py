@@ -4,15 +4,30 @@ from src.display.display import Display
 
 
 class VisualEffect(ABC):
-    def __init__(self, timer_seconds: float) -> None:
-        self.timer_seconds = timer_seconds
+    """
+    A short-lived drawing, recycled by VisualEffectManager rather than allocated per use.
+
+    Get one with VisualEffectManager.acquire, fill it in with the subclass's setup, then hand it
+    to VisualEffectManager.add. The manager keeps timer_seconds, the time left, current for draw.
+    """
+
+    __slots__ = ("duration", "expires_at", "priority", "sequence", "timer_seconds")
+
+    # When the effect budget is full, effects with a lower priority make room for higher ones
+    PRIORITY = 0
+
+    def __init__(self) -> None:
+        self.duration = 0.0
+        self.timer_seconds = 0.0
+        self.expires_at = 0.0
+        self.priority = self.PRIORITY
+        self.sequence = 0
+
+    def _start(self, duration: float, priority: int | None = None) -> None:
+        self.duration = duration
+        self.timer_seconds = duration
+        self.priority = self.PRIORITY if priority is None else priority
 
     @abstractmethod
     def draw(self, display: Display) -> None:
         pass
-
-    def update(self, dt: float) -> None:
-        self.timer_seconds = max(0.0, self.timer_seconds - dt)
-
-    def is_alive(self) -> bool:
-        return self.timer_seconds > 0
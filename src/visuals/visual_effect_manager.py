@@ -1,19 +1,99 @@
+import copy
+import heapq
+from typing import cast
+
 from src.display.display import Display
 from src.visuals.visual_effect import VisualEffect
 
 
 class VisualEffectManager:
-    def __init__(self) -> None:
-        self.effects: list[VisualEffect] = []
+    """
+    Owns the live visual effects, recycling finished ones and capping how many there are.
+
+    Effects expire through a heap ordered by end time, so a frame only touches the effects that
+    end in it. Once max_effects are live, a new effect replaces the oldest effect of a lower
+    priority, or is dropped if there is none.
+    """
+
+    DEFAULT_MAX_EFFECTS = 256
+
+    def __init__(self, max_effects: int = DEFAULT_MAX_EFFECTS) -> None:
+        self.max_effects = max_effects
+        self.now = 0.0
+        # Live effects by priority, each in the order they were added
+        self.live: dict[int, dict[int, VisualEffect]] = {}
+        self.live_count = 0
+        self._expiry: list[tuple[float, int, VisualEffect]] = []
+        self._free: dict[type[VisualEffect], list[VisualEffect]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def acquire[E: VisualEffect](self, effect_type: type[E]) -> E:
+        """A recycled effect of this type if there is one, otherwise a new one. Call its setup before add."""
+        free = self._free.get(effect_type)
+        if free:
+            return cast(E, free.pop())
+        return effect_type()
+
+    def _release(self, effect: VisualEffect) -> None:
+        # An evicted effect's heap entry is still queued; no entry's sequence can match this one
+        effect.sequence = -1
+        self._free.setdefault(type(effect), []).append(effect)
+
+    def _evict_below(self, priority: int) -> bool:
+        for live_priority in sorted(self.live):
+            if live_priority >= priority:
+                break
+            effects = self.live[live_priority]
+            if effects:
+                self._release(effects.pop(next(iter(effects))))
+                self.live_count -= 1
+                return True
+        return False
 
     def add(self, effect: VisualEffect) -> None:
-        self.effects.append(effect)
+        if self.live_count >= self.max_effects and not self._evict_below(effect.priority):
+            self._release(effect)
+            return
+        self._sequence += 1
+        effect.sequence = self._sequence
+        effect.expires_at = self.now + effect.duration
+        self.live.setdefault(effect.priority, {})[effect.sequence] = effect
+        self.live_count += 1
+        heapq.heappush(self._expiry, (effect.expires_at, effect.sequence, effect))
 
     def update(self, dt: float) -> None:
-        for effect in self.effects:
-            effect.update(dt)
-        self.effects = [e for e in self.effects if e.is_alive()]
+        self.now += dt
+        while self._expiry and self._expiry[0][0] <= self.now:
+            _, sequence, effect = heapq.heappop(self._expiry)
+            # Evicted effects leave their entry behind; since then they were released or given a new sequence
+            if effect.sequence == sequence:
+                del self.live[effect.priority][sequence]
+                self._release(effect)
+                self.live_count -= 1
 
     def draw(self, display: Display) -> None:
-        for effect in self.effects:
-            effect.draw(display)
+        for priority in sorted(self.live):
+            for effect in self.live[priority].values():
+                effect.timer_seconds = effect.expires_at - self.now
+                effect.draw(display)
+
+    def snapshot(self) -> tuple[VisualEffect, ...]:
+        """Copies of the live effects in draw order, with their time left filled in, to draw from another thread."""
+        effects = []
+        for priority in sorted(self.live):
+            for effect in self.live[priority].values():
+                effect_copy = copy.copy(effect)
+                effect_copy.timer_seconds = effect.expires_at - self.now
+                effects.append(effect_copy)
+        return tuple(effects)
+
+    def clear(self) -> None:
+        for effects in self.live.values():
+            for effect in effects.values():
+                self._release(effect)
+            effects.clear()
+        self.live_count = 0
+        self._expiry.clear()
@@ -0,0 +1,71 @@
+import argparse
+import dataclasses
+import random
+import time
+
+import pygame
+
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_prototype import BallPrototype
+from src.entity.ball.ball_spawn_config import BallSpawnConfig
+from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
+from src.game.match import Match
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+# Broadphase and solver set-ups to compare, as (label, spatial hash, solver threads)
+VARIANTS = [
+    ("tree, 1 thread", False, 1),
+    ("hash, 1 thread", True, 1),
+    ("hash, 2 threads", True, 2),
+]
+
+
+def measure_step_ms(configuration: Configuration, warmup_steps: int, steps: int, seed: int) -> tuple[float, float]:
+    """Mean milliseconds of a whole match step, and of the pymunk space step (with collision handlers) alone."""
+    prototypes = [BallPrototype(name=f"ball{i}", color=pygame.Color(200, 40 * i, 0)) for i in range(5)]
+    factory = BallSpawnConfigFactory(configuration, prototypes)
+
+    def make_balls(rng: random.Random) -> list[BallSpawnConfig]:
+        # Nobody dies, so the ball count stays what is being measured
+        return [dataclasses.replace(ball, initial_health=10**9) for ball in factory.make_balls(rng)]
+
+    match = Match(configuration, make_balls, VisualEffectManager(), seed=seed)
+    dt = configuration.physics_dt
+    for _ in range(warmup_steps):
+        match.step(dt)
+    start = time.perf_counter()
+    for _ in range(steps):
+        match.step(dt)
+    match_ms = (time.perf_counter() - start) / steps * 1000
+    start = time.perf_counter()
+    for _ in range(steps):
+        match.space.step(dt)
+    space_ms = (time.perf_counter() - start) / steps * 1000
+    return match_ms, space_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how physics step time scales with ball count in the large arena.")
+    parser.add_argument("--balls", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000], help="ball counts to measure")
+    parser.add_argument("--steps", type=int, default=300, help="timed steps per measurement")
+    parser.add_argument("--warmup", type=int, default=60, help="untimed steps before each measurement")
+    parser.add_argument("--seed", type=int, default=0, help="match seed")
+    args = parser.parse_args()
+
+    print("ms per step: whole match step / pymunk space step")
+    print(f"{'balls':>6}" + "".join(f"{label:>20}" for label, _, _ in VARIANTS))
+    for ball_count in args.balls:
+        row = f"{ball_count:>6}"
+        for _, spatial_hash, solver_threads in VARIANTS:
+            configuration = dataclasses.replace(
+                Configuration.large_arena(ball_count),
+                spatial_hash=spatial_hash,
+                solver_threads=solver_threads,
+            )
+            match_ms, space_ms = measure_step_ms(configuration, args.warmup, args.steps, args.seed)
+            row += f"{f'{match_ms:.2f} / {space_ms:.2f}':>20}"
+        print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import dataclasses
+import json
+import random
+from pathlib import Path
+
+from main import get_ball_prototypes
+from src.configuration.balance_parameters import BalanceParameters
+from src.configuration.configuration import Configuration
+from src.sweep.parameter_space import ParameterSpace
+from src.sweep.sweep_cache import SweepCache
+from src.sweep.sweep_point_result import SweepPointResult
+from src.sweep.sweep_runner import SweepRunner
+
+
+def _parse_grid(values: list[str]) -> dict[str, list[float]]:
+    axes = {}
+    for value in values:
+        name, _, numbers = value.partition("=")
+        axes[name] = [float(number) for number in numbers.split(",")]
+    return axes
+
+
+def _parse_ranges(values: list[str]) -> dict[str, tuple[float, float]]:
+    ranges = {}
+    for value in values:
+        name, _, bounds = value.partition("=")
+        low, _, high = bounds.partition(":")
+        ranges[name] = (float(low), float(high))
+    return ranges
+
+
+def _describe(parameters: BalanceParameters) -> str:
+    default = BalanceParameters()
+    changed = [
+        f"{field.name}={getattr(parameters, field.name):g}"
+        for field in dataclasses.fields(parameters)
+        if getattr(parameters, field.name) != getattr(default, field.name)
+    ]
+    return " ".join(changed) or "defaults"
+
+
+def _win_rate_spread(point: SweepPointResult) -> float:
+    rates = [stats.win_rate for stats in point.stats.prototypes.values()]
+    return max(rates) - min(rates) if rates else 0.0
+
+
+def _report(point: SweepPointResult) -> str:
+    status = "converged" if point.converged else "max matches"
+    lines = [
+        (
+            f"{_describe(point.parameters)}: {point.stats.matches} matches "
+            f"({point.cached_matches} cached, {status}), win rate spread {_win_rate_spread(point):.1%}"
+        )
+    ]
+    for name, stats in sorted(point.stats.prototypes.items()):
+        low, high = stats.win_rate_interval()
+        lines.append(f"  {name:<12}{stats.win_rate:>8.1%}  [{low:.1%}, {high:.1%}]")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play matches across balance parameter points and report each point's win rates.",
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="sweep every combination of these values; repeat for more parameters",
+    )
+    parser.add_argument(
+        "--sample",
+        action="append",
+        default=[],
+        metavar="NAME=LOW:HIGH",
+        help="sample this parameter uniformly; repeat for more parameters",
+    )
+    parser.add_argument("--samples", type=int, default=20, help="number of sampled points")
+    parser.add_argument("--seed", type=int, default=0, help="seed of each point's first match; later ones count up")
+    parser.add_argument("--min-matches", type=int, default=50, help="matches per point before stopping early")
+    parser.add_argument("--max-matches", type=int, default=1000, help="most matches per point")
+    parser.add_argument(
+        "--max-half-width",
+        type=float,
+        default=0.05,
+        help="stop a point once every 95%% win rate interval is at most this far either side",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (defaults to all cores)")
+    parser.add_argument("--cache", type=Path, default=Path(".sweep_cache"), help="directory of cached match results")
+    parser.add_argument("--no-cache", action="store_true", help="play every match, and cache nothing")
+    parser.add_argument("--output", type=Path, default=None, help="append each point's result to this JSONL file")
+    parser.add_argument(
+        "--large-arena",
+        type=int,
+        default=None,
+        metavar="BALLS",
+        help="play in the large arena with this many balls",
+    )
+    args = parser.parse_args()
+
+    space = ParameterSpace()
+    if args.grid and args.sample:
+        parser.error("use either --grid or --sample")
+    if args.grid:
+        points = space.grid(_parse_grid(args.grid))
+    elif args.sample:
+        points = space.sample(_parse_ranges(args.sample), args.samples, random.Random(args.seed))
+    else:
+        points = [space.base]
+
+    configuration = Configuration.large_arena(args.large_arena) if args.large_arena else Configuration()
+    runner = SweepRunner(
+        configuration,
+        get_ball_prototypes(configuration),
+        cache=None if args.no_cache else SweepCache(args.cache),
+        workers=args.workers,
+        min_matches=args.min_matches,
+        max_matches=args.max_matches,
+        max_half_width=args.max_half_width,
+    )
+
+    results = []
+    output = args.output.open("a") if args.output else None
+    try:
+        for point in runner.run(points, args.seed):
+            results.append(point)
+            print(f"{len(results)}/{len(points)} {_report(point)}")
+            if output:
+                output.write(json.dumps(dataclasses.asdict(point)) + "\n")
+                output.flush()
+    except KeyboardInterrupt:
+        print(f"Interrupted after {len(results)} points")
+    finally:
+        if output:
+            output.close()
+
+    print("Most balanced first:")
+    for point in sorted(results, key=_win_rate_spread):
+        print(f"{_win_rate_spread(point):>7.1%}  {_describe(point.parameters)}")
+
+
+if __name__ == "__main__":
+    main()
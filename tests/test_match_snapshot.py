@@ -0,0 +1,40 @@
+import unittest
+
+import pygame
+
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_prototype import BallPrototype
+from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
+from src.game.match import Match
+from src.game.match_snapshot import MatchSnapshot
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+
+class MatchSnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        configuration = Configuration()
+        prototypes = [BallPrototype(f"ball {i}", color=pygame.Color(200, 40 * i, 0)) for i in range(5)]
+        factory = BallSpawnConfigFactory(configuration, prototypes)
+        self.match = Match(configuration, factory.make_balls, VisualEffectManager(), seed=1)
+        self.dt = configuration.physics_dt
+
+    def test_dead_ball_keeps_its_pose(self) -> None:
+        match = self.match
+        previous = MatchSnapshot.capture(match, None, 0.0)
+        match.step(self.dt)
+        ball = match.balls[0]
+        died_at = ball.body.position
+        ball.health = 0
+        ball.remove_if_dead()
+
+        for _ in range(2):
+            previous = MatchSnapshot.capture(match, previous, 0.0)
+            match.step(self.dt)
+            for alpha in (0.0, 0.5, 1.0):
+                previous.apply_render_state(match.balls, alpha)
+                self.assertNotEqual((ball.render_position.x, ball.render_position.y), (0.0, 0.0))
+                self.assertAlmostEqual(ball.render_position.get_distance(died_at), 0.0, delta=ball.radius)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from typing import TYPE_CHECKING, cast
+
+from src.visuals.damage_number_effect import DamageNumberEffect
+from src.visuals.implosion_effect import ImplosionEffect
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+if TYPE_CHECKING:
+    from src.entity.ball.ball import Ball
+
+
+class VisualEffectManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = VisualEffectManager(max_effects=1)
+        self.ball = cast("Ball", object())
+
+    def test_evicted_effect_reused_at_another_priority_then_rejected(self) -> None:
+        manager = self.manager
+        damage = manager.acquire(DamageNumberEffect)
+        damage.setup(self.ball, 10, is_crit=False)
+        manager.add(damage)
+
+        implosion = manager.acquire(ImplosionEffect)
+        implosion.setup((0.0, 0.0), initial_radius=10, duration=3)
+        manager.add(implosion)
+
+        # The evicted damage number comes back as a crit, which can't evict the implosion
+        crit = manager.acquire(DamageNumberEffect)
+        self.assertIs(crit, damage)
+        crit.setup(self.ball, 10, is_crit=True)
+        manager.add(crit)
+
+        # Passes the evicted damage number's original end time
+        manager.update(1.5)
+        self.assertEqual(len(manager), 1)
+        self.assertEqual(list(manager.live[ImplosionEffect.PRIORITY].values()), [implosion])
+        manager.update(2.0)
+        self.assertEqual(len(manager), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
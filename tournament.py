@@ -0,0 +1,51 @@
+import argparse
+import dataclasses
+import json
+from pathlib import Path
+
+from main import get_ball_prototypes
+from src.configuration.configuration import Configuration
+from src.tournament.tournament import Tournament
+from src.tournament.tournament_stats import TournamentStats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play headless matches on all cores and report per-ball stats.")
+    parser.add_argument("--matches", type=int, default=1000, help="number of matches to play")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (defaults to all cores)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the first match; later ones count up")
+    parser.add_argument("--output", type=Path, default=None, help="append each match result to this JSONL file")
+    parser.add_argument(
+        "--large-arena",
+        type=int,
+        default=None,
+        metavar="BALLS",
+        help="play in the large arena with this many balls",
+    )
+    args = parser.parse_args()
+
+    configuration = Configuration.large_arena(args.large_arena) if args.large_arena else Configuration()
+    tournament = Tournament(configuration, get_ball_prototypes(configuration), workers=args.workers)
+    stats = TournamentStats()
+    progress_every = max(1, args.matches // 20)
+
+    output = args.output.open("a") if args.output else None
+    try:
+        for result in tournament.play(args.matches, args.seed):
+            stats.add(result)
+            if output:
+                output.write(json.dumps(dataclasses.asdict(result)) + "\n")
+                output.flush()
+            if stats.matches % progress_every == 0:
+                print(f"{stats.matches}/{args.matches} matches played")
+    except KeyboardInterrupt:
+        print(f"Interrupted after {stats.matches} matches")
+    finally:
+        if output:
+            output.close()
+
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()
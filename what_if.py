@@ -0,0 +1,65 @@
+import argparse
+import time
+
+from main import get_ball_prototypes
+from src.checkpoint.match_forker import MatchForker
+from src.configuration.configuration import Configuration
+from src.entity.ball.ball_spawn_config_factory import BallSpawnConfigFactory
+from src.game.headless_game import HeadlessGame
+from src.game.match import Match
+from src.game.match_result import MatchResult
+from src.tournament.tournament_stats import TournamentStats
+from src.visuals.visual_effect_manager import VisualEffectManager
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play a match to a point, then play it out many ways from there and report who wins.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed of the match")
+    parser.add_argument("--at", type=float, default=10.0, help="seconds into the match to branch at")
+    parser.add_argument("--branches", type=int, default=100, help="number of continuations to play")
+    parser.add_argument("--workers", type=int, default=None, help="branches run at once (defaults to all cores)")
+    parser.add_argument(
+        "--large-arena",
+        type=int,
+        default=None,
+        metavar="BALLS",
+        help="play in the large arena with this many balls",
+    )
+    args = parser.parse_args()
+
+    configuration = Configuration.large_arena(args.large_arena) if args.large_arena else Configuration()
+    factory = BallSpawnConfigFactory(configuration, ball_prototypes=get_ball_prototypes(configuration))
+    game = HeadlessGame(configuration, factory.make_balls)
+
+    match = Match(
+        configuration,
+        factory.make_balls,
+        VisualEffectManager(configuration.max_visual_effects),
+        seed=args.seed,
+    )
+    while match.elapsed_seconds < args.at and not match.is_finished():
+        match.step(configuration.physics_dt)
+    if match.is_finished():
+        print(f"Match {match.seed} was over after {match.elapsed_seconds:.1f}s; branch earlier")
+        return
+    alive = ", ".join(f"{ball.name} {ball.health}" for ball in match.alive_balls())
+    print(f"Match {match.seed} at {match.elapsed_seconds:.1f}s: {alive}")
+
+    def play_branch(branch_match: Match, branch: int) -> MatchResult:
+        branch_match.diverge(branch)
+        return game.finish(branch_match)
+
+    started = time.perf_counter()
+    results = MatchForker(args.workers).run(match, args.branches, play_branch)
+    print(f"Played {args.branches} branches in {time.perf_counter() - started:.1f}s")
+
+    stats = TournamentStats()
+    for result in results:
+        stats.add(result)
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()